@@ -0,0 +1,423 @@
+"""Benchmarks for the editor scripts, run against the synthetic unreal module.
+
+Installs the scripts as the `rrmcp` package the same way the server does and
+runs each scenario at several world sizes, reporting wall time, engine calls,
+peak Python memory and result size. Runs on plain CPython, no editor needed:
+
+    python server/editor/bench/run.py --sizes small,medium
+    python server/editor/bench/run.py --json bench.json
+    python server/editor/bench/run.py --baseline bench.json
+
+With --baseline the run fails when a scenario makes more engine calls than
+the baseline, or takes longer than --tolerance times its wall time.
+Peak memory is traced with tracemalloc, which slows allocation heavy code
+down; pass --no-memory for cleaner timings.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+EDITOR_DIR = os.path.dirname(BENCH_DIR)
+SCRIPTS_DIR = os.path.join(EDITOR_DIR, "scripts")
+
+# The synthetic module has to win over a real one
+sys.path.insert(0, BENCH_DIR)
+import unreal  # noqa: E402
+
+SIZES = {
+    "small": (10_000, 1_000),
+    "medium": (100_000, 10_000),
+    "large": (1_000_000, 100_000),
+}
+
+RESULT_PREFIX = "rrmcp:result:"
+RESULT_FILE_PREFIX = "rrmcp:file:"
+
+# Actors touched by the batch scenarios
+BATCH_SIZE = 1000
+
+
+def load_sources() -> Dict[str, str]:
+    return {
+        name[: -len(".py")]: open(os.path.join(SCRIPTS_DIR, name), encoding="utf-8").read()
+        for name in sorted(os.listdir(SCRIPTS_DIR))
+        if name.endswith(".py")
+    }
+
+
+def install(sources: Dict[str, str]):
+    """Run the helper installer like the server does, dropping all state."""
+    package = sys.modules.get("rrmcp")
+    if package is not None:
+        # The installer keeps the state of helpers with the same hash
+        package.HASH = None
+    template = open(os.path.join(EDITOR_DIR, "install.py"), encoding="utf-8").read()
+    helper_hash = hashlib.sha256(json.dumps(sources).encode("utf-8")).hexdigest()[:16]
+    code = template.replace("${hash}", helper_hash).replace(
+        "${sources}", json.dumps(json.dumps(sources))
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        exec(compile(code, "install.py", "exec"), {"__name__": "__main__"})
+
+
+def read_result(output: str):
+    """Return (result, size in bytes) from a script's framed output."""
+    for line in output.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            payload = line[len(RESULT_PREFIX) :]
+            return json.loads(payload), len(payload.encode("utf-8"))
+        if line.startswith(RESULT_FILE_PREFIX):
+            path = line[len(RESULT_FILE_PREFIX) :].strip()
+            with open(path, encoding="utf-8") as f:
+                payload = f.read()
+            os.remove(path)
+            return json.loads(payload), len(payload.encode("utf-8"))
+    return None, len(output.encode("utf-8"))
+
+
+class Scenario:
+    """One tool call. `args` may be a function of the previous results."""
+
+    def __init__(
+        self,
+        label: str,
+        module: str,
+        args: Any = None,
+        fresh: bool = False,
+        restore: bool = False,
+    ):
+        self.label = label
+        self.module = module
+        self.args = args or {}
+        # Reinstall first so caches start cold
+        self.fresh = fresh
+        # Put the level back first, after scenarios that change it
+        self.restore = restore
+
+    def resolve_args(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        return self.args(results) if callable(self.args) else self.args
+
+
+def batch_objects(results):
+    return {
+        "objects": [
+            {
+                "object_class": "StaticMeshActor",
+                "object_name": f"Spawned{i}",
+                "location": {"x": i * 100.0, "y": 0.0, "z": 0.0},
+            }
+            for i in range(BATCH_SIZE)
+        ]
+    }
+
+
+def batch_update(results):
+    names = unreal.level_actor_names(BATCH_SIZE, stride=3)
+    return {
+        "actor_names": names,
+        "locations": [value for i in range(len(names)) for value in (i, i, 0.0)],
+    }
+
+
+SCENARIOS = [
+    Scenario("search_assets cold", "ue_search_assets", {"search_term": "rock"}, fresh=True),
+    Scenario("search_assets warm", "ue_search_assets", {"search_term": "rock"}),
+    Scenario(
+        "search_assets page 2",
+        "ue_search_assets",
+        lambda results: {
+            "search_term": "rock",
+            "cursor": results["search_assets warm"]["next_cursor"],
+        },
+    ),
+    Scenario("search_assets class", "ue_search_assets", {"search_term": "tree", "asset_class": "StaticMesh"}),
+    Scenario("list_assets", "ue_list_assets", {"limit": 1000}),
+    Scenario("project_info cold", "ue_get_project_info", fresh=True),
+    Scenario("project_info warm", "ue_get_project_info"),
+    Scenario(
+        "asset_graph depth 3",
+        "ue_get_asset_graph",
+        lambda results: {"asset_path": unreal.asset_object_path(1), "max_depth": 3},
+        fresh=True,
+    ),
+    Scenario(
+        "asset_references",
+        "ue_get_asset_references",
+        lambda results: {"asset_path": unreal.asset_object_path(1)},
+    ),
+    Scenario("validate_assets fast", "ue_validate_assets", {"fast": True}),
+    Scenario(
+        "asset_info",
+        "ue_get_asset_info",
+        lambda results: {"asset_path": unreal.asset_object_path(1)},
+    ),
+    Scenario("asset_changes", "ue_get_asset_changes"),
+    Scenario(
+        "assets_info prefix",
+        "ue_get_assets_info",
+        {
+            "path_prefix": "/Game/",
+            "fields": ["name", "path", "class", "is_asset_loaded"],
+            "tags": ["Vertices", "Triangles"],
+            "limit": 1000,
+        },
+    ),
+    Scenario(
+        "assets_info lods",
+        "ue_get_assets_info",
+        lambda results: {
+            "asset_paths": [unreal.asset_object_path(i) for i in range(100)],
+            "fields": ["path", "class", "lods"],
+        },
+        fresh=True,
+    ),
+    Scenario("map_info", "ue_get_map_info", fresh=True),
+    Scenario(
+        "map_info all statistics",
+        "ue_get_map_info",
+        {"statistics": ["classes", "lights", "levels", "data_layers", "bounds"]},
+    ),
+    Scenario("map_info level", "ue_get_map_info", {"level": "BenchMap_Props"}),
+    Scenario("world_outliner", "ue_get_world_outliner"),
+    Scenario("world_outliner columnar", "ue_get_world_outliner", {"columnar": True, "limit": 10000}),
+    Scenario(
+        "world_outliner delta",
+        "ue_get_world_outliner",
+        lambda results: {"since_version": results["world_outliner"]["version"]},
+    ),
+    Scenario("scene_budget cold", "ue_get_scene_budget", fresh=True),
+    Scenario("scene_budget warm", "ue_get_scene_budget"),
+    Scenario(
+        "spatial_query cold",
+        "ue_spatial_query",
+        {"query": "radius", "center": {"x": 0, "y": 0, "z": 0}, "radius": 10000},
+        fresh=True,
+    ),
+    Scenario(
+        "spatial_query nearest",
+        "ue_spatial_query",
+        {"query": "nearest", "center": {"x": 0, "y": 0, "z": 0}, "count": 50},
+    ),
+    Scenario(
+        "spatial_query overlap",
+        "ue_spatial_query",
+        lambda results: {"query": "overlap", "actor_name": unreal.level_actor_names(1)[0]},
+    ),
+    Scenario("instance_actors dry run", "ue_instance_actors", {"dry_run": True}),
+    Scenario("instance_actors", "ue_instance_actors", restore=True),
+    Scenario(
+        "scatter_instances",
+        "ue_scatter_instances",
+        lambda results: {
+            "mesh_path": unreal.asset_object_path(unreal.first_static_mesh()),
+            "bounds": {"min": {"x": 0, "y": 0, "z": 0}, "max": {"x": 50000, "y": 50000, "z": 0}},
+            "count": BATCH_SIZE * 100,
+            "seed": 1,
+        },
+        restore=True,
+    ),
+    Scenario(
+        "scatter_instances snapped",
+        "ue_scatter_instances",
+        lambda results: {
+            "mesh_path": unreal.asset_object_path(unreal.first_static_mesh()),
+            "spline_actor": "SplineArea_0",
+            "count": BATCH_SIZE * 10,
+            "snap_to_surface": True,
+        },
+        restore=True,
+    ),
+    Scenario("update_objects", "ue_update_objects", batch_update, restore=True),
+    Scenario(
+        "update_object",
+        "ue_update_object",
+        lambda results: {
+            "actor_name": unreal.level_actor_names(1)[0],
+            "location": {"x": 100.0, "y": 0.0, "z": 0.0},
+        },
+        restore=True,
+    ),
+    Scenario(
+        "create_object",
+        "ue_create_object",
+        {"object_class": "StaticMeshActor", "object_name": "BenchCube"},
+        restore=True,
+    ),
+    # The label is set after the spawn, the lookup must still find it
+    Scenario(
+        "update_object by new label",
+        "ue_update_object",
+        {"actor_name": "BenchCube", "location": {"x": 100.0, "y": 0.0, "z": 0.0}},
+    ),
+    Scenario("create_objects", "ue_create_objects", batch_objects, restore=True),
+    Scenario(
+        "delete_multiple_objects",
+        "ue_delete_object",
+        lambda results: {"actor_names": str(unreal.level_actor_names(BATCH_SIZE, stride=7))},
+        restore=True,
+    ),
+    Scenario(
+        "delete_multiple_objects cold",
+        "ue_delete_object",
+        lambda results: {"actor_names": str(unreal.level_actor_names(BATCH_SIZE, stride=11))},
+        fresh=True,
+        restore=True,
+    ),
+]
+
+
+def run_scenario(
+    scenario: Scenario,
+    sources: Dict[str, str],
+    results: Dict[str, Any],
+    trace_memory: bool,
+) -> Dict[str, Any]:
+    if scenario.restore:
+        unreal.restore_world()
+    if scenario.fresh:
+        install(sources)
+
+    args = json.dumps(scenario.resolve_args(results))
+    package = sys.modules["rrmcp"]
+    calls_before = unreal.total_calls()
+    counts_before = dict(unreal.CALLS)
+    output = io.StringIO()
+
+    if trace_memory:
+        tracemalloc.reset_peak()
+        traced_before = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        package.run(scenario.module, args)
+    wall = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1] - traced_before if trace_memory else None
+
+    result, size = read_result(output.getvalue())
+    results[scenario.label] = result
+
+    call_deltas = {
+        name: count - counts_before.get(name, 0)
+        for name, count in unreal.CALLS.items()
+        if count != counts_before.get(name, 0)
+    }
+    top_call = max(call_deltas.items(), key=lambda item: item[1], default=("-", 0))
+    return {
+        "scenario": scenario.label,
+        "wall_ms": round(wall * 1000, 2),
+        "engine_calls": unreal.total_calls() - calls_before,
+        "top_call": f"{top_call[0]} x{top_call[1]}",
+        "peak_mb": round(peak / 1e6, 2) if peak is not None else None,
+        "output_kb": round(size / 1024, 1),
+        "error": result.get("error") if isinstance(result, dict) else None,
+    }
+
+
+def run_size(size: str, trace_memory: bool, only: Optional[List[str]]) -> List[Dict[str, Any]]:
+    assets, actors = SIZES[size]
+    print(f"\n== {size}: {assets:,} assets, {actors:,} actors", flush=True)
+    started = time.perf_counter()
+    unreal.build_world(assets, actors)
+    print(f"   world built in {time.perf_counter() - started:.1f}s", flush=True)
+
+    sources = load_sources()
+    install(sources)
+    results: Dict[str, Any] = {}
+    rows = []
+    for scenario in SCENARIOS:
+        if only and not any(name in scenario.label for name in only):
+            continue
+        row = run_scenario(scenario, sources, results, trace_memory)
+        row["size"] = size
+        rows.append(row)
+        print_row(row)
+    return rows
+
+
+COLUMNS = [
+    ("scenario", 30),
+    ("wall_ms", 11),
+    ("engine_calls", 13),
+    ("peak_mb", 9),
+    ("output_kb", 10),
+    ("top_call", 0),
+]
+
+
+def print_row(row: Dict[str, Any]):
+    cells = []
+    for name, width in COLUMNS:
+        value = row.get(name)
+        text = "-" if value is None else str(value)
+        cells.append(text.ljust(width) if name in ("scenario", "top_call") else text.rjust(width))
+    line = "   " + " ".join(cells)
+    if row.get("error"):
+        line += f"  ERROR: {row['error']}"
+    print(line, flush=True)
+
+
+def compare(rows: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float) -> List[str]:
+    before = {(row["size"], row["scenario"]): row for row in baseline}
+    regressions = []
+    for row in rows:
+        old = before.get((row["size"], row["scenario"]))
+        if old is None:
+            continue
+        key = f"{row['size']} / {row['scenario']}"
+        if row["engine_calls"] > old["engine_calls"]:
+            regressions.append(f"{key}: engine calls {old['engine_calls']} -> {row['engine_calls']}")
+        if row["wall_ms"] > old["wall_ms"] * tolerance:
+            regressions.append(f"{key}: wall {old['wall_ms']}ms -> {row['wall_ms']}ms")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="small,medium", help=f"Comma separated, from {', '.join(SIZES)}")
+    parser.add_argument("--only", help="Comma separated substrings of the scenarios to run")
+    parser.add_argument("--json", help="Write the rows to this file")
+    parser.add_argument("--baseline", help="Rows of an earlier --json run to compare against")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="Allowed wall time ratio against the baseline")
+    parser.add_argument("--no-memory", action="store_true", help="Don't trace peak memory")
+    parser.add_argument("--call-cost-us", type=float, help="Simulated cost of one engine call in microseconds")
+    options = parser.parse_args(argv)
+
+    if options.call_cost_us is not None:
+        unreal.COSTS.call = options.call_cost_us / 1e6
+
+    trace_memory = not options.no_memory
+    if trace_memory:
+        tracemalloc.start()
+
+    only = options.only.split(",") if options.only else None
+    rows = []
+    for size in options.sizes.split(","):
+        rows.extend(run_size(size.strip(), trace_memory, only))
+
+    if options.json:
+        with open(options.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+
+    if options.baseline:
+        with open(options.baseline, encoding="utf-8") as f:
+            regressions = compare(rows, json.load(f), options.tolerance)
+        if regressions:
+            print("\nRegressions against the baseline:")
+            for regression in regressions:
+                print(f"   {regression}")
+            return 1
+        print("\nNo regressions against the baseline")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
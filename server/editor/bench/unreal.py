@@ -0,0 +1,1196 @@
+"""Synthetic stand-in for the editor's `unreal` module, used by the benchmarks.
+
+Only the API surface the editor scripts touch is modelled. Every call into
+the "engine" (methods and reflected property reads alike) is counted in
+CALLS and charged a simulated cost from COSTS by spinning, so timings track
+how often a script crosses into the engine and how much data it pulls out.
+
+`build_world(assets, actors)` fills the asset registry and the editor level,
+`restore_world()` puts the level back to that state between benchmarks.
+"""
+
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
+import itertools
+import math
+import os
+import random
+import tempfile
+import time
+
+CALLS: Counter = Counter()
+
+
+class Costs:
+    # Fixed cost of one Python to engine call
+    call = 1e-6
+    # Extra cost per object a bulk call returns (wrapping it for Python)
+    item = 0.25e-6
+    # Loading an asset from disk
+    load = 200e-6
+    # Reading a mesh's render data
+    render_data = 20e-6
+
+
+COSTS = Costs()
+
+
+def _charge(name: str, items: int = 0, extra: float = 0.0):
+    CALLS[name] += 1
+    cost = COSTS.call + items * COSTS.item + extra
+    if cost > 0:
+        deadline = time.perf_counter() + cost
+        while time.perf_counter() < deadline:
+            pass
+
+
+def total_calls() -> int:
+    return sum(CALLS.values())
+
+
+# Core types
+
+
+class Name(str):
+    """Engine names convert to str like the real unreal.Name."""
+
+
+class Vector:
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x, self.y, self.z = x, y, z
+
+    def __repr__(self):
+        return f"Vector({self.x}, {self.y}, {self.z})"
+
+
+class Rotator:
+    __slots__ = ("roll", "pitch", "yaw")
+
+    def __init__(self, roll=0.0, pitch=0.0, yaw=0.0):
+        self.roll, self.pitch, self.yaw = roll, pitch, yaw
+
+
+class Quat:
+    __slots__ = ("_rotator",)
+
+    def __init__(self, rotator: Rotator):
+        self._rotator = rotator
+
+    def rotator(self) -> Rotator:
+        _charge("Quat.rotator")
+        return Rotator(self._rotator.roll, self._rotator.pitch, self._rotator.yaw)
+
+
+class Transform:
+    def __init__(self, location=None, rotation=None, scale=None):
+        self.translation = location or Vector()
+        self.rotation = Quat(rotation or Rotator())
+        self.scale3d = scale or Vector(1.0, 1.0, 1.0)
+
+
+class _Delegate:
+    def __init__(self):
+        self._callables: List[Callable] = []
+
+    def add_callable(self, fn: Callable):
+        self._callables.append(fn)
+
+    def remove_callable(self, fn: Callable):
+        self._callables.remove(fn)
+
+    def broadcast(self, *args):
+        for fn in list(self._callables):
+            fn(*args)
+
+
+class Class:
+    _classes: Dict[str, "Class"] = {}
+
+    def __init__(self, name: str):
+        self._name = name
+
+    @classmethod
+    def named(cls, name: str) -> "Class":
+        found = cls._classes.get(name)
+        if found is None:
+            found = cls._classes[name] = Class(name)
+        return found
+
+    def get_name(self) -> str:
+        _charge("Class.get_name")
+        return self._name
+
+    def get_path_name(self) -> str:
+        _charge("Class.get_path_name")
+        return f"/Script/Engine.{self._name}"
+
+
+class Object:
+    def get_class(self) -> Class:
+        _charge("Object.get_class")
+        return Class.named(type(self).__name__)
+
+
+# Assets
+
+
+class TopLevelAssetPath:
+    __slots__ = ("_package_name", "_asset_name")
+
+    def __init__(self, package_name: str, asset_name: str):
+        self._package_name = Name(package_name)
+        self._asset_name = Name(asset_name)
+
+    @property
+    def package_name(self):
+        _charge("TopLevelAssetPath.package_name")
+        return self._package_name
+
+    @property
+    def asset_name(self):
+        _charge("TopLevelAssetPath.asset_name")
+        return self._asset_name
+
+
+_CLASS_PATHS: Dict[str, TopLevelAssetPath] = {}
+
+
+def _class_path(class_name: str) -> TopLevelAssetPath:
+    found = _CLASS_PATHS.get(class_name)
+    if found is None:
+        found = _CLASS_PATHS[class_name] = TopLevelAssetPath(
+            "/Script/Engine", class_name
+        )
+    return found
+
+
+class Package(Object):
+    def __init__(self, name: str):
+        self._name = name
+
+    def get_name(self) -> str:
+        _charge("Package.get_name")
+        return self._name
+
+    def get_path_name(self) -> str:
+        _charge("Package.get_path_name")
+        return self._name
+
+
+class _LoadedAsset(Object):
+    def __init__(self, data: "AssetData"):
+        self._data = data
+
+    def get_name(self) -> str:
+        _charge("Object.get_name")
+        return self._data._name
+
+    def get_path_name(self) -> str:
+        _charge("Object.get_path_name")
+        return f"{self._data._package_name()}.{self._data._name}"
+
+    def get_package(self) -> Package:
+        _charge("Object.get_package")
+        return Package(self._data._package_name())
+
+    def get_class(self) -> Class:
+        _charge("Object.get_class")
+        return Class.named(self._data._class)
+
+    # Like the editor's wrappers, two loads of an asset compare equal
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _LoadedAsset) and other._data is self._data
+
+    def __hash__(self) -> int:
+        return id(self._data)
+
+
+class StaticMesh(_LoadedAsset):
+    def _seed(self) -> int:
+        return sum(self._data._name.encode("utf-8"))
+
+    def get_num_lods(self) -> int:
+        _charge("StaticMesh.get_num_lods")
+        return 3
+
+    def get_num_vertices(self, lod_index: int) -> int:
+        _charge("StaticMesh.get_num_vertices", extra=COSTS.render_data)
+        return (self._seed() * 97 % 40000 + 200) >> lod_index
+
+    def get_num_triangles(self, lod_index: int) -> int:
+        _charge("StaticMesh.get_num_triangles", extra=COSTS.render_data)
+        return (self._seed() * 131 % 60000 + 100) >> lod_index
+
+    def get_num_sections(self, lod_index: int) -> int:
+        _charge("StaticMesh.get_num_sections")
+        return 1 + self._seed() % 4
+
+    def get_editor_property(self, name: str):
+        _charge("StaticMesh.get_editor_property")
+        if name == "static_materials":
+            return [object()] * (1 + self._seed() % 4)
+        raise Exception(f"Failed to find property '{name}' for attribute '{name}'")
+
+
+class SkeletalMesh(_LoadedAsset):
+    pass
+
+
+class AssetData:
+    __slots__ = ("_name", "_path", "_class")
+
+    def __init__(self, name: str, path: str, class_name: str):
+        self._name = name
+        self._path = path
+        self._class = class_name
+
+    def _package_name(self) -> str:
+        return f"{self._path}/{self._name}"
+
+    @property
+    def asset_name(self):
+        _charge("AssetData.asset_name")
+        return Name(self._name)
+
+    @property
+    def package_path(self):
+        _charge("AssetData.package_path")
+        return Name(self._path)
+
+    @property
+    def package_name(self):
+        _charge("AssetData.package_name")
+        return Name(self._package_name())
+
+    @property
+    def asset_class_path(self):
+        _charge("AssetData.asset_class_path")
+        return _class_path(self._class)
+
+    def is_valid(self) -> bool:
+        _charge("AssetData.is_valid")
+        return bool(self._name)
+
+    def is_u_asset(self) -> bool:
+        _charge("AssetData.is_u_asset")
+        return True
+
+    def is_asset_loaded(self) -> bool:
+        _charge("AssetData.is_asset_loaded")
+        return False
+
+    def get_tag_value(self, tag: str) -> Optional[str]:
+        _charge("AssetData.get_tag_value")
+        if tag == "AssetFileSize":
+            return "1024"
+        if tag in ("Vertices", "Triangles") and self._class == "StaticMesh":
+            # Meshes named after the same word look alike
+            word = self._name.split("_")[1]
+            return str(sum(map(ord, word)) * (3 if tag == "Vertices" else 2))
+        return None
+
+    def get_asset(self):
+        _charge("AssetData.get_asset", extra=COSTS.load)
+        return _load(self)
+
+
+_INVALID_ASSET = AssetData("", "", "")
+
+
+def _load(data: AssetData):
+    if data._class == "StaticMesh":
+        return StaticMesh(data)
+    if data._class == "SkeletalMesh":
+        return SkeletalMesh(data)
+    return _LoadedAsset(data)
+
+
+class AssetRegistryDependencyOptions:
+    def __init__(self):
+        self.include_hard_package_references = True
+        self.include_soft_package_references = True
+        self.include_searchable_names = False
+        self.include_hard_management_references = True
+        self.include_soft_management_references = True
+
+
+# Packages each package depends on, stable for a given world size
+DEPENDENCIES_PER_PACKAGE = 3
+# Prime, so the dependency mapping can be inverted for any package count
+# that isn't a multiple of it
+DEPENDENCY_MULTIPLIER = 7919
+DEPENDENCY_OFFSET = 104729
+
+
+class AssetRegistry:
+    def __init__(self):
+        self.reset([])
+        self.on_asset_added = _Delegate()
+        self.on_asset_removed = _Delegate()
+        self.on_asset_renamed = _Delegate()
+        self.on_asset_updated = _Delegate()
+        self.on_asset_updated_on_disk = _Delegate()
+        # Set to pretend the initial scan is still running
+        self.loading = False
+
+    def reset(self, assets: List[AssetData]):
+        # Lookups are prepared up front so benchmarks only time the scripts
+        self.assets = assets
+        self.by_package: Dict[str, List[AssetData]] = {}
+        for asset in assets:
+            self.by_package.setdefault(asset._package_name(), []).append(asset)
+        self.package_names = list(self.by_package)
+        self.package_index = {name: index for index, name in enumerate(self.package_names)}
+
+    # Package i depends on (i * MULTIPLIER + step * OFFSET) % count for each
+    # step, which can be inverted to find referencers without storing edges
+
+    def _dependency_indices(self, index: int) -> List[int]:
+        count = len(self.package_names)
+        targets = (
+            (index * DEPENDENCY_MULTIPLIER + step * DEPENDENCY_OFFSET) % count
+            for step in range(1, DEPENDENCIES_PER_PACKAGE + 1)
+        )
+        # Every tenth package is never referenced
+        return [target for target in targets if target != index and target % 10 != 9]
+
+    def _referencer_indices(self, index: int) -> List[int]:
+        count = len(self.package_names)
+        if index % 10 == 9:
+            return []
+        inverse = pow(DEPENDENCY_MULTIPLIER, -1, count) if count > 1 else 0
+        sources = (
+            (index - step * DEPENDENCY_OFFSET) * inverse % count
+            for step in range(1, DEPENDENCIES_PER_PACKAGE + 1)
+        )
+        return [source for source in sources if source != index]
+
+    def is_loading_assets(self) -> bool:
+        _charge("AssetRegistry.is_loading_assets")
+        return self.loading
+
+    def get_all_assets(self, include_only_on_disk_assets=False) -> List[AssetData]:
+        _charge("AssetRegistry.get_all_assets", items=len(self.assets))
+        return list(self.assets)
+
+    def get_assets_by_package_name(self, package_name, include_only_on_disk_assets=False):
+        found = self.by_package.get(str(package_name), [])
+        _charge("AssetRegistry.get_assets_by_package_name", items=len(found))
+        return list(found)
+
+    def get_asset_by_object_path(self, object_path, include_only_on_disk_assets=False):
+        _charge("AssetRegistry.get_asset_by_object_path")
+        found = self.by_package.get(str(object_path).split(".", 1)[0])
+        return found[0] if found else _INVALID_ASSET
+
+    def _edges(self, call: str, package_name, step) -> Optional[List[Name]]:
+        index = self.package_index.get(str(package_name))
+        if index is None:
+            _charge(call)
+            return None
+        found = [Name(self.package_names[i]) for i in step(index)]
+        _charge(call, items=len(found))
+        return found
+
+    def get_dependencies(self, package_name, dependency_options=None):
+        return self._edges(
+            "AssetRegistry.get_dependencies", package_name, self._dependency_indices
+        )
+
+    def get_referencers(self, package_name, dependency_options=None):
+        return self._edges(
+            "AssetRegistry.get_referencers", package_name, self._referencer_indices
+        )
+
+
+_registry = AssetRegistry()
+
+
+class AssetRegistryHelpers:
+    @staticmethod
+    def get_asset_registry() -> AssetRegistry:
+        _charge("AssetRegistryHelpers.get_asset_registry")
+        return _registry
+
+
+class EditorAssetLibrary:
+    @staticmethod
+    def _find(asset_path: str) -> Optional[AssetData]:
+        found = _registry.by_package.get(str(asset_path).split(".", 1)[0])
+        return found[0] if found else None
+
+    @staticmethod
+    def does_asset_exist(asset_path: str) -> bool:
+        _charge("EditorAssetLibrary.does_asset_exist")
+        return EditorAssetLibrary._find(asset_path) is not None
+
+    @staticmethod
+    def find_asset_data(asset_path: str) -> AssetData:
+        _charge("EditorAssetLibrary.find_asset_data")
+        return EditorAssetLibrary._find(asset_path) or _INVALID_ASSET
+
+    @staticmethod
+    def load_asset(asset_path: str):
+        _charge("EditorAssetLibrary.load_asset", extra=COSTS.load)
+        data = EditorAssetLibrary._find(asset_path)
+        if data is None and str(asset_path).startswith("/Engine/"):
+            # Engine content such as the basic shapes is always there
+            name = str(asset_path).rsplit("/", 1)[-1].split(".", 1)[0]
+            data = AssetData(name, str(asset_path).rsplit("/", 1)[0], "StaticMesh")
+        return _load(data) if data is not None else None
+
+    @staticmethod
+    def load_blueprint_class(asset_path: str):
+        _charge("EditorAssetLibrary.load_blueprint_class", extra=COSTS.load)
+        return None
+
+
+# Actors and components
+
+
+class ActorComponent(Object):
+    def __init__(self, owner=None):
+        self._owner = owner
+
+
+class SceneComponent(ActorComponent):
+    pass
+
+
+class MeshComponent(SceneComponent):
+    pass
+
+
+class StaticMeshComponent(MeshComponent):
+    _mesh = None
+    _materials: tuple = ()
+
+    @property
+    def static_mesh(self):
+        _charge("StaticMeshComponent.static_mesh")
+        return self._mesh
+
+    def set_static_mesh(self, mesh) -> bool:
+        _charge("StaticMeshComponent.set_static_mesh")
+        self._mesh = mesh
+        return True
+
+    def get_static_mesh(self):
+        _charge("StaticMeshComponent.get_static_mesh")
+        return self._mesh
+
+    def set_material(self, element_index, material):
+        _charge("StaticMeshComponent.set_material")
+        materials = list(self._materials)
+        materials.extend([None] * (element_index + 1 - len(materials)))
+        materials[element_index] = material
+        self._materials = tuple(materials)
+
+    def get_materials(self) -> list:
+        _charge("StaticMeshComponent.get_materials")
+        return list(self._materials)
+
+
+class InstancedStaticMeshComponent(StaticMeshComponent):
+    def __init__(self, owner=None):
+        super().__init__(owner)
+        self._instances: List[Transform] = []
+
+    def get_instance_count(self) -> int:
+        _charge("InstancedStaticMeshComponent.get_instance_count")
+        return len(self._instances)
+
+    def add_instance(self, instance_transform, world_space=False) -> int:
+        _charge("InstancedStaticMeshComponent.add_instance")
+        self._instances.append(instance_transform)
+        return len(self._instances) - 1
+
+    def add_instances(self, instance_transforms, should_return_indices, world_space=False):
+        _charge("InstancedStaticMeshComponent.add_instances", items=len(instance_transforms))
+        start = len(self._instances)
+        self._instances.extend(instance_transforms)
+        return list(range(start, len(self._instances))) if should_return_indices else []
+
+
+class HierarchicalInstancedStaticMeshComponent(InstancedStaticMeshComponent):
+    pass
+
+
+class SkinnedMeshComponent(MeshComponent):
+    skeletal_mesh_asset = None
+
+
+class SkeletalMeshComponent(SkinnedMeshComponent):
+    pass
+
+
+class SplineCoordinateSpace:
+    LOCAL = 0
+    WORLD = 1
+
+
+class SplineComponent(SceneComponent):
+    """A closed circle of the given radius around the owner."""
+
+    def __init__(self, owner=None, radius: float = 5000.0):
+        super().__init__(owner)
+        self._radius = radius
+
+    def get_spline_length(self) -> float:
+        _charge("SplineComponent.get_spline_length")
+        return 2.0 * math.pi * self._radius
+
+    def get_location_at_distance_along_spline(self, distance, coordinate_space):
+        _charge("SplineComponent.get_location_at_distance_along_spline")
+        angle = distance / self._radius
+        origin = self._owner._location if self._owner else Vector()
+        return Vector(
+            origin.x + self._radius * math.cos(angle),
+            origin.y + self._radius * math.sin(angle),
+            origin.z,
+        )
+
+
+class LightComponent(SceneComponent):
+    pass
+
+
+class Actor(Object):
+    _serial = itertools.count()
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        label: Optional[str] = None,
+        folder: str = "",
+        location: Optional[Vector] = None,
+        rotation: Optional[Rotator] = None,
+    ):
+        self._name = name or f"{type(self).__name__}_{next(Actor._serial)}"
+        self._label = label or self._name
+        self._folder = folder
+        self._location = location or Vector()
+        self._rotation = rotation or Rotator()
+        self._scale = Vector(1.0, 1.0, 1.0)
+        self._hidden = False
+        self._level = _persistent_level
+        self._data_layers: List["DataLayerAsset"] = []
+        self._components = self._make_components()
+
+    def _make_components(self) -> List[ActorComponent]:
+        return [SceneComponent(self)]
+
+    def get_name(self) -> str:
+        _charge("Actor.get_name")
+        return self._name
+
+    def get_actor_label(self) -> str:
+        _charge("Actor.get_actor_label")
+        return self._label
+
+    def set_actor_label(self, label: str, mark_dirty=True):
+        _charge("Actor.set_actor_label")
+        self._label = label
+
+    def get_level(self) -> "Level":
+        _charge("Actor.get_level")
+        return self._level
+
+    def get_editor_property(self, name: str):
+        _charge("Actor.get_editor_property")
+        if name == "data_layer_assets":
+            return list(self._data_layers)
+        raise Exception(f"Failed to find property '{name}' for attribute '{name}'")
+
+    def set_folder_path(self, new_folder_path):
+        _charge("Actor.set_folder_path")
+        self._folder = str(new_folder_path)
+
+    def get_folder_path(self) -> Name:
+        _charge("Actor.get_folder_path")
+        return Name(self._folder or "None")
+
+    def is_hidden_ed(self) -> bool:
+        _charge("Actor.is_hidden_ed")
+        return self._hidden
+
+    def get_actor_location(self) -> Vector:
+        _charge("Actor.get_actor_location")
+        return Vector(self._location.x, self._location.y, self._location.z)
+
+    def get_actor_rotation(self) -> Rotator:
+        _charge("Actor.get_actor_rotation")
+        rotation = self._rotation
+        return Rotator(rotation.roll, rotation.pitch, rotation.yaw)
+
+    def get_actor_scale3d(self) -> Vector:
+        _charge("Actor.get_actor_scale3d")
+        return Vector(self._scale.x, self._scale.y, self._scale.z)
+
+    def get_actor_transform(self) -> Transform:
+        _charge("Actor.get_actor_transform")
+        rotation = self._rotation
+        return Transform(
+            Vector(self._location.x, self._location.y, self._location.z),
+            Rotator(rotation.roll, rotation.pitch, rotation.yaw),
+            Vector(self._scale.x, self._scale.y, self._scale.z),
+        )
+
+    def get_actor_bounds(self, only_colliding_components: bool, include_from_child_actors=False):
+        _charge("Actor.get_actor_bounds")
+        extent = 50.0 * max(self._scale.x, self._scale.y, self._scale.z)
+        return (
+            Vector(self._location.x, self._location.y, self._location.z),
+            Vector(extent, extent, extent),
+        )
+
+    def _moved(self):
+        _editor_actor_subsystem().on_actor_moved.broadcast(self)
+
+    def set_actor_location(self, new_location: Vector, sweep=False, teleport=False):
+        _charge("Actor.set_actor_location")
+        self._location = Vector(new_location.x, new_location.y, new_location.z)
+        self._moved()
+
+    def set_actor_rotation(self, new_rotation: Rotator, teleport_physics=False):
+        _charge("Actor.set_actor_rotation")
+        self._rotation = Rotator(new_rotation.roll, new_rotation.pitch, new_rotation.yaw)
+        self._moved()
+
+    def set_actor_scale3d(self, new_scale3d: Vector):
+        _charge("Actor.set_actor_scale3d")
+        self._scale = Vector(new_scale3d.x, new_scale3d.y, new_scale3d.z)
+        self._moved()
+
+    def set_actor_transform(self, new_transform: Transform, sweep=False, teleport=False):
+        _charge("Actor.set_actor_transform")
+        location = new_transform.translation
+        rotation = new_transform.rotation._rotator
+        scale = new_transform.scale3d
+        self._location = Vector(location.x, location.y, location.z)
+        self._rotation = Rotator(rotation.roll, rotation.pitch, rotation.yaw)
+        self._scale = Vector(scale.x, scale.y, scale.z)
+        self._moved()
+
+    def get_components_by_class(self, component_class) -> List[ActorComponent]:
+        _charge("Actor.get_components_by_class")
+        return [c for c in self._components if isinstance(c, component_class)]
+
+    def get_component_by_class(self, component_class) -> Optional[ActorComponent]:
+        _charge("Actor.get_component_by_class")
+        for component in self._components:
+            if isinstance(component, component_class):
+                return component
+        return None
+
+
+class StaticMeshActor(Actor):
+    def _make_components(self):
+        return [StaticMeshComponent(self)]
+
+
+class SkeletalMeshActor(Actor):
+    pass
+
+
+class SplineArea(Actor):
+    """Stands in for a Blueprint actor outlining an area with a spline."""
+
+    def _make_components(self):
+        return [SplineComponent(self)]
+
+
+class Light(Actor):
+    def _make_components(self):
+        return [LightComponent(self)]
+
+
+class DirectionalLight(Light):
+    pass
+
+
+class PointLight(Light):
+    pass
+
+
+class SpotLight(Light):
+    pass
+
+
+class CameraActor(Actor):
+    pass
+
+
+class Pawn(Actor):
+    pass
+
+
+class Character(Pawn):
+    pass
+
+
+class PlayerStart(Actor):
+    pass
+
+
+class LightmassImportanceVolume(Actor):
+    pass
+
+
+class LevelStreamingDynamic(Object):
+    pass
+
+
+_NATIVE_CLASSES = {
+    cls.__name__: cls
+    for cls in (
+        Actor,
+        StaticMeshActor,
+        SkeletalMeshActor,
+        DirectionalLight,
+        PointLight,
+        SpotLight,
+        CameraActor,
+        Pawn,
+        Character,
+        PlayerStart,
+        LightmassImportanceVolume,
+    )
+}
+
+
+def load_class(outer, name: str):
+    _charge("load_class")
+    return _NATIVE_CLASSES.get(str(name).rsplit(".", 1)[-1])
+
+
+def find_class(name: str):
+    _charge("find_class")
+    return _NATIVE_CLASSES.get(str(name))
+
+
+# Editor
+
+
+class World(Object):
+    def __init__(self, name: str = "BenchMap"):
+        self._name = name
+
+    def get_name(self) -> str:
+        _charge("World.get_name")
+        return self._name
+
+    def get_path_name(self) -> str:
+        _charge("World.get_path_name")
+        return f"/Game/Maps/{self._name}.{self._name}"
+
+
+class Level(Object):
+    def __init__(self, world: World):
+        self._world = world
+
+    def get_outer(self) -> World:
+        _charge("Level.get_outer")
+        return self._world
+
+
+class DataLayerAsset(Object):
+    def __init__(self, name: str):
+        self._name = name
+
+    def get_name(self) -> str:
+        _charge("DataLayerAsset.get_name")
+        return self._name
+
+
+_world = World()
+_persistent_level = Level(_world)
+_levels = [_persistent_level] + [
+    Level(World(f"BenchMap_{part}")) for part in ("Props", "Lighting", "Gameplay")
+]
+_data_layers = [DataLayerAsset(name) for name in ("DL_Static", "DL_Dynamic", "DL_Audio")]
+_actors: List[Actor] = []
+_baseline: List[Actor] = []
+_camera = [Vector(), Rotator()]
+
+
+class UnrealEditorSubsystem:
+    def get_editor_world(self) -> World:
+        _charge("UnrealEditorSubsystem.get_editor_world")
+        return _world
+
+
+class EditorActorSubsystem:
+    def __init__(self):
+        self.on_level_actor_added = _Delegate()
+        self.on_level_actor_deleted = _Delegate()
+        self.on_actor_moved = _Delegate()
+
+    def get_all_level_actors(self) -> List[Actor]:
+        _charge("EditorActorSubsystem.get_all_level_actors", items=len(_actors))
+        return list(_actors)
+
+    def get_selected_level_actors(self) -> List[Actor]:
+        _charge("EditorActorSubsystem.get_selected_level_actors")
+        return []
+
+    def destroy_actors(self, actors_to_destroy: List[Actor]) -> bool:
+        _charge("EditorActorSubsystem.destroy_actors", items=len(actors_to_destroy))
+        doomed = {id(actor) for actor in actors_to_destroy}
+        _actors[:] = [actor for actor in _actors if id(actor) not in doomed]
+        for actor in actors_to_destroy:
+            self.on_level_actor_deleted.broadcast(actor)
+        return True
+
+    def destroy_actor(self, actor_to_destroy: Actor) -> bool:
+        return self.destroy_actors([actor_to_destroy])
+
+    def spawn_actor_from_class(self, actor_class, location=None, rotation=None, transient=False):
+        _charge("EditorActorSubsystem.spawn_actor_from_class")
+        return _spawn(actor_class, location, rotation)
+
+
+class LevelEditorSubsystem:
+    def get_current_level(self) -> Level:
+        _charge("LevelEditorSubsystem.get_current_level")
+        return _persistent_level
+
+
+class AddNewSubobjectParams:
+    def __init__(self, parent_handle=None, new_class=None, blueprint_context=None):
+        self.parent_handle = parent_handle
+        self.new_class = new_class
+
+
+class SubobjectDataSubsystem:
+    def k2_gather_subobject_data_for_instance(self, context) -> list:
+        _charge("SubobjectDataSubsystem.k2_gather_subobject_data_for_instance")
+        return [context]
+
+    def add_new_subobject(self, params: AddNewSubobjectParams):
+        _charge("SubobjectDataSubsystem.add_new_subobject")
+        actor = params.parent_handle
+        component = params.new_class(actor)
+        actor._components.append(component)
+        return component, ""
+
+
+class SubobjectDataBlueprintFunctionLibrary:
+    @staticmethod
+    def get_data(data_handle):
+        _charge("SubobjectDataBlueprintFunctionLibrary.get_data")
+        return data_handle
+
+    @staticmethod
+    def get_object(data):
+        _charge("SubobjectDataBlueprintFunctionLibrary.get_object")
+        return data
+
+
+class SkeletalMeshEditorSubsystem:
+    def get_lod_count(self, mesh) -> int:
+        _charge("SkeletalMeshEditorSubsystem.get_lod_count")
+        return 2
+
+    def get_lod_info(self, mesh, lod_index):
+        _charge("SkeletalMeshEditorSubsystem.get_lod_info")
+        return None
+
+
+_subsystems: Dict[type, Any] = {}
+
+
+def get_editor_subsystem(subsystem_class):
+    _charge("get_editor_subsystem")
+    found = _subsystems.get(subsystem_class)
+    if found is None:
+        found = _subsystems[subsystem_class] = subsystem_class()
+    return found
+
+
+def get_engine_subsystem(subsystem_class):
+    _charge("get_engine_subsystem")
+    found = _subsystems.get(subsystem_class)
+    if found is None:
+        found = _subsystems[subsystem_class] = subsystem_class()
+    return found
+
+
+def _editor_actor_subsystem() -> EditorActorSubsystem:
+    found = _subsystems.get(EditorActorSubsystem)
+    if found is None:
+        found = _subsystems[EditorActorSubsystem] = EditorActorSubsystem()
+    return found
+
+
+def _spawn(actor_class, location=None, rotation=None) -> Actor:
+    actor = actor_class(location=location, rotation=rotation)
+    _actors.append(actor)
+    _editor_actor_subsystem().on_level_actor_added.broadcast(actor)
+    return actor
+
+
+class EditorLevelLibrary:
+    @staticmethod
+    def spawn_actor_from_class(actor_class, location=None, rotation=None, transient=False):
+        _charge("EditorLevelLibrary.spawn_actor_from_class")
+        return _spawn(actor_class, location, rotation)
+
+    @staticmethod
+    def get_all_level_actors():
+        _charge("EditorLevelLibrary.get_all_level_actors", items=len(_actors))
+        return list(_actors)
+
+    @staticmethod
+    def get_all_level_actors_of_class(actor_class):
+        _charge("EditorLevelLibrary.get_all_level_actors_of_class", items=len(_actors))
+        if not isinstance(actor_class, type) or not issubclass(actor_class, Actor):
+            return []
+        return [actor for actor in _actors if isinstance(actor, actor_class)]
+
+    @staticmethod
+    def get_level_viewport_camera_info():
+        _charge("EditorLevelLibrary.get_level_viewport_camera_info")
+        return _camera[0], _camera[1]
+
+    @staticmethod
+    def set_level_viewport_camera_info(camera_location, camera_rotation):
+        _charge("EditorLevelLibrary.set_level_viewport_camera_info")
+        _camera[0], _camera[1] = camera_location, camera_rotation
+
+
+class ScopedEditorTransaction:
+    def __init__(self, description: str):
+        _charge("ScopedEditorTransaction")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_tick_callbacks: Dict[int, Callable] = {}
+_tick_handles = itertools.count(1)
+
+
+def register_slate_post_tick_callback(callable_object: Callable) -> int:
+    handle = next(_tick_handles)
+    _tick_callbacks[handle] = callable_object
+    return handle
+
+
+def unregister_slate_post_tick_callback(handle: int):
+    _tick_callbacks.pop(handle, None)
+
+
+def tick(delta_seconds: float = 1 / 60):
+    """Run the post tick callbacks once, like one editor frame."""
+    for callback in list(_tick_callbacks.values()):
+        callback(delta_seconds)
+
+
+def log(message):
+    pass
+
+
+def log_warning(message):
+    pass
+
+
+def log_error(message):
+    pass
+
+
+# Project
+
+_project_dir = tempfile.mkdtemp(prefix="rrmcp-bench-")
+
+
+class Paths:
+    @staticmethod
+    def project_dir() -> str:
+        return _project_dir + "/"
+
+    @staticmethod
+    def project_content_dir() -> str:
+        return os.path.join(_project_dir, "Content") + "/"
+
+    @staticmethod
+    def project_saved_dir() -> str:
+        return os.path.join(_project_dir, "Saved") + "/"
+
+    @staticmethod
+    def project_config_dir() -> str:
+        return os.path.join(_project_dir, "Config") + "/"
+
+    @staticmethod
+    def get_project_file_path() -> str:
+        return os.path.join(_project_dir, "Bench.uproject")
+
+
+class TraceTypeQuery:
+    TRACE_TYPE_QUERY1 = 0
+
+
+class DrawDebugTrace:
+    NONE = 0
+
+
+class HitResult:
+    def __init__(self, impact_point: Vector):
+        self._impact_point = impact_point
+
+    def to_tuple(self) -> tuple:
+        # blocking_hit, initial_overlap, time, distance, location, impact_point, ...
+        return (True, False, 0.0, 0.0, self._impact_point, self._impact_point)
+
+
+class SystemLibrary:
+    @staticmethod
+    def get_engine_version() -> str:
+        _charge("SystemLibrary.get_engine_version")
+        return "5.4.0-bench"
+
+    @staticmethod
+    def line_trace_single(
+        world_context_object,
+        start,
+        end,
+        trace_channel,
+        trace_complex,
+        actors_to_ignore,
+        draw_debug_type,
+        ignore_self,
+        *args,
+    ):
+        _charge("SystemLibrary.line_trace_single")
+        # Flat ground at z 0, with holes where x and y are both negative
+        if (start.x < 0.0 and start.y < 0.0) or not (end.z <= 0.0 <= start.z):
+            return None
+        return HitResult(Vector(start.x, start.y, 0.0))
+
+    @staticmethod
+    def execute_console_command(world_context_object, command: str, specific_player=None):
+        _charge("SystemLibrary.execute_console_command")
+
+
+# World generation
+
+# Distinct meshes placed in the level
+MESH_POOL = 200
+
+ASSET_KINDS = [
+    # (prefix, class, weight)
+    ("SM_", "StaticMesh", 30),
+    ("M_", "Material", 10),
+    ("MI_", "MaterialInstanceConstant", 15),
+    ("T_", "Texture2D", 25),
+    ("BP_", "Blueprint", 8),
+    ("SK_", "SkeletalMesh", 3),
+    ("ABP_", "AnimBlueprint", 2),
+    ("IA_", "InputAction", 2),
+    ("IMC_", "InputMappingContext", 1),
+    ("L_", "World", 1),
+    ("WID_", "WidgetBlueprint", 3),
+]
+
+WORDS = [
+    "Rock", "Tree", "Hero", "Door", "Crate", "Wall", "Floor", "Lamp", "Weapon",
+    "Rifle", "Barrel", "Fence", "Grass", "Cliff", "Water", "Sky", "Cloud", "Pipe",
+    "Roof", "Window", "Stair", "Chair", "Table", "Sign", "Car", "Truck", "Bridge",
+    "Tower", "Gate", "Statue", "Character", "GameMode", "Experience", "Menu",
+]
+
+FOLDERS = [
+    "Environment", "Props", "Characters", "Weapons", "Materials", "Textures",
+    "Blueprints", "Input", "Maps", "UI", "Audio", "FX", "Vehicles", "Foliage",
+]
+
+ACTOR_KINDS = [
+    (StaticMeshActor, 80),
+    (PointLight, 8),
+    (SpotLight, 4),
+    (SkeletalMeshActor, 3),
+    (CameraActor, 2),
+    (Pawn, 2),
+    (PlayerStart, 1),
+]
+
+
+def _weighted(kinds, rng: random.Random, count: int):
+    population = [kind[:-1] if len(kind) > 2 else kind[0] for kind in kinds]
+    weights = [kind[-1] for kind in kinds]
+    return rng.choices(population, weights, k=count)
+
+
+def build_world(assets: int, actors: int, seed: int = 0):
+    """Fill the registry with `assets` assets and the level with `actors` actors."""
+    rng = random.Random(seed)
+
+    generated = []
+    kinds = _weighted(ASSET_KINDS, rng, assets)
+    for index, (prefix, class_name) in enumerate(kinds):
+        word = WORDS[rng.randrange(len(WORDS))]
+        if index % 20 == 0:
+            path = f"/Engine/{FOLDERS[index % len(FOLDERS)]}"
+        else:
+            path = f"/Game/{FOLDERS[rng.randrange(len(FOLDERS))]}/Set{rng.randrange(200)}"
+        generated.append(AssetData(f"{prefix}{word}_{index}", path, class_name))
+    _registry.reset(generated)
+    # Props share a small set of meshes, a few of them very often
+    meshes = [_load(data) for data in generated if data._class == "StaticMesh"][:MESH_POOL]
+
+    Actor._serial = itertools.count()
+    _actors[:] = []
+    for index, actor_class in enumerate(_weighted(ACTOR_KINDS, rng, actors)):
+        location = Vector(
+            rng.uniform(-50000, 50000), rng.uniform(-50000, 50000), rng.uniform(0, 5000)
+        )
+        rotation = Rotator(0.0, 0.0, rng.uniform(0, 360))
+        word = WORDS[index % len(WORDS)]
+        folder = f"{FOLDERS[index % len(FOLDERS)]}/Group{index % 40}" if index % 3 else ""
+        actor = actor_class(
+            name=f"{actor_class.__name__}_{index}",
+            label=f"{word}{index}",
+            folder=folder,
+            location=location,
+            rotation=rotation,
+        )
+        actor._level = _levels[index % len(_levels)]
+        if isinstance(actor, StaticMeshActor) and meshes:
+            actor._components[0]._mesh = meshes[int(rng.random() ** 2 * len(meshes))]
+        if index % 2:
+            actor._data_layers = [_data_layers[index % len(_data_layers)]]
+        _actors.append(actor)
+    _actors.append(DirectionalLight(name="DirectionalLight_0", label="Sun"))
+    _actors.append(SplineArea(name="SplineArea_0", label="ScatterArea"))
+
+    _baseline[:] = _actors
+    CALLS.clear()
+
+
+def restore_world():
+    """Put the level back to the actors build_world made."""
+    _actors[:] = _baseline
+    _camera[0], _camera[1] = Vector(), Rotator()
+
+
+def level_actor_names(count: int, stride: int = 1) -> List[str]:
+    return [actor._name for actor in _baseline[: count * stride : stride]]
+
+
+def first_static_mesh() -> int:
+    return next(
+        index
+        for index, data in enumerate(_registry.assets)
+        if data._class == "StaticMesh"
+    )
+
+
+def asset_object_path(index: int) -> str:
+    data = _registry.assets[index % len(_registry.assets)]
+    return f"{data._package_name()}.{data._name}"
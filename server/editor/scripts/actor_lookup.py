@@ -0,0 +1,142 @@
+from typing import Any, Dict, List, Optional
+import unreal
+
+from . import events
+from . import profiler
+
+
+class ActorLookup:
+    """Hash index from actor object names and labels to level actors.
+
+    Built once per world and kept current from the level actor delegates when
+    they can be bound. Hits are always verified against the actor, and a
+    stale entry or a miss triggers a single rebuild instead of a wrong answer:
+    there is no label changed event, so labels set after the added event or
+    renamed in the editor are only seen by a rebuild.
+    """
+
+    def __init__(self):
+        self.world_path: Optional[str] = None
+        self.by_name: Dict[str, Any] = {}
+        self.by_label: Dict[str, Any] = {}
+        self.subscribed = False
+        self._callbacks: List[tuple] = []
+
+    def build(self, world_path: str):
+        self.world_path = world_path
+        self.by_name = {}
+        self.by_label = {}
+        with profiler.phase("index_actors"):
+            all_actors = unreal.get_editor_subsystem(
+                unreal.EditorActorSubsystem
+            ).get_all_level_actors()
+            for actor in all_actors:
+                self.add(actor)
+
+    def add(self, actor):
+        try:
+            self.by_name.setdefault(actor.get_name(), actor)
+            self.by_label.setdefault(actor.get_actor_label(), actor)
+        except Exception:
+            pass
+
+    def note_spawned(self, actor):
+        # Also when subscribed, the added event came before the label was set
+        if self.world_path is not None:
+            self.add(actor)
+
+    def discard(self, actor, name: str, label: str):
+        if self.by_name.get(name) is actor:
+            del self.by_name[name]
+        if self.by_label.get(label) is actor:
+            del self.by_label[label]
+
+    def relabel(self, actor, old_label: str):
+        if self.by_label.get(old_label) is actor:
+            del self.by_label[old_label]
+        self.by_label.setdefault(actor.get_actor_label(), actor)
+
+    # Level events
+
+    def on_level_actor_added(self, actor):
+        self.add(actor)
+
+    def on_level_actor_deleted(self, actor):
+        self.discard(actor, actor.get_name(), actor.get_actor_label())
+
+    def subscribe(self):
+        actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+        handlers = {
+            "on_level_actor_added": self.on_level_actor_added,
+            "on_level_actor_deleted": self.on_level_actor_deleted,
+        }
+        self._callbacks = events.bind(actor_subsystem, handlers) or []
+        self.subscribed = bool(self._callbacks)
+
+    def unsubscribe(self):
+        events.unbind(self._callbacks)
+        self._callbacks = []
+        self.subscribed = False
+
+    # Queries
+
+    def _lookup(self, name: str):
+        actor = self.by_name.get(name) or self.by_label.get(name)
+        if actor is None:
+            return None
+        try:
+            if actor.get_name() == name or actor.get_actor_label() == name:
+                return actor
+        except Exception:
+            pass
+        return False  # stale entry
+
+    def find_many(self, names: List[str]) -> Dict[str, Any]:
+        """Resolve every name with at most one rebuild of the index."""
+        world = unreal.get_editor_subsystem(
+            unreal.UnrealEditorSubsystem
+        ).get_editor_world()
+        world_path = world.get_path_name()
+        rebuilt = False
+        if world_path != self.world_path:
+            self.build(world_path)
+            rebuilt = True
+
+        found = {}
+        pending = []
+        for name in names:
+            actor = self._lookup(name)
+            if actor:
+                found[name] = actor
+            else:
+                pending.append(name)
+
+        if pending and not rebuilt:
+            self.build(world_path)
+            for name in pending:
+                actor = self._lookup(name)
+                if actor:
+                    found[name] = actor
+
+        return found
+
+    def find(self, name: str):
+        return self.find_many([name]).get(name)
+
+
+_lookup: Optional[ActorLookup] = None
+
+
+def get_lookup() -> ActorLookup:
+    global _lookup
+    if _lookup is None:
+        _lookup = ActorLookup()
+        _lookup.subscribe()
+    return _lookup
+
+
+def unregister():
+    global _lookup
+    if _lookup is not None:
+        _lookup.unsubscribe()
+        _lookup = None
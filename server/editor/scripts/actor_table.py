@@ -0,0 +1,222 @@
+from typing import Any, Dict, List, Optional, Tuple
+import unreal
+
+from . import events
+from . import profiler
+
+# Removals older than this many versions are forgotten, callers asking for
+# anything older get a reset and should take a fresh snapshot
+MAX_TRACKED_CHANGES = 100000
+
+
+def actor_fingerprint(actor) -> Tuple[float, ...]:
+    transform = actor.get_actor_transform()
+    location = transform.translation
+    rotation = transform.rotation.rotator()
+    scale = transform.scale3d
+    return (
+        location.x,
+        location.y,
+        location.z,
+        rotation.pitch,
+        rotation.yaw,
+        rotation.roll,
+        scale.x,
+        scale.y,
+        scale.z,
+    )
+
+
+class ActorTable:
+    """Versioned record of actor changes in the editor world.
+
+    Every add, move or delete bumps the version and records it against the
+    actor name, so a caller can ask what changed since a version it has seen.
+    Changes come from the level actor delegates when they can be bound,
+    otherwise from diffing actor transforms on each sync.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self.floor = 0
+        self.world_path: Optional[str] = None
+        # name -> (created_version, changed_version, actor)
+        self.changes: Dict[str, Tuple[int, int, Any]] = {}
+        # name -> (created_version, removed_version)
+        self.removed: Dict[str, Tuple[int, int]] = {}
+        self.fingerprints: Optional[Dict[str, Tuple[float, ...]]] = None
+        self.subscribed = False
+        self._callbacks: List[tuple] = []
+
+    # Recording
+
+    def note_added(self, actor):
+        name = actor.get_name()
+        self.version += 1
+        self.removed.pop(name, None)
+        self.changes[name] = (self.version, self.version, actor)
+        self._trim()
+
+    def note_changed(self, actor):
+        name = actor.get_name()
+        self.version += 1
+        created = self.changes.get(name, (0,))[0]
+        self.changes[name] = (created, self.version, actor)
+        self._trim()
+
+    def note_removed(self, name: str):
+        self.version += 1
+        created = self.changes.pop(name, (0,))[0]
+        self.removed[name] = (created, self.version)
+        self._trim()
+
+    def _trim(self):
+        if len(self.changes) + len(self.removed) <= MAX_TRACKED_CHANGES:
+            return
+        # Drop the older half of the history and raise the floor
+        cutoff = self.version - MAX_TRACKED_CHANGES // 2
+        self.changes = {
+            name: change for name, change in self.changes.items() if change[1] > cutoff
+        }
+        self.removed = {
+            name: removal for name, removal in self.removed.items() if removal[1] > cutoff
+        }
+        self.floor = max(self.floor, cutoff)
+
+    def reset(self, world_path: Optional[str]):
+        self.world_path = world_path
+        self.changes = {}
+        self.removed = {}
+        self.fingerprints = None
+        # A new version, so versions from the previous world fall below the
+        # floor and their callers get a reset instead of an empty delta
+        self.version += 1
+        self.floor = self.version
+
+    # Editor events
+
+    def on_level_actor_added(self, actor):
+        self.note_added(actor)
+        if self.fingerprints is not None:
+            self.fingerprints[actor.get_name()] = actor_fingerprint(actor)
+
+    def on_level_actor_deleted(self, actor):
+        name = actor.get_name()
+        self.note_removed(name)
+        if self.fingerprints is not None:
+            self.fingerprints.pop(name, None)
+
+    def on_actor_moved(self, actor):
+        self.note_changed(actor)
+
+    def subscribe(self):
+        actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+        handlers = {
+            "on_level_actor_added": self.on_level_actor_added,
+            "on_level_actor_deleted": self.on_level_actor_deleted,
+            "on_actor_moved": self.on_actor_moved,
+        }
+        self._callbacks = events.bind(actor_subsystem, handlers) or []
+        self.subscribed = bool(self._callbacks)
+
+    def unsubscribe(self):
+        events.unbind(self._callbacks)
+        self._callbacks = []
+        self.subscribed = False
+
+    # Syncing
+
+    def sync(
+        self,
+        world,
+        all_actors: Optional[list] = None,
+        fingerprints: Optional[Dict[str, Tuple[float, ...]]] = None,
+    ) -> int:
+        """Bring the table up to date with the world and return the version.
+
+        Without editor events the actors are diffed against the previous
+        sync. Callers that already read every transform can pass them in as
+        fingerprints to avoid a second pass.
+        """
+        world_path = world.get_path_name()
+        if world_path != self.world_path:
+            self.reset(world_path)
+
+        if self.subscribed:
+            return self.version
+
+        if all_actors is None:
+            all_actors = unreal.get_editor_subsystem(
+                unreal.EditorActorSubsystem
+            ).get_all_level_actors()
+
+        if fingerprints is None:
+            with profiler.phase("fingerprint_actors"):
+                fingerprints = {}
+                for actor in all_actors:
+                    try:
+                        fingerprints[actor.get_name()] = actor_fingerprint(actor)
+                    except Exception:
+                        continue
+
+        previous = self.fingerprints
+        self.fingerprints = fingerprints
+        if previous is None:
+            return self.version
+
+        actors_by_name = None
+        for name, fingerprint in fingerprints.items():
+            before = previous.get(name)
+            if before == fingerprint:
+                continue
+            if actors_by_name is None:
+                actors_by_name = {actor.get_name(): actor for actor in all_actors}
+            if before is None:
+                self.note_added(actors_by_name[name])
+            else:
+                self.note_changed(actors_by_name[name])
+        for name in previous.keys() - fingerprints.keys():
+            self.note_removed(name)
+
+        return self.version
+
+    def changes_since(self, since_version: int) -> Optional[Dict[str, Any]]:
+        """Return added/modified actors and removed names, None if too old."""
+        if since_version < self.floor or since_version > self.version:
+            return None
+
+        added = []
+        modified = []
+        for name, (created, changed, actor) in self.changes.items():
+            if changed <= since_version:
+                continue
+            if created > since_version:
+                added.append((name, actor))
+            else:
+                modified.append((name, actor))
+
+        removed = [
+            name
+            for name, (created, removed_at) in self.removed.items()
+            if removed_at > since_version and created <= since_version
+        ]
+
+        return {"added": added, "modified": modified, "removed": removed}
+
+
+_table: Optional[ActorTable] = None
+
+
+def get_table() -> ActorTable:
+    global _table
+    if _table is None:
+        _table = ActorTable()
+        _table.subscribe()
+    return _table
+
+
+def unregister():
+    global _table
+    if _table is not None:
+        _table.unsubscribe()
+        _table = None
@@ -0,0 +1,180 @@
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+import itertools
+import secrets
+import time
+import unreal
+
+from . import events
+from . import profiler
+
+# Events kept for readers, older ones are dropped and reported as a gap
+RING_SIZE = 10000
+
+EVENT_TYPES = ("added", "removed", "renamed", "updated", "saved")
+
+
+def object_path(asset) -> str:
+    return f"{asset.package_name}.{asset.asset_name}"
+
+
+def class_of(asset) -> str:
+    return str(asset.asset_class_path.asset_name)
+
+
+class AssetFeed:
+    """Numbered asset registry changes in a ring buffer.
+
+    Every change gets the next sequence number, so a reader that remembers
+    the last number it saw can ask for what came after and tell from the
+    numbers whether the buffer wrapped in between. The feed id changes with
+    every install, numbers from an older feed mean the reader must rescan.
+
+    Changes come from the asset registry delegates. Without them each read
+    diffs the registry against the previous read, which only finds added
+    and removed assets.
+    """
+
+    def __init__(self):
+        self.id = secrets.token_hex(6)
+        self.sequence = 0
+        # (sequence, time, event, object path, class, old object path)
+        self.events: Deque[tuple] = deque(maxlen=RING_SIZE)
+        self.started_at = time.time()
+        self.subscribed = False
+        self.saved_events = False
+        self.snapshot: Optional[Dict[str, str]] = None
+        self._callbacks: List[tuple] = []
+
+    def record(self, event: str, path: str, class_name: str, old_path: str = ""):
+        self.sequence += 1
+        self.events.append(
+            (self.sequence, time.time(), event, path, class_name, old_path)
+        )
+
+    def oldest(self) -> int:
+        """Sequence number of the oldest event still held."""
+        return self.events[0][0] if self.events else self.sequence + 1
+
+    # Registry events
+
+    def on_asset_added(self, asset):
+        self.record("added", object_path(asset), class_of(asset))
+
+    def on_asset_removed(self, asset):
+        self.record("removed", object_path(asset), class_of(asset))
+
+    def on_asset_renamed(self, asset, old_object_path):
+        self.record(
+            "renamed", object_path(asset), class_of(asset), str(old_object_path)
+        )
+
+    def on_asset_updated(self, asset):
+        self.record("updated", object_path(asset), class_of(asset))
+
+    def on_asset_updated_on_disk(self, asset):
+        # Sent once a saved package has been scanned again
+        self.record("saved", object_path(asset), class_of(asset))
+
+    def subscribe(self):
+        asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+        handlers = {
+            "on_asset_added": self.on_asset_added,
+            "on_asset_removed": self.on_asset_removed,
+            "on_asset_renamed": self.on_asset_renamed,
+            "on_asset_updated": self.on_asset_updated,
+        }
+        self._callbacks = events.bind(asset_registry, handlers) or []
+        self.subscribed = bool(self._callbacks)
+        # Not every engine version has it, the other events don't depend on it
+        saved = events.bind(
+            asset_registry, {"on_asset_updated_on_disk": self.on_asset_updated_on_disk}
+        )
+        self.saved_events = bool(saved)
+        self._callbacks += saved or []
+
+    def unsubscribe(self):
+        events.unbind(self._callbacks)
+        self._callbacks = []
+        self.subscribed = False
+        self.saved_events = False
+
+    def poll(self):
+        """Record added and removed assets by diffing the registry, for when
+        the registry events can't be bound."""
+        if self.subscribed:
+            return
+        asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+        with profiler.phase("diff_assets"):
+            current = {
+                object_path(asset): class_of(asset)
+                for asset in asset_registry.get_all_assets()
+            }
+            previous = self.snapshot
+            self.snapshot = current
+            if previous is None:
+                return
+            for path in sorted(current.keys() - previous.keys()):
+                self.record("added", path, current[path])
+            for path in sorted(previous.keys() - current.keys()):
+                self.record("removed", path, previous[path])
+
+    # Reading
+
+    def read(
+        self, after: Optional[int], limit: int, accept=None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Up to limit accepted events after the given sequence number, and
+        the number of the last event looked at."""
+        oldest = self.oldest()
+        start = oldest - 1 if after is None else max(after, oldest - 1)
+        found = []
+        last = start
+        tail: Iterable[tuple] = itertools.islice(
+            self.events, start - oldest + 1, None
+        )
+        for sequence, at, event, path, class_name, old_path in tail:
+            if len(found) == limit:
+                break
+            last = sequence
+            if accept is not None and not accept(event, path):
+                continue
+            item = {
+                "sequence": sequence,
+                "time": round(at, 3),
+                "event": event,
+                "path": path,
+                "class": class_name,
+            }
+            if old_path:
+                item["old_path"] = old_path
+            found.append(item)
+        return found, last
+
+
+_feed: Optional[AssetFeed] = None
+
+
+def get_feed() -> AssetFeed:
+    global _feed
+    if _feed is None:
+        _feed = AssetFeed()
+        _feed.subscribe()
+    return _feed
+
+
+def start():
+    """Begin recording when the helpers are installed instead of on the
+    first read, so changes made before then aren't missed.
+
+    Reinstalling the same helpers keeps the feed, its id and its sequence.
+    Without registry events this reads every asset for the first diff, once
+    per install of new helpers."""
+    get_feed().poll()
+
+
+def unregister():
+    global _feed
+    if _feed is not None:
+        _feed.unsubscribe()
+        _feed = None
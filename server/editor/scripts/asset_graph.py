@@ -0,0 +1,220 @@
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+import time
+import unreal
+
+from . import events
+
+# Cache lifetime used when the asset registry events cannot be subscribed to
+FALLBACK_TTL_SECONDS = 60.0
+
+# (include_hard, include_soft), None stands for the registry's default options
+OptionsKey = Optional[Tuple[bool, bool]]
+
+
+def dependency_options(key: OptionsKey):
+    options = unreal.AssetRegistryDependencyOptions()
+    if key is not None:
+        include_hard, include_soft = key
+        options.include_hard_package_references = include_hard
+        options.include_soft_package_references = include_soft
+        options.include_searchable_names = False
+        options.include_hard_management_references = False
+        options.include_soft_management_references = False
+    return options
+
+
+def package_of(asset_path: str) -> str:
+    """Accept an object path (/Game/A/B.B) or a package name (/Game/A/B)."""
+    folder, _, leaf = asset_path.rpartition("/")
+    return f"{folder}/{leaf.split('.', 1)[0]}" if folder else asset_path
+
+
+class AssetGraph:
+    """Memoized package dependency graph backed by the asset registry.
+
+    Edges are fetched from the registry the first time a package is visited
+    and kept per option set. Registry events drop the entries of the changed
+    package, of the packages it points at and of the packages whose cached
+    referencers list it, everything else stays warm.
+    """
+
+    def __init__(self):
+        self.dependencies: Dict[OptionsKey, Dict[str, List[str]]] = {}
+        self.referencers: Dict[OptionsKey, Dict[str, List[str]]] = {}
+        # Reverse of the cached referencer lists: referencer -> the packages
+        # whose list names it
+        self.listed_in: Dict[OptionsKey, Dict[str, Set[str]]] = {}
+        self.assets: Dict[str, List[Tuple[str, str]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.created_at = time.time()
+        self.subscribed = False
+        self._callbacks: List[tuple] = []
+
+    def _edges(self, cache, key: OptionsKey, package: str, fetch) -> List[str]:
+        edges = cache.setdefault(key, {})
+        found = edges.get(package)
+        if found is not None:
+            self.hits += 1
+            return found
+        self.misses += 1
+        asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+        found = [
+            str(name)
+            for name in (fetch(asset_registry, package, dependency_options(key)) or [])
+        ]
+        edges[package] = found
+        return found
+
+    def dependencies_of(self, package: str, key: OptionsKey = None) -> List[str]:
+        return self._edges(
+            self.dependencies,
+            key,
+            package,
+            lambda registry, name, options: registry.get_dependencies(name, options),
+        )
+
+    def referencers_of(self, package: str, key: OptionsKey = None) -> List[str]:
+        cached = package in self.referencers.get(key, {})
+        found = self._edges(
+            self.referencers,
+            key,
+            package,
+            lambda registry, name, options: registry.get_referencers(name, options),
+        )
+        if not cached:
+            listed_in = self.listed_in.setdefault(key, {})
+            for referencer in found:
+                listed_in.setdefault(referencer, set()).add(package)
+        return found
+
+    def _drop_referencers(self, key: OptionsKey, package: str):
+        listed_in = self.listed_in.get(key, {})
+        for referencer in self.referencers.get(key, {}).pop(package, None) or []:
+            targets = listed_in.get(referencer)
+            if targets is not None:
+                targets.discard(package)
+
+    def assets_in(self, package: str) -> List[Tuple[str, str]]:
+        """(object_path, class) of every asset in a package."""
+        found = self.assets.get(package)
+        if found is None:
+            asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+            found = self.assets[package] = [
+                (
+                    f"{asset.package_name}.{asset.asset_name}",
+                    str(asset.asset_class_path.asset_name),
+                )
+                for asset in asset_registry.get_assets_by_package_name(package)
+            ]
+        return found
+
+    def walk(
+        self,
+        root: str,
+        direction: str,
+        max_depth: int,
+        key: OptionsKey,
+        max_nodes: int,
+    ):
+        """Breadth-first walk, each package is visited once so cycles end."""
+        step = self.referencers_of if direction == "referencers" else self.dependencies_of
+        visited = {root}
+        queue = deque([(root, 0)])
+        nodes = []
+        truncated = False
+        while queue:
+            package, depth = queue.popleft()
+            if depth >= max_depth:
+                continue
+            for neighbour in step(package, key):
+                if neighbour in visited:
+                    continue
+                if len(nodes) >= max_nodes:
+                    truncated = True
+                    queue.clear()
+                    break
+                visited.add(neighbour)
+                nodes.append((neighbour, depth + 1, package))
+                queue.append((neighbour, depth + 1))
+        return nodes, truncated
+
+    # Registry events
+
+    def invalidate(self, package: str):
+        self.assets.pop(package, None)
+        for key, dependencies in self.dependencies.items():
+            for target in dependencies.pop(package, None) or []:
+                self._drop_referencers(key, target)
+        for key in self.referencers:
+            self._drop_referencers(key, package)
+            # Lists naming the package as a referencer, even when its old
+            # dependencies were never fetched, it may have dropped them
+            for target in self.listed_in.get(key, {}).pop(package, None) or ():
+                self._drop_referencers(key, target)
+
+        # New dependencies of the package make its targets' referencer lists
+        # stale too, so look them up again for the option sets in use
+        if self.referencers:
+            asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+            for key, referencers in self.referencers.items():
+                try:
+                    targets = asset_registry.get_dependencies(
+                        package, dependency_options(key)
+                    )
+                except Exception:
+                    referencers.clear()
+                    self.listed_in.pop(key, None)
+                    continue
+                for target in targets or []:
+                    self._drop_referencers(key, str(target))
+
+    def on_asset_changed(self, asset, *args):
+        self.invalidate(str(asset.package_name))
+
+    def on_asset_renamed(self, asset, old_object_path):
+        self.invalidate(package_of(str(old_object_path)))
+        self.invalidate(str(asset.package_name))
+
+    def subscribe(self):
+        asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+        handlers = {
+            "on_asset_added": self.on_asset_changed,
+            "on_asset_removed": self.on_asset_changed,
+            "on_asset_renamed": self.on_asset_renamed,
+            "on_asset_updated": self.on_asset_changed,
+        }
+        self._callbacks = events.bind(asset_registry, handlers) or []
+        self.subscribed = bool(self._callbacks)
+
+    def unsubscribe(self):
+        events.unbind(self._callbacks)
+        self._callbacks = []
+        self.subscribed = False
+
+    def is_stale(self) -> bool:
+        return (
+            not self.subscribed
+            and time.time() - self.created_at > FALLBACK_TTL_SECONDS
+        )
+
+
+_graph: Optional[AssetGraph] = None
+
+
+def get_graph() -> AssetGraph:
+    global _graph
+    if _graph is not None and _graph.is_stale():
+        _graph = None
+    if _graph is None:
+        _graph = AssetGraph()
+        _graph.subscribe()
+    return _graph
+
+
+def unregister():
+    global _graph
+    if _graph is not None:
+        _graph.unsubscribe()
+        _graph = None
@@ -0,0 +1,288 @@
+from array import array
+from typing import Callable, Dict, List, Optional, Set
+import sys
+import time
+import unreal
+
+from . import events
+from . import profiler
+
+# Rebuild interval used when the asset registry events cannot be subscribed to
+FALLBACK_REFRESH_SECONDS = 30.0
+
+# Fraction of dead slots after which the index is compacted
+COMPACT_RATIO = 0.25
+
+
+def object_path(asset) -> str:
+    return f"{asset.package_name}.{asset.asset_name}"
+
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class AssetIndex:
+    """In-memory search index over the asset registry.
+
+    Assets get an integer slot. Names, paths and classes are stored in parallel
+    lists of interned strings, name trigrams and classes map to posting arrays
+    of slots and folders map to their slots. Removed assets only clear their
+    slot, postings are filtered on read and compacted once enough slots died.
+    """
+
+    def __init__(self):
+        self.built_at = 0.0
+        self.subscribed = False
+        self._callbacks: List[tuple] = []
+        self.reset()
+
+    def reset(self):
+        self.names: List[Optional[str]] = []
+        self.names_lower: List[Optional[str]] = []
+        self.paths: List[Optional[str]] = []
+        self.classes: List[Optional[str]] = []
+        self.classes_lower: List[Optional[str]] = []
+        self.package_names: List[Optional[str]] = []
+        self.slots: Dict[str, int] = {}
+        self.name_trigrams: Dict[str, array] = {}
+        self.path_slots: Dict[str, array] = {}
+        self.class_slots: Dict[str, array] = {}
+        self.dead = 0
+
+    # Maintenance
+
+    def build(self):
+        self.reset()
+        with profiler.phase("index_assets"):
+            asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+            for asset in asset_registry.get_all_assets():
+                self.add(asset)
+        self.built_at = time.time()
+
+    def add(self, asset):
+        key = object_path(asset)
+        if key in self.slots:
+            self.remove_path(key)
+
+        name = sys.intern(str(asset.asset_name))
+        path = sys.intern(str(asset.package_path))
+        class_name = sys.intern(str(asset.asset_class_path.asset_name))
+        name_lower = sys.intern(name.lower())
+        class_lower = sys.intern(class_name.lower())
+
+        slot = len(self.names)
+        self.slots[key] = slot
+        self.names.append(name)
+        self.names_lower.append(name_lower)
+        self.paths.append(path)
+        self.classes.append(class_name)
+        self.classes_lower.append(class_lower)
+        self.package_names.append(sys.intern(str(asset.package_name)))
+
+        for trigram in trigrams(name_lower):
+            postings = self.name_trigrams.get(trigram)
+            if postings is None:
+                postings = self.name_trigrams[trigram] = array("i")
+            postings.append(slot)
+
+        for mapping, value in (
+            (self.path_slots, sys.intern(path.lower())),
+            (self.class_slots, class_lower),
+        ):
+            postings = mapping.get(value)
+            if postings is None:
+                postings = mapping[value] = array("i")
+            postings.append(slot)
+
+    def remove_path(self, key: str):
+        slot = self.slots.pop(key, None)
+        if slot is None:
+            return
+        self.names[slot] = None
+        self.names_lower[slot] = None
+        self.paths[slot] = None
+        self.classes[slot] = None
+        self.classes_lower[slot] = None
+        self.package_names[slot] = None
+        self.dead += 1
+
+        if self.dead > len(self.names) * COMPACT_RATIO:
+            self.compact()
+
+    def compact(self):
+        live = sorted(self.slots.values())
+        names, names_lower, paths, classes, package_names = (
+            self.names,
+            self.names_lower,
+            self.paths,
+            self.classes,
+            self.package_names,
+        )
+        self.reset()
+        for slot in live:
+            self.add(
+                _IndexedAsset(
+                    names[slot],
+                    paths[slot],
+                    classes[slot],
+                    package_names[slot],
+                )
+            )
+
+    # Registry events
+
+    def on_asset_added(self, asset):
+        self.add(asset)
+
+    def on_asset_removed(self, asset):
+        self.remove_path(object_path(asset))
+
+    def on_asset_renamed(self, asset, old_object_path):
+        self.remove_path(str(old_object_path))
+        self.add(asset)
+
+    def subscribe(self):
+        asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+        handlers: Dict[str, Callable] = {
+            "on_asset_added": self.on_asset_added,
+            "on_asset_removed": self.on_asset_removed,
+            "on_asset_renamed": self.on_asset_renamed,
+        }
+        self._callbacks = events.bind(asset_registry, handlers) or []
+        self.subscribed = bool(self._callbacks)
+
+    def unsubscribe(self):
+        events.unbind(self._callbacks)
+        self._callbacks = []
+        self.subscribed = False
+
+    def is_stale(self) -> bool:
+        return (
+            not self.subscribed
+            and time.time() - self.built_at > FALLBACK_REFRESH_SECONDS
+        )
+
+    # Queries
+
+    def live_slots(self) -> List[int]:
+        return list(self.slots.values())
+
+    def match_names(self, term_lower: str) -> Set[int]:
+        names_lower = self.names_lower
+        if len(term_lower) < 3:
+            candidates = self.live_slots()
+        else:
+            postings = [self.name_trigrams.get(t) for t in trigrams(term_lower)]
+            if not all(postings):
+                return set()
+            candidates = min(postings, key=len)
+
+        return {
+            slot
+            for slot in candidates
+            if names_lower[slot] is not None and term_lower in names_lower[slot]
+        }
+
+    def match_paths(self, term_lower: str) -> Set[int]:
+        paths = self.paths
+        matches = set()
+        for path_lower, postings in self.path_slots.items():
+            if term_lower in path_lower:
+                matches.update(slot for slot in postings if paths[slot] is not None)
+        return matches
+
+    def classes_matching(self, class_filter_lower: str) -> Set[str]:
+        return {
+            class_lower
+            for class_lower in self.class_slots
+            if class_filter_lower in class_lower
+        }
+
+    def slots_under(self, path_prefix: str) -> Set[int]:
+        prefix_lower = path_prefix.lower()
+        package_names = self.package_names
+        matches = set()
+        for path_lower, postings in self.path_slots.items():
+            folder = path_lower + "/"
+            if folder.startswith(prefix_lower):
+                matches.update(slot for slot in postings if package_names[slot])
+            elif prefix_lower.startswith(folder):
+                # The prefix reaches into asset names inside this folder
+                matches.update(
+                    slot
+                    for slot in postings
+                    if package_names[slot]
+                    and package_names[slot].lower().startswith(prefix_lower)
+                )
+        return matches
+
+    def search(
+        self,
+        search_term: str,
+        asset_class: Optional[str] = None,
+        path_prefix: Optional[str] = None,
+    ) -> Set[int]:
+        term_lower = search_term.lower()
+        matches = self.match_names(term_lower) | self.match_paths(term_lower)
+
+        if asset_class:
+            allowed = self.classes_matching(asset_class.lower())
+            classes_lower = self.classes_lower
+            matches = {slot for slot in matches if classes_lower[slot] in allowed}
+
+        if path_prefix:
+            matches &= self.slots_under(path_prefix)
+
+        return matches
+
+    def relevance(self, search_term: str, slot: int) -> int:
+        term_lower = search_term.lower()
+        name_lower = self.names_lower[slot]
+        name_exact = term_lower == name_lower
+        name_starts = name_lower.startswith(term_lower)
+        return (name_exact * 3) + (name_starts * 2) + 1
+
+    def asset(self, slot: int) -> Dict[str, str]:
+        return {
+            "name": self.names[slot],
+            "path": self.paths[slot],
+            "class": self.classes[slot],
+            "package_name": self.package_names[slot],
+        }
+
+
+class _IndexedAsset:
+    """Minimal AssetData look-alike used to re-add slots during compaction."""
+
+    def __init__(self, name, path, class_name, package_name):
+        self.asset_name = name
+        self.package_path = path
+        self.package_name = package_name
+        self.asset_class_path = _ClassPath(class_name)
+
+
+class _ClassPath:
+    def __init__(self, asset_name):
+        self.asset_name = asset_name
+
+
+_index: Optional[AssetIndex] = None
+
+
+def get_index() -> AssetIndex:
+    global _index
+    if _index is None:
+        _index = AssetIndex()
+        _index.subscribe()
+        _index.build()
+    elif _index.is_stale():
+        _index.build()
+    return _index
+
+
+def unregister():
+    global _index
+    if _index is not None:
+        _index.unsubscribe()
+        _index = None
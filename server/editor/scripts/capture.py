@@ -0,0 +1,51 @@
+import unreal
+import os
+import secrets
+import shutil
+import tempfile
+
+MAX_RESOLUTION = 7680
+
+PNG_TRAILER = b"IEND\xaeB`\x82"
+
+
+def clamp_resolution(value: int) -> int:
+    return max(16, min(int(value), MAX_RESOLUTION))
+
+
+def temp_image_path(extension: str) -> str:
+    # Only a name, the file must not exist until the editor has written it
+    return os.path.join(
+        tempfile.gettempdir(), f"rrmcp-{secrets.token_hex(6)}.{extension}"
+    )
+
+
+def capture_complete(path: str) -> bool:
+    try:
+        with open(path, "rb") as f:
+            f.seek(-len(PNG_TRAILER), os.SEEK_END)
+            return f.read() == PNG_TRAILER
+    except OSError:
+        return False
+
+
+def convert_image(source: str, target: str, quality: int):
+    """Re-encode a finished PNG capture as JPEG, keeps the PNG bytes on failure.
+
+    The result is moved to target in one step so readers polling for it
+    never see a partial file.
+    """
+    temp_target = target + ".tmp.jpg"
+    try:
+        texture = unreal.RenderingLibrary.import_file_as_texture2d(None, source)
+        options = unreal.ImageWriteOptions()
+        options.format = unreal.DesiredImageFormat.JPG
+        options.compression_quality = quality
+        options.overwrite_file = True
+        options.async_ = False
+        unreal.ImageWriteBlueprintLibrary.export_to_disk(texture, temp_target, options)
+    except Exception as e:
+        unreal.log_warning(f"rrmcp: screenshot conversion failed: {e}")
+    if not os.path.exists(temp_target):
+        shutil.copyfile(source, temp_target)
+    os.replace(temp_target, target)
@@ -0,0 +1,37 @@
+from typing import Any
+import json
+import os
+import secrets
+import tempfile
+
+from . import profiler
+
+# Results are printed on a single line behind a marker so the server can tell
+# them apart from anything else written to the output while a tool runs
+RESULT_PREFIX = "rrmcp:result:"
+RESULT_FILE_PREFIX = "rrmcp:file:"
+
+# Larger results go to a temp file that the server reads directly instead of
+# streaming them through the editor's output log
+SPILL_BYTES = 64 * 1024
+
+
+def encode(result: Any) -> str:
+    return json.dumps(result, separators=(",", ":"))
+
+
+def send(result: Any):
+    with profiler.phase("encode"):
+        payload = encode(result)
+
+    with profiler.phase("output"):
+        if len(payload) <= SPILL_BYTES:
+            print(RESULT_PREFIX + payload)
+            return
+
+        path = os.path.join(
+            tempfile.gettempdir(), f"rrmcp-{secrets.token_hex(8)}.json"
+        )
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        print(RESULT_FILE_PREFIX + path)
@@ -0,0 +1,28 @@
+from typing import Callable, Dict, List, Optional
+
+
+def bind(source, handlers: Dict[str, Callable]) -> Optional[List[tuple]]:
+    """Bind handlers to the named delegates of source.
+
+    Binding is all or nothing: if any delegate is missing the ones already
+    bound are released and None is returned, so callers can fall back to
+    polling.
+    """
+    callbacks = []
+    try:
+        for delegate_name, handler in handlers.items():
+            delegate = getattr(source, delegate_name)
+            delegate.add_callable(handler)
+            callbacks.append((delegate, handler))
+    except Exception:
+        unbind(callbacks)
+        return None
+    return callbacks
+
+
+def unbind(callbacks: List[tuple]):
+    for delegate, handler in callbacks:
+        try:
+            delegate.remove_callable(handler)
+        except Exception:
+            pass
@@ -0,0 +1,158 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, Optional
+import secrets
+import time
+import unreal
+
+# Time spent on jobs per editor tick, small enough to keep the editor responsive
+TICK_BUDGET_SECONDS = 0.008
+
+# Used to advance jobs from status calls when no tick callback can be registered
+POLL_BUDGET_SECONDS = 1.0
+
+MAX_FINISHED_JOBS = 16
+
+# Yielded by a job's work to hand the rest of the tick back to the editor,
+# e.g. while it waits for something the editor does on a later frame
+WAIT = object()
+
+
+class Job:
+    """Work split into small steps and advanced a time slice at a time.
+
+    `work` is an iterator that does one unit per `next()` and updates `state`
+    as it goes, so partial results can be read while it runs. `report` turns
+    the state into a status payload for a page of items.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        work: Iterator[Any],
+        total: int,
+        state: Dict[str, Any],
+        report: Callable[[Dict[str, Any], int, int], Dict[str, Any]],
+    ):
+        self.id = secrets.token_hex(4)
+        self.kind = kind
+        self.work = work
+        self.total = total
+        self.processed = 0
+        self.state = state
+        self.report = report
+        self.status = "running"
+        self.error: Optional[str] = None
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+
+    def run(self, budget: float):
+        deadline = time.perf_counter() + budget
+        try:
+            while time.perf_counter() < deadline:
+                if next(self.work) is WAIT:
+                    break
+                self.processed += 1
+        except StopIteration:
+            self.finish("done")
+        except Exception as e:
+            self.error = str(e)
+            self.finish("failed")
+
+    def finish(self, status: str):
+        self.status = status
+        self.finished_at = time.time()
+
+    def describe(self, offset: int = 0, limit: int = 100) -> Dict[str, Any]:
+        end = self.finished_at or time.time()
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "processed": self.processed,
+            "total": self.total,
+            "progress": round(self.processed / self.total * 100, 2)
+            if self.total
+            else 100.0,
+            "elapsed_seconds": round(end - self.started_at, 3),
+            "error": self.error,
+            **self.report(self.state, offset, limit),
+        }
+
+
+_jobs: "OrderedDict[str, Job]" = OrderedDict()
+_tick_handle = None
+
+
+def _running():
+    return [job for job in _jobs.values() if job.status == "running"]
+
+
+def _on_tick(delta_seconds: float):
+    running = _running()
+    if not running:
+        _stop_ticking()
+        return
+    budget = TICK_BUDGET_SECONDS / len(running)
+    for job in running:
+        job.run(budget)
+
+
+def _start_ticking():
+    global _tick_handle
+    if _tick_handle is None:
+        try:
+            _tick_handle = unreal.register_slate_post_tick_callback(_on_tick)
+        except Exception:
+            _tick_handle = None
+
+
+def _stop_ticking():
+    global _tick_handle
+    if _tick_handle is not None:
+        try:
+            unreal.unregister_slate_post_tick_callback(_tick_handle)
+        except Exception:
+            pass
+        _tick_handle = None
+
+
+def start(job: Job) -> Job:
+    _jobs[job.id] = job
+    finished = [job_id for job_id, j in _jobs.items() if j.status != "running"]
+    for job_id in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+        del _jobs[job_id]
+    _start_ticking()
+    return job
+
+
+def get(job_id: str) -> Optional[Job]:
+    job = _jobs.get(job_id)
+    if job is not None and job.status == "running" and _tick_handle is None:
+        # No editor tick available, make progress on each status poll instead
+        job.run(POLL_BUDGET_SECONDS)
+    return job
+
+
+def cancel(job_id: str) -> Optional[Job]:
+    job = _jobs.get(job_id)
+    if job is not None and job.status == "running":
+        job.finish("cancelled")
+        # Lets the work run its cleanup (finally blocks) right away
+        close = getattr(job.work, "close", None)
+        if close is not None:
+            close()
+    return job
+
+
+def list_jobs():
+    return [
+        {"job_id": job.id, "kind": job.kind, "status": job.status}
+        for job in _jobs.values()
+    ]
+
+
+def unregister():
+    _stop_ticking()
+    for job_id in [job.id for job in _running()]:
+        cancel(job_id)
+    _jobs.clear()
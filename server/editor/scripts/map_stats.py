@@ -0,0 +1,202 @@
+from collections import Counter
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
+import time
+import unreal
+
+from . import actor_table
+from . import profiler
+
+STATISTICS = ("classes", "lights", "levels", "data_layers", "bounds")
+DEFAULT_STATISTICS = ("classes", "lights", "levels")
+
+# Cached stats are reused while the actor table saw no change, and at most
+# this long since edits the level actor events don't report (e.g. data
+# layer assignments) would go unnoticed
+CACHE_SECONDS = 30.0
+
+# Class wrapper -> class name, classes outlive any one level
+_class_names: Dict[Any, str] = {}
+
+
+def class_name_of(actor) -> str:
+    actor_class = actor.get_class()
+    name = _class_names.get(actor_class)
+    if name is None:
+        name = _class_names[actor_class] = actor_class.get_name()
+    return name
+
+
+def level_name_of(level) -> str:
+    """Name of the map a level was loaded from, the world it belongs to."""
+    try:
+        return level.get_outer().get_name()
+    except Exception:
+        return "PersistentLevel"
+
+
+def data_layer_names(actor, names: Dict[Any, str]) -> List[str]:
+    layers = actor.get_editor_property("data_layer_assets") or []
+    found = []
+    for layer in layers:
+        if layer is None:
+            continue
+        name = names.get(layer)
+        if name is None:
+            name = names[layer] = layer.get_name()
+        found.append(name)
+    return found
+
+
+class LevelStats:
+    """Counts over the actors of one level, or of the whole map."""
+
+    __slots__ = ("total", "classes", "data_layers", "bounds_min", "bounds_max")
+
+    def __init__(self):
+        self.total = 0
+        self.classes: Counter = Counter()
+        self.data_layers: Counter = Counter()
+        self.bounds_min: Optional[List[float]] = None
+        self.bounds_max: Optional[List[float]] = None
+
+    def add_bounds(self, low: List[float], high: List[float]):
+        if self.bounds_min is None:
+            self.bounds_min, self.bounds_max = list(low), list(high)
+            return
+        for axis in range(3):
+            if low[axis] < self.bounds_min[axis]:
+                self.bounds_min[axis] = low[axis]
+            if high[axis] > self.bounds_max[axis]:
+                self.bounds_max[axis] = high[axis]
+
+    def lighting(self) -> Dict[str, Any]:
+        return {
+            "has_lightmass_importance_volume": (
+                self.classes["LightmassImportanceVolume"] > 0
+            ),
+            "directional_lights": self.classes["DirectionalLight"],
+            "point_lights": self.classes["PointLight"],
+            "spot_lights": self.classes["SpotLight"],
+        }
+
+    def bounds(self) -> Optional[Dict[str, Dict[str, float]]]:
+        if self.bounds_min is None:
+            return None
+        return {
+            "min": dict(zip("xyz", self.bounds_min)),
+            "max": dict(zip("xyz", self.bounds_max)),
+        }
+
+    def to_dict(self, statistics: Iterable[str], top_classes: int) -> Dict[str, Any]:
+        result: Dict[str, Any] = {"total_actors": self.total}
+        if "classes" in statistics:
+            result["actor_types"] = dict(self.classes.most_common(top_classes))
+        if "lights" in statistics:
+            result["lighting"] = self.lighting()
+        if "data_layers" in statistics:
+            result["data_layers"] = dict(self.data_layers.most_common())
+        if "bounds" in statistics:
+            result["bounds"] = self.bounds()
+        return result
+
+
+class MapStats:
+    """Statistics of a world, gathered in a single pass over its actors.
+
+    The class histogram is always collected since the light counts come from
+    it. Levels, data layers and bounds cost an engine call per actor each,
+    so they're only collected when asked for.
+    """
+
+    def __init__(self, world_path: str, statistics: FrozenSet[str], version: Optional[int]):
+        self.world_path = world_path
+        self.statistics = statistics
+        self.version = version
+        self.built_at = time.time()
+        self.map = LevelStats()
+        self.levels: Dict[str, LevelStats] = {}
+        self.data_layers_supported = True
+
+    def collect(self, all_actors: list):
+        want_levels = "levels" in self.statistics
+        want_layers = "data_layers" in self.statistics
+        want_bounds = "bounds" in self.statistics
+        total = self.map
+        level_names: Dict[Any, str] = {}
+        layer_names: Dict[Any, str] = {}
+
+        for actor in all_actors:
+            class_name = class_name_of(actor)
+            total.total += 1
+            total.classes[class_name] += 1
+
+            level_stats = None
+            if want_levels:
+                level = actor.get_level()
+                level_name = level_names.get(level)
+                if level_name is None:
+                    level_name = level_names[level] = level_name_of(level)
+                level_stats = self.levels.get(level_name)
+                if level_stats is None:
+                    level_stats = self.levels[level_name] = LevelStats()
+                level_stats.total += 1
+                level_stats.classes[class_name] += 1
+
+            if want_layers and self.data_layers_supported:
+                try:
+                    layers = data_layer_names(actor, layer_names)
+                except Exception:
+                    # Engines without data layer assets, don't ask every actor
+                    self.data_layers_supported = False
+                    layers = []
+                for layer in layers:
+                    total.data_layers[layer] += 1
+                    if level_stats is not None:
+                        level_stats.data_layers[layer] += 1
+
+            if want_bounds:
+                origin, extent = actor.get_actor_bounds(False)
+                low = [origin.x - extent.x, origin.y - extent.y, origin.z - extent.z]
+                high = [origin.x + extent.x, origin.y + extent.y, origin.z + extent.z]
+                total.add_bounds(low, high)
+                if level_stats is not None:
+                    level_stats.add_bounds(low, high)
+
+    def covers(self, world_path: str, statistics: FrozenSet[str], version: Optional[int]) -> bool:
+        return (
+            version is not None
+            and version == self.version
+            and world_path == self.world_path
+            and statistics <= self.statistics
+            and time.time() - self.built_at < CACHE_SECONDS
+        )
+
+
+_stats: Optional[MapStats] = None
+
+
+def get_stats(world, statistics: FrozenSet[str]) -> MapStats:
+    """Stats of the world with at least the given statistics, cached while
+    the level actor events report no change."""
+    global _stats
+    world_path = world.get_path_name()
+
+    table = actor_table.get_table()
+    version = table.sync(world) if table.subscribed else None
+    if _stats is not None and _stats.covers(world_path, statistics, version):
+        return _stats
+
+    all_actors = unreal.get_editor_subsystem(
+        unreal.EditorActorSubsystem
+    ).get_all_level_actors()
+    stats = MapStats(world_path, statistics, version)
+    with profiler.phase("aggregate_actors"):
+        stats.collect(all_actors)
+    _stats = stats
+    return stats
+
+
+def unregister():
+    global _stats
+    _stats = None
+    _class_names.clear()
@@ -0,0 +1,139 @@
+from typing import Any, Dict, List, Optional
+import time
+import unreal
+
+from . import events
+
+# Without asset registry events, render data is read again after this long
+FALLBACK_TTL_SECONDS = 60.0
+
+
+def static_mesh_stats(mesh) -> Dict[str, Any]:
+    try:
+        vertices = mesh.get_num_vertices(0)
+        triangles = mesh.get_num_triangles(0)
+    except Exception:
+        lod = mesh.get_render_data().lod_resources[0]
+        vertices = lod.get_num_vertices()
+        triangles = lod.get_num_triangles()
+    return {
+        "lods": mesh.get_num_lods(),
+        "vertices": vertices,
+        "triangles": triangles,
+        "sections": mesh.get_num_sections(0),
+        "material_slots": len(mesh.get_editor_property("static_materials") or []),
+    }
+
+
+def skeletal_mesh_stats(mesh) -> Dict[str, Any]:
+    editor_subsystem = unreal.get_editor_subsystem(unreal.SkeletalMeshEditorSubsystem)
+    materials = len(mesh.get_editor_property("materials") or [])
+    stats = {
+        "lods": editor_subsystem.get_lod_count(mesh),
+        "vertices": None,
+        # Not exposed to Python for skeletal meshes
+        "triangles": None,
+        "sections": materials,
+        "material_slots": materials,
+    }
+    try:
+        stats["vertices"] = editor_subsystem.get_num_verts(mesh, 0)
+    except Exception:
+        pass
+    try:
+        stats["sections"] = editor_subsystem.get_num_sections(mesh, 0)
+    except Exception:
+        pass
+    return stats
+
+
+class MeshCache:
+    """LOD 0 render stats per mesh, read once and shared by every component
+    that uses the mesh. Entries are dropped when the asset changes."""
+
+    def __init__(self):
+        # Mesh wrapper -> stats, or None when the mesh can't be read
+        self.by_mesh: Dict[Any, Optional[Dict[str, Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.created_at = time.time()
+        self.subscribed = False
+        self._callbacks: List[tuple] = []
+
+    def stats_of(self, mesh) -> Optional[Dict[str, Any]]:
+        if mesh in self.by_mesh:
+            self.hits += 1
+            return self.by_mesh[mesh]
+
+        self.misses += 1
+        try:
+            if isinstance(mesh, unreal.StaticMesh):
+                stats = static_mesh_stats(mesh)
+                stats["class"] = "StaticMesh"
+            elif isinstance(mesh, unreal.SkeletalMesh):
+                stats = skeletal_mesh_stats(mesh)
+                stats["class"] = "SkeletalMesh"
+            else:
+                stats = None
+            if stats is not None:
+                stats["path"] = mesh.get_path_name()
+        except Exception:
+            stats = None
+        self.by_mesh[mesh] = stats
+        return stats
+
+    # Registry events
+
+    def invalidate(self, package: str):
+        prefix = package + "."
+        for mesh, stats in list(self.by_mesh.items()):
+            if stats is None or stats["path"].startswith(prefix):
+                del self.by_mesh[mesh]
+
+    def on_asset_changed(self, asset, *args):
+        self.invalidate(str(asset.package_name))
+
+    def on_asset_renamed(self, asset, old_object_path):
+        self.invalidate(str(old_object_path).split(".", 1)[0])
+
+    def subscribe(self):
+        asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+        handlers = {
+            "on_asset_removed": self.on_asset_changed,
+            "on_asset_renamed": self.on_asset_renamed,
+            "on_asset_updated": self.on_asset_changed,
+        }
+        self._callbacks = events.bind(asset_registry, handlers) or []
+        self.subscribed = bool(self._callbacks)
+
+    def unsubscribe(self):
+        events.unbind(self._callbacks)
+        self._callbacks = []
+        self.subscribed = False
+
+    def is_stale(self) -> bool:
+        return (
+            not self.subscribed
+            and time.time() - self.created_at > FALLBACK_TTL_SECONDS
+        )
+
+
+_cache: Optional[MeshCache] = None
+
+
+def get_cache() -> MeshCache:
+    global _cache
+    if _cache is not None and _cache.is_stale():
+        _cache.unsubscribe()
+        _cache = None
+    if _cache is None:
+        _cache = MeshCache()
+        _cache.subscribe()
+    return _cache
+
+
+def unregister():
+    global _cache
+    if _cache is not None:
+        _cache.unsubscribe()
+        _cache = None
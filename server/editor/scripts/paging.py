@@ -0,0 +1,75 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+import heapq
+import secrets
+import time
+
+# Snapshots are kept for a while so an agent can walk through the pages
+SNAPSHOT_TTL_SECONDS = 600.0
+MAX_SNAPSHOTS = 16
+
+
+class Snapshot:
+    """Result set frozen at query time and served page by page.
+
+    Items must be orderable tuples. The first page is taken with a heap so a
+    single-page query never sorts everything, the full sort happens once when a
+    later page is requested.
+    """
+
+    def __init__(self, items: List[tuple], meta: Dict[str, Any]):
+        self.id = secrets.token_hex(6)
+        self.items = items
+        self.meta = meta
+        self.is_sorted = False
+        self.touched_at = time.time()
+
+    def page(self, offset: int, limit: int) -> List[tuple]:
+        self.touched_at = time.time()
+        if offset == 0 and not self.is_sorted:
+            return heapq.nsmallest(limit, self.items)
+        if not self.is_sorted:
+            self.items.sort()
+            self.is_sorted = True
+        return self.items[offset : offset + limit]
+
+    def next_cursor(self, offset: int, limit: int) -> Optional[str]:
+        next_offset = offset + limit
+        if next_offset >= len(self.items):
+            return None
+        return f"{self.id}:{next_offset}"
+
+
+_snapshots: "OrderedDict[str, Snapshot]" = OrderedDict()
+
+
+def _expire():
+    now = time.time()
+    for snapshot_id in [
+        snapshot_id
+        for snapshot_id, snapshot in _snapshots.items()
+        if now - snapshot.touched_at > SNAPSHOT_TTL_SECONDS
+    ]:
+        del _snapshots[snapshot_id]
+    while len(_snapshots) > MAX_SNAPSHOTS:
+        _snapshots.popitem(last=False)
+
+
+def keep(snapshot: Snapshot):
+    _snapshots[snapshot.id] = snapshot
+    _expire()
+
+
+def resolve(cursor: str) -> Tuple[Snapshot, int]:
+    """Return the snapshot and offset a cursor points at, raises if it expired."""
+    _expire()
+    snapshot_id, _, offset = cursor.partition(":")
+    snapshot = _snapshots.get(snapshot_id)
+    if snapshot is None or not offset.isdigit():
+        raise ValueError(f"Cursor expired or invalid: {cursor}")
+    _snapshots.move_to_end(snapshot_id)
+    return snapshot, int(offset)
+
+
+def unregister():
+    _snapshots.clear()
@@ -0,0 +1,141 @@
+from collections import Counter
+from typing import Any, Dict, Optional
+import contextlib
+import json
+import sys
+import time
+
+# Printed after the result of a profiled call, see channel.py
+PROFILE_PREFIX = "rrmcp:profile:"
+
+# Engine calls listed in a profile, by time spent
+TOP_ENGINE_CALLS = 10
+
+# Phases every profiled call has, the rest come from the scripts
+OVERHEAD_PHASES = ("decode_args", "encode", "output")
+
+
+def _engine_call_name(function) -> Optional[str]:
+    """Name of a builtin if it belongs to the unreal module, else None."""
+    if getattr(function, "__module__", None) == "unreal":
+        return function.__qualname__
+    owner = getattr(function, "__self__", None)
+    if owner is None:
+        return None
+    owner_type = owner if isinstance(owner, type) else type(owner)
+    if owner_type.__module__ != "unreal":
+        return None
+    return f"{owner_type.__name__}.{function.__name__}"
+
+
+class Profile:
+    """Timings of one tool call.
+
+    Phases are wall time of named sections and may nest, engine time is the
+    time spent inside calls into the unreal module wherever they were made.
+    """
+
+    def __init__(self, tool: str):
+        self.tool = tool
+        self.phases: Dict[str, float] = {}
+        self.engine_calls: Counter = Counter()
+        self.engine_seconds: Counter = Counter()
+        self.total = 0.0
+        # The outermost engine call in progress, calls it makes aren't counted
+        self._inside = None
+        self._inside_name = ""
+        self._inside_started = 0.0
+
+    def add(self, phase: str, seconds: float):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def _enter(self, marker, name: str):
+        self._inside = marker
+        self._inside_name = name
+        self._inside_started = time.perf_counter()
+        self.engine_calls[name] += 1
+
+    def _leave(self):
+        self.engine_seconds[self._inside_name] += time.perf_counter() - self._inside_started
+        self._inside = None
+
+    def hook(self, frame, event, arg):
+        """sys.setprofile hook. The editor's unreal module is builtin, but
+        Python implementations of it are counted too."""
+        if self._inside is None:
+            if event == "c_call":
+                name = _engine_call_name(arg)
+                if name is not None:
+                    self._enter(arg, name)
+            elif event == "call" and frame.f_globals.get("__name__") == "unreal":
+                code = frame.f_code
+                self._enter(frame, getattr(code, "co_qualname", code.co_name))
+        elif event in ("c_return", "c_exception"):
+            if arg is self._inside:
+                self._leave()
+        elif event == "return" and frame is self._inside:
+            self._leave()
+
+    def to_dict(self) -> Dict[str, Any]:
+        engine = sum(self.engine_seconds.values())
+        overhead = sum(self.phases.get(name, 0.0) for name in OVERHEAD_PHASES)
+        top = sorted(self.engine_seconds.items(), key=lambda item: -item[1])
+        return {
+            "tool": self.tool,
+            "total_ms": _ms(self.total),
+            "engine_ms": _ms(engine),
+            "python_ms": _ms(max(0.0, self.total - engine - overhead)),
+            "engine_calls": sum(self.engine_calls.values()),
+            "phases": {name: _ms(seconds) for name, seconds in self.phases.items()},
+            "top_engine_calls": [
+                {"name": name, "calls": self.engine_calls[name], "ms": _ms(seconds)}
+                for name, seconds in top[:TOP_ENGINE_CALLS]
+            ],
+        }
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+_active: Optional[Profile] = None
+
+
+@contextlib.contextmanager
+def phase(name: str):
+    """Time a section of a script, a no-op unless the call is profiled."""
+    profile = _active
+    if profile is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add(name, time.perf_counter() - started)
+
+
+def run(tool: str, module, args: str):
+    """Run a script's main with profiling and print the profile after it."""
+    global _active
+    profile = Profile(tool)
+    previous_hook = sys.getprofile()
+    _active = profile
+    started = time.perf_counter()
+    sys.setprofile(profile.hook)
+    try:
+        with phase("decode_args"):
+            kwargs = json.loads(args)
+        return module.main(**kwargs)
+    finally:
+        sys.setprofile(previous_hook)
+        profile.total = time.perf_counter() - started
+        _active = None
+        print(PROFILE_PREFIX + json.dumps(profile.to_dict(), separators=(",", ":")))
+
+
+def unregister():
+    global _active
+    if _active is not None:
+        sys.setprofile(None)
+        _active = None
@@ -0,0 +1,355 @@
+from collections import Counter
+from typing import Any, Dict, List, Optional
+import hashlib
+import json
+import os
+import time
+import unreal
+
+from . import events
+from . import profiler
+
+# Rebuild interval used when the asset registry events cannot be subscribed to
+FALLBACK_REFRESH_SECONDS = 30.0
+
+CACHE_VERSION = 1
+CACHE_FILE = "rrmcp/project_info_cache.json"
+
+# Projects can override the categories with a JSON list in this config file.
+# The first matching rule wins. Rule keys:
+#   name_prefix        asset name starts with (case sensitive)
+#   name_contains      lowercase asset name contains any of these
+#   name_contains_all  lowercase asset name contains all of these
+#   path_excludes      lowercase package path contains none of these
+RULES_FILE = "rrmcp_project_info_rules.json"
+DEFAULT_RULES: List[Dict[str, Any]] = [
+    {"category": "input_actions", "name_prefix": "IA_"},
+    {"category": "input_mappings", "name_prefix": "IMC_"},
+    {"category": "game_modes", "name_contains": ["gamemode"]},
+    {
+        "category": "characters",
+        "name_contains": ["hero", "character"],
+        "name_contains_all": ["b_"],
+    },
+    {
+        "category": "experiences",
+        "name_contains": ["experience"],
+        "path_excludes": ["ui"],
+    },
+    {"category": "weapons", "name_contains": ["weapon", "wid_"]},
+    {"category": "maps", "name_prefix": "L_"},
+]
+
+
+TERM_LIST_KEYS = ("name_contains", "name_contains_all", "path_excludes")
+
+
+def is_valid_rule(rule: Any) -> bool:
+    if not isinstance(rule, dict) or not isinstance(rule.get("category"), str):
+        return False
+    if not isinstance(rule.get("name_prefix", ""), str):
+        return False
+    for key in TERM_LIST_KEYS:
+        terms = rule.get(key, [])
+        if not isinstance(terms, list) or not all(
+            isinstance(term, str) for term in terms
+        ):
+            return False
+    return True
+
+
+def load_rules() -> List[Dict[str, Any]]:
+    path = os.path.join(unreal.Paths.project_config_dir(), RULES_FILE)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            rules = json.load(f)
+    except Exception:
+        return DEFAULT_RULES
+    if not isinstance(rules, list):
+        unreal.log_warning(f"rrmcp: {RULES_FILE} is not a list, using the defaults")
+        return DEFAULT_RULES
+    valid = [rule for rule in rules if is_valid_rule(rule)]
+    if len(valid) < len(rules):
+        unreal.log_warning(
+            f"rrmcp: skipped {len(rules) - len(valid)} malformed rules in {RULES_FILE}"
+        )
+    return valid or DEFAULT_RULES
+
+
+def categorize(rules: List[Dict[str, Any]], asset_name: str, package_path: str):
+    asset_name_lower = asset_name.lower()
+    package_path_lower = package_path.lower()
+    for rule in rules:
+        prefix = rule.get("name_prefix")
+        if prefix and not asset_name.startswith(prefix):
+            continue
+        contains = rule.get("name_contains")
+        if contains and not any(term in asset_name_lower for term in contains):
+            continue
+        contains_all = rule.get("name_contains_all")
+        if contains_all and not all(term in asset_name_lower for term in contains_all):
+            continue
+        excludes = rule.get("path_excludes")
+        if excludes and any(term in package_path_lower for term in excludes):
+            continue
+        return rule["category"]
+    return None
+
+
+def content_signature() -> str:
+    """Cheap fingerprint of the project content on disk (count, size, mtime)."""
+    count = 0
+    size = 0
+    latest = 0.0
+    stack = [unreal.Paths.project_content_dir()]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith((".uasset", ".umap")):
+                    stat = entry.stat(follow_symlinks=False)
+                    count += 1
+                    size += stat.st_size
+                    latest = max(latest, stat.st_mtime)
+    return f"{count}:{size}:{latest}"
+
+
+def plugin_signature() -> str:
+    """Fingerprint of the enabled plugins, whose content is counted too."""
+    library = getattr(unreal, "PluginBlueprintLibrary", None)
+    if library is not None:
+        try:
+            names = sorted(str(name) for name in library.get_enabled_plugin_names())
+            return hashlib.sha1("|".join(names).encode("utf-8")).hexdigest()
+        except Exception:
+            pass
+    # Older engines, the project file at least lists the plugins it enables
+    try:
+        with open(unreal.Paths.get_project_file_path(), "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return ""
+
+
+class ProjectSummary:
+    """Asset counters for editor_project_info, kept current per asset.
+
+    Seeded from the registry (or the on-disk cache when the project content
+    hasn't changed since it was written) and then updated from the registry
+    added/removed/renamed events, so a call only formats the counters.
+    """
+
+    def __init__(self, rules: List[Dict[str, Any]]):
+        self.rules = rules
+        self.keys = set()
+        self.locations: Counter = Counter()
+        # category -> full paths, dicts keep insertion order for the samples
+        self.categories: Dict[str, Dict[str, None]] = {
+            rule["category"]: {} for rule in rules
+        }
+        self.built_at = 0.0
+        self.source = "registry"
+        # Seeded while the registry was still scanning, saved once it's done
+        self.cache_pending = False
+        self.subscribed = False
+        self._callbacks: List[tuple] = []
+
+    def add(self, asset):
+        asset_name = str(asset.asset_name)
+        package_path = str(asset.package_path)
+        full_path = f"{package_path}/{asset_name}"
+        if full_path in self.keys:
+            return
+        self.keys.add(full_path)
+
+        # Count by location
+        location = package_path.split("/")[1] if "/" in package_path else "Root"
+        self.locations[location] += 1
+
+        category = categorize(self.rules, asset_name, package_path)
+        if category is not None:
+            self.categories.setdefault(category, {})[full_path] = None
+
+    def remove(self, asset):
+        asset_name = str(asset.asset_name)
+        package_path = str(asset.package_path)
+        self.remove_path(package_path, asset_name)
+
+    def remove_path(self, package_path: str, asset_name: str):
+        full_path = f"{package_path}/{asset_name}"
+        if full_path not in self.keys:
+            return
+        self.keys.discard(full_path)
+
+        location = package_path.split("/")[1] if "/" in package_path else "Root"
+        self.locations[location] -= 1
+        if self.locations[location] <= 0:
+            del self.locations[location]
+
+        category = categorize(self.rules, asset_name, package_path)
+        if category is not None:
+            self.categories.get(category, {}).pop(full_path, None)
+
+    def seed(self):
+        with profiler.phase("summarize_assets"):
+            asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+            for asset in asset_registry.get_all_assets():
+                self.add(asset)
+        self.built_at = time.time()
+        self.source = "registry"
+
+    # Registry events
+
+    def on_asset_renamed(self, asset, old_object_path):
+        package_name = str(old_object_path).split(".", 1)[0]
+        package_path, _, asset_name = package_name.rpartition("/")
+        self.remove_path(package_path, asset_name)
+        self.add(asset)
+
+    def subscribe(self):
+        asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+        handlers = {
+            "on_asset_added": self.add,
+            "on_asset_removed": self.remove,
+            "on_asset_renamed": self.on_asset_renamed,
+        }
+        self._callbacks = events.bind(asset_registry, handlers) or []
+        self.subscribed = bool(self._callbacks)
+
+    def unsubscribe(self):
+        events.unbind(self._callbacks)
+        self._callbacks = []
+        self.subscribed = False
+
+    def is_stale(self) -> bool:
+        return (
+            not self.subscribed
+            and time.time() - self.built_at > FALLBACK_REFRESH_SECONDS
+        )
+
+    # Disk cache
+
+    def to_cache(self, key: str) -> Dict[str, Any]:
+        return {
+            "version": CACHE_VERSION,
+            "key": key,
+            "keys": sorted(self.keys),
+            "categories": {
+                category: list(paths) for category, paths in self.categories.items()
+            },
+        }
+
+    def from_cache(self, data: Dict[str, Any]):
+        self.keys = set(data["keys"])
+        self.locations = Counter(
+            package_path.split("/")[1] if "/" in package_path else "Root"
+            for package_path in (key.rpartition("/")[0] for key in self.keys)
+        )
+        self.categories = {
+            category: dict.fromkeys(paths)
+            for category, paths in data["categories"].items()
+        }
+        self.built_at = time.time()
+        self.source = "disk_cache"
+
+
+def cache_path() -> str:
+    return os.path.join(unreal.Paths.project_saved_dir(), CACHE_FILE)
+
+
+def cache_key(rules: List[Dict[str, Any]]) -> str:
+    rules_hash = hashlib.sha1(
+        json.dumps(rules, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+    return "|".join(
+        [
+            str(unreal.Paths.get_project_file_path()),
+            str(unreal.SystemLibrary.get_engine_version()),
+            rules_hash,
+            plugin_signature(),
+            content_signature(),
+        ]
+    )
+
+
+def read_cache(key: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(cache_path(), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == CACHE_VERSION and data.get("key") == key:
+            return data
+    except Exception:
+        pass
+    return None
+
+
+def write_cache(summary: ProjectSummary, key: str):
+    path = cache_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(summary.to_cache(key), f, separators=(",", ":"))
+        os.replace(temp_path, path)
+    except Exception:
+        pass
+
+
+_summary: Optional[ProjectSummary] = None
+
+
+def get_summary(use_disk_cache: bool = True) -> ProjectSummary:
+    """The current summary. The disk cache is only read for the first build
+    and only written once the registry has finished its initial scan, so
+    the content walk in cache_key doesn't run on every fallback refresh."""
+    global _summary
+    asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    loading = asset_registry.is_loading_assets()
+
+    if _summary is not None and not _summary.is_stale():
+        if _summary.cache_pending and not loading:
+            # Completed by the registry events since the scan finished
+            write_cache(_summary, cache_key(_summary.rules))
+            _summary.cache_pending = False
+        return _summary
+
+    previous = _summary
+    if previous is not None:
+        previous.unsubscribe()
+
+    rules = load_rules()
+    summary = ProjectSummary(rules)
+    summary.subscribe()
+
+    key = None
+    data = None
+    # A registry that is still scanning has only part of the assets, a cache
+    # can't be checked against it and what it has mustn't be saved
+    if use_disk_cache and previous is None and not loading:
+        key = cache_key(rules)
+        data = read_cache(key)
+    if data is not None:
+        summary.from_cache(data)
+    else:
+        summary.seed()
+        summary.cache_pending = use_disk_cache and (
+            previous is None or previous.cache_pending
+        )
+        if summary.cache_pending and not loading:
+            write_cache(summary, key or cache_key(rules))
+            summary.cache_pending = False
+
+    _summary = summary
+    return summary
+
+
+def unregister():
+    global _summary
+    if _summary is not None:
+        _summary.unsubscribe()
+        _summary = None
@@ -0,0 +1,346 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+import heapq
+import math
+import unreal
+
+from . import actor_table
+from . import map_stats
+from . import profiler
+
+# Cells are sized for about this many actors each when the index is built
+ACTORS_PER_CELL = 4
+MIN_CELL_SIZE = 100.0
+DEFAULT_CELL_SIZE = 1000.0
+# Actors covering more cells than this (landscapes, sky spheres, volumes)
+# are kept out of the grid and checked by every query
+MAX_CELLS_PER_ENTRY = 64
+# Once actors have moved this many cells apart the cell size no longer fits
+# the level and the grid is built again
+MAX_GRID_SPAN = 4096
+
+Point = Tuple[float, float, float]
+Cell = Tuple[int, int]
+
+
+class Entry:
+    """Where one actor is: its pivot and its bounding box."""
+
+    __slots__ = ("name", "actor", "location", "low", "high", "class_name")
+
+    def __init__(self, name: str, actor, location: Point, low: Point, high: Point):
+        self.name = name
+        self.actor = actor
+        self.location = location
+        self.low = low
+        self.high = high
+        # Read on the first query that filters or reports by class
+        self.class_name: Optional[str] = None
+
+    def get_class_name(self) -> str:
+        if self.class_name is None:
+            self.class_name = map_stats.class_name_of(self.actor)
+        return self.class_name
+
+
+def read_entry(name: str, actor) -> Entry:
+    location = actor.get_actor_location()
+    origin, extent = actor.get_actor_bounds(False)
+    point = (location.x, location.y, location.z)
+    if extent.x == 0.0 and extent.y == 0.0 and extent.z == 0.0:
+        # Nothing to draw or collide with, the pivot is all there is
+        return Entry(name, actor, point, point, point)
+    low = (origin.x - extent.x, origin.y - extent.y, origin.z - extent.z)
+    high = (origin.x + extent.x, origin.y + extent.y, origin.z + extent.z)
+    return Entry(name, actor, point, low, high)
+
+
+def distance(a: Point, b: Point) -> float:
+    return math.sqrt((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2)
+
+
+def contains(low: Point, high: Point, point: Point) -> bool:
+    return all(low[axis] <= point[axis] <= high[axis] for axis in range(3))
+
+
+def overlaps(low: Point, high: Point, other_low: Point, other_high: Point) -> bool:
+    return all(
+        low[axis] <= other_high[axis] and other_low[axis] <= high[axis]
+        for axis in range(3)
+    )
+
+
+class SpatialIndex:
+    """Uniform grid over the XY plane of actor pivots and bounds.
+
+    Each actor is filed under every cell its bounds and pivot touch, so box
+    and radius queries only look at the cells they cover. The index is kept
+    current by replaying the actor table's changes since its version rather
+    than reading every actor again.
+    """
+
+    def __init__(self, world_path: str, cell_size: float):
+        self.world_path = world_path
+        self.cell_size = cell_size
+        self.version: Optional[int] = None
+        self.entries: Dict[str, Entry] = {}
+        self.cells: Dict[Cell, Set[str]] = {}
+        self.entry_cells: Dict[str, Tuple[int, int, int, int]] = {}
+        self.oversized: Set[str] = set()
+        # Range of cell indices ever used, bounds the nearest neighbour search
+        self.span: Optional[List[int]] = None
+
+    @classmethod
+    def build(
+        cls, world_path: str, version: Optional[int], all_actors
+    ) -> "SpatialIndex":
+        entries = []
+        for actor in all_actors:
+            try:
+                entries.append(read_entry(actor.get_name(), actor))
+            except Exception:
+                # The actor went away while the level was walked
+                continue
+
+        cell_size = DEFAULT_CELL_SIZE
+        if entries:
+            xs = [entry.location[0] for entry in entries]
+            ys = [entry.location[1] for entry in entries]
+            area = (max(xs) - min(xs)) * (max(ys) - min(ys))
+            if area > 0.0:
+                cell_size = max(
+                    MIN_CELL_SIZE, math.sqrt(area * ACTORS_PER_CELL / len(entries))
+                )
+
+        index = cls(world_path, cell_size)
+        index.version = version
+        for entry in entries:
+            index.insert(entry)
+        return index
+
+    # Maintenance
+
+    def cell_range(self, low: Point, high: Point) -> Tuple[int, int, int, int]:
+        size = self.cell_size
+        return (
+            math.floor(low[0] / size),
+            math.floor(low[1] / size),
+            math.floor(high[0] / size),
+            math.floor(high[1] / size),
+        )
+
+    def insert(self, entry: Entry):
+        self.remove(entry.name)
+        self.entries[entry.name] = entry
+        low = tuple(min(entry.low[axis], entry.location[axis]) for axis in range(3))
+        high = tuple(max(entry.high[axis], entry.location[axis]) for axis in range(3))
+        ix0, iy0, ix1, iy1 = self.cell_range(low, high)
+        if (ix1 - ix0 + 1) * (iy1 - iy0 + 1) > MAX_CELLS_PER_ENTRY:
+            self.oversized.add(entry.name)
+            return
+
+        self.entry_cells[entry.name] = (ix0, iy0, ix1, iy1)
+        for ix in range(ix0, ix1 + 1):
+            for iy in range(iy0, iy1 + 1):
+                self.cells.setdefault((ix, iy), set()).add(entry.name)
+        if self.span is None:
+            self.span = [ix0, iy0, ix1, iy1]
+        else:
+            span = self.span
+            span[0], span[1] = min(span[0], ix0), min(span[1], iy0)
+            span[2], span[3] = max(span[2], ix1), max(span[3], iy1)
+
+    def remove(self, name: str):
+        if self.entries.pop(name, None) is None:
+            return
+        self.oversized.discard(name)
+        cells = self.entry_cells.pop(name, None)
+        if cells is None:
+            return
+        ix0, iy0, ix1, iy1 = cells
+        for ix in range(ix0, ix1 + 1):
+            for iy in range(iy0, iy1 + 1):
+                names = self.cells.get((ix, iy))
+                if names is not None:
+                    names.discard(name)
+                    if not names:
+                        del self.cells[(ix, iy)]
+
+    def apply(self, changes: Dict[str, Any], version: int) -> int:
+        """Apply actor table changes and return how many actors were read."""
+        for name in changes["removed"]:
+            self.remove(name)
+        updated = 0
+        for name, actor in changes["added"] + changes["modified"]:
+            try:
+                self.insert(read_entry(name, actor))
+                updated += 1
+            except Exception:
+                # Changed and then deleted before this query
+                self.remove(name)
+        self.version = version
+        return updated
+
+    def is_misfit(self) -> bool:
+        if self.span is None:
+            return False
+        ix0, iy0, ix1, iy1 = self.span
+        return max(ix1 - ix0, iy1 - iy0) > MAX_GRID_SPAN
+
+    # Queries
+
+    def candidates(self, low: Point, high: Point) -> Iterable[Entry]:
+        """Entries filed under any cell overlapping the XY extent of a box."""
+        ix0, iy0, ix1, iy1 = self.cell_range(low, high)
+        if (ix1 - ix0 + 1) * (iy1 - iy0 + 1) > len(self.cells):
+            # Fewer occupied cells than cells in the box
+            keys: Iterable[Cell] = [
+                key
+                for key in self.cells
+                if ix0 <= key[0] <= ix1 and iy0 <= key[1] <= iy1
+            ]
+        else:
+            keys = (
+                (ix, iy) for ix in range(ix0, ix1 + 1) for iy in range(iy0, iy1 + 1)
+            )
+        seen = set(self.oversized)
+        for name in self.oversized:
+            yield self.entries[name]
+        for key in keys:
+            for name in self.cells.get(key, ()):
+                if name not in seen:
+                    seen.add(name)
+                    yield self.entries[name]
+
+    def within_radius(self, center: Point, radius: float) -> List[Tuple[float, Entry]]:
+        low = (center[0] - radius, center[1] - radius, center[2] - radius)
+        high = (center[0] + radius, center[1] + radius, center[2] + radius)
+        found = []
+        for entry in self.candidates(low, high):
+            gap = distance(center, entry.location)
+            if gap <= radius:
+                found.append((gap, entry))
+        found.sort(key=lambda item: (item[0], item[1].name))
+        return found
+
+    def within_box(self, low: Point, high: Point) -> List[Entry]:
+        return [
+            entry
+            for entry in self.candidates(low, high)
+            if contains(low, high, entry.location)
+        ]
+
+    def overlapping(self, low: Point, high: Point) -> List[Entry]:
+        return [
+            entry
+            for entry in self.candidates(low, high)
+            if overlaps(low, high, entry.low, entry.high)
+        ]
+
+    def nearest(
+        self,
+        center: Point,
+        count: int,
+        max_distance: Optional[float] = None,
+        accept: Optional[Callable[[Entry], bool]] = None,
+    ) -> List[Tuple[float, Entry]]:
+        """The count closest accepted actors by pivot, searching outwards ring
+        by ring from the cell holding center."""
+        # Max heap of the best so far as (-distance, name, entry)
+        best: List[Tuple[float, str, Entry]] = []
+        seen: Set[str] = set()
+
+        def consider(name: str):
+            if name in seen:
+                return
+            seen.add(name)
+            entry = self.entries[name]
+            gap = distance(center, entry.location)
+            if max_distance is not None and gap > max_distance:
+                return
+            if accept is not None and not accept(entry):
+                return
+            if len(best) < count:
+                heapq.heappush(best, (-gap, name, entry))
+            elif gap < -best[0][0]:
+                heapq.heapreplace(best, (-gap, name, entry))
+
+        for name in self.oversized:
+            consider(name)
+
+        if self.span is not None:
+            size = self.cell_size
+            cx, cy = math.floor(center[0] / size), math.floor(center[1] / size)
+            ix0, iy0, ix1, iy1 = self.span
+            # Rings closer than the occupied cells are empty
+            first_ring = max(ix0 - cx, cx - ix1, iy0 - cy, cy - iy1, 0)
+            last_ring = max(cx - ix0, ix1 - cx, cy - iy0, iy1 - cy, 0)
+            for ring in range(first_ring, last_ring + 1):
+                # Cells from this ring outwards are at least this far away
+                reach = max(0, ring - 1) * size
+                if len(best) == count and -best[0][0] <= reach:
+                    break
+                if max_distance is not None and reach > max_distance:
+                    break
+                if len(seen) >= len(self.entries):
+                    break
+                for ix in range(max(cx - ring, ix0), min(cx + ring, ix1) + 1):
+                    if ix in (cx - ring, cx + ring):
+                        rows: Iterable[int] = range(
+                            max(cy - ring, iy0), min(cy + ring, iy1) + 1
+                        )
+                    else:
+                        rows = (cy - ring, cy + ring)
+                    for iy in rows:
+                        for name in self.cells.get((ix, iy), ()):
+                            consider(name)
+
+        return sorted(
+            ((-gap, entry) for gap, _, entry in best),
+            key=lambda item: (item[0], item[1].name),
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "actors": len(self.entries),
+            "cells": len(self.cells),
+            "cell_size": round(self.cell_size, 2),
+            "oversized": len(self.oversized),
+            "version": self.version,
+        }
+
+
+_index: Optional[SpatialIndex] = None
+
+
+def get_index(world) -> Tuple[SpatialIndex, Dict[str, Any]]:
+    """The spatial index of the world brought up to date, and how that was
+    done: built from scratch, updated from actor changes or reused as is."""
+    global _index
+    world_path = world.get_path_name()
+    table = actor_table.get_table()
+    version = table.sync(world)
+
+    index = _index
+    if index is not None and index.world_path == world_path and not index.is_misfit():
+        if index.version == version:
+            return index, {"mode": "reused", "actors_read": 0}
+        changes = table.changes_since(index.version)
+        if changes is not None:
+            changed = sum(len(actors) for actors in changes.values())
+            # Past this point reading everything again is about as cheap
+            if changed <= len(index.entries) // 2:
+                with profiler.phase("update_spatial_index"):
+                    updated = index.apply(changes, version)
+                return index, {"mode": "updated", "actors_read": updated}
+
+    all_actors = unreal.get_editor_subsystem(
+        unreal.EditorActorSubsystem
+    ).get_all_level_actors()
+    with profiler.phase("build_spatial_index"):
+        _index = SpatialIndex.build(world_path, version, all_actors)
+    return _index, {"mode": "built", "actors_read": len(_index.entries)}
+
+
+def unregister():
+    global _index
+    _index = None
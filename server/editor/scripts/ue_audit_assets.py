@@ -0,0 +1,331 @@
+from collections import deque
+from typing import Any, Dict, List, Optional, Set, Tuple
+import json
+import os
+import re
+import time
+import unreal
+
+from . import asset_graph
+from . import channel
+from . import jobs
+from . import ue_export_asset
+
+REPORT_DIR = "rrmcp/asset_audits"
+
+# Projects can list extra root paths (packages or folders) that are loaded
+# by code or by name, as a JSON list in this config file
+ROOTS_FILE = "rrmcp_asset_roots.json"
+
+# Assets of these classes are entry points, nothing has to reference them
+ROOT_CLASSES = ("World",)
+
+# Packages under these mount points never reference project content
+SKIPPED_MOUNTS = ("/Script/", "/Engine/", "/Temp/", "/Memory/")
+
+# Hard and soft package references, without the asset manager's own
+# management references, which would root every primary asset's bundle
+DEPENDENCY_OPTIONS = (True, True)
+
+# Registry tags compared to tell duplicates apart, per class
+DUPLICATE_TAGS: Dict[str, Tuple[str, ...]] = {
+    "StaticMesh": ("Vertices", "Triangles", "LODs", "Materials"),
+    "SkeletalMesh": ("Vertices", "Triangles", "LODs", "Materials"),
+    "Texture2D": ("Dimensions", "Format"),
+    "SoundWave": ("Duration", "NumChannels", "SampleRate"),
+}
+# Files of tagged classes whose sizes differ less than this are alike,
+# untagged classes have to match to the byte
+SIZE_TOLERANCE = 0.02
+
+MAX_LISTED = 500
+PAGED_LISTS = ("unreferenced", "unreachable", "duplicates")
+PACKAGE_PATTERN = re.compile(r"/Game/[A-Za-z0-9_/\-]+")
+
+
+def config_roots() -> Set[str]:
+    """Packages named in the project's ini files (default maps, game modes,
+    asset manager settings) and in the roots file."""
+    roots: Set[str] = set()
+    config_dir = unreal.Paths.project_config_dir()
+    try:
+        names = os.listdir(config_dir)
+    except OSError:
+        return roots
+    for name in names:
+        path = os.path.join(config_dir, name)
+        try:
+            if name.endswith(".ini"):
+                with open(path, "r", encoding="utf-8", errors="replace") as f:
+                    roots.update(
+                        asset_graph.package_of(match.rstrip("/"))
+                        for match in PACKAGE_PATTERN.findall(f.read())
+                    )
+            elif name == ROOTS_FILE:
+                with open(path, "r", encoding="utf-8") as f:
+                    listed = json.load(f)
+                if isinstance(listed, list):
+                    roots.update(str(entry) for entry in listed)
+        except Exception:
+            continue
+    return roots
+
+
+def file_size(package_name: str) -> Optional[int]:
+    path = ue_export_asset.package_file(package_name)
+    if path is None:
+        return None
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return None
+
+
+class Audit:
+    """Everything the audit job learns, filled in a step at a time."""
+
+    def __init__(self, path_prefix: str, root_paths: List[str]):
+        self.path_prefix = path_prefix
+        self.root_paths = root_paths
+        # object path -> (package, class)
+        self.assets: Dict[str, Tuple[str, str]] = {}
+        self.packages: Set[str] = set()
+        self.roots: Set[str] = set()
+        # Scanned packages outside the prefix, assumed to be in use
+        self.external: Set[str] = set()
+        # package -> packages it depends on, within the scanned packages
+        self.dependencies: Dict[str, List[str]] = {}
+        self.referencer_counts: Dict[str, int] = {}
+        # (class, tag values) -> [(size, object path)]
+        self.signatures: Dict[tuple, List[Tuple[Optional[int], str]]] = {}
+
+    def in_scope(self, package: str) -> bool:
+        return package.startswith(self.path_prefix)
+
+    def is_root_path(self, package: str) -> bool:
+        return any(
+            package == root or package.startswith(root.rstrip("/") + "/")
+            for root in self.root_paths
+        )
+
+    def scan(self, asset):
+        package = str(asset.package_name)
+        if package.startswith(SKIPPED_MOUNTS):
+            return
+        class_name = str(asset.asset_class_path.asset_name)
+        path = f"{package}.{asset.asset_name}"
+        self.assets[path] = (package, class_name)
+        self.packages.add(package)
+        if not self.in_scope(package):
+            self.external.add(package)
+            return
+
+        if class_name in ROOT_CLASSES or self.is_root_path(package):
+            self.roots.add(package)
+        elif asset.get_tag_value("PrimaryAssetType"):
+            # Found by the asset manager through its type, not by reference
+            self.roots.add(package)
+
+        tags = DUPLICATE_TAGS.get(class_name, ())
+        values = tuple(asset.get_tag_value(tag) for tag in tags)
+        size = file_size(package)
+        if size is None and not any(values):
+            # Nothing to compare
+            return
+        self.signatures.setdefault((class_name, values), []).append((size, path))
+
+    def add_dependencies(self, package: str, graph: asset_graph.AssetGraph):
+        found = []
+        for target in graph.dependencies_of(package, DEPENDENCY_OPTIONS):
+            if target in self.packages and target != package:
+                found.append(target)
+                counts = self.referencer_counts
+                counts[target] = counts.get(target, 0) + 1
+        self.dependencies[package] = found
+
+    def reachable(self) -> Set[str]:
+        seen = self.roots | self.external
+        queue = deque(seen)
+        while queue:
+            for target in self.dependencies.get(queue.popleft(), ()):
+                if target not in seen:
+                    seen.add(target)
+                    queue.append(target)
+        return seen
+
+    def duplicate_groups(self) -> List[Dict[str, Any]]:
+        groups = []
+        for (class_name, values), members in self.signatures.items():
+            if len(members) < 2:
+                continue
+            tolerance = SIZE_TOLERANCE if any(values) else 0.0
+            members.sort(key=lambda member: (member[0] or 0, member[1]))
+            cluster = [members[0]]
+            for member in members[1:] + [None]:
+                # Against the smallest member, so small steps can't chain
+                # into a cluster spanning more than the tolerance
+                first_size = cluster[0][0]
+                if member is not None and (
+                    member[0] == first_size
+                    or (
+                        member[0] is not None
+                        and first_size is not None
+                        and member[0] - first_size <= first_size * tolerance
+                    )
+                ):
+                    cluster.append(member)
+                    continue
+                if len(cluster) > 1:
+                    sizes = [size for size, _ in cluster if size is not None]
+                    tags = DUPLICATE_TAGS.get(class_name, ())
+                    groups.append(
+                        {
+                            "class": class_name,
+                            "tags": dict(zip(tags, values)),
+                            "size": max(sizes) if sizes else None,
+                            "count": len(cluster),
+                            "assets": [path for _, path in cluster],
+                        }
+                    )
+                if member is not None:
+                    cluster = [member]
+        # Most wasted bytes first
+        groups.sort(key=lambda group: -(group["size"] or 0) * (group["count"] - 1))
+        return groups
+
+    def results(self) -> Dict[str, Any]:
+        reachable = self.reachable()
+        unreferenced = []
+        unreachable = []
+        for path, (package, class_name) in sorted(self.assets.items()):
+            if not self.in_scope(package) or package in self.roots:
+                continue
+            if not self.referencer_counts.get(package):
+                unreferenced.append({"path": path, "class": class_name})
+            elif package not in reachable:
+                # Only referenced by other assets that are themselves unused
+                unreachable.append({"path": path, "class": class_name})
+        return {
+            "unreferenced": unreferenced,
+            "unreachable": unreachable,
+            "duplicates": self.duplicate_groups(),
+        }
+
+
+def report_path(job_id: str) -> str:
+    return os.path.join(
+        unreal.Paths.project_saved_dir(), REPORT_DIR, f"asset_audit_{job_id}.json"
+    )
+
+
+def write_report(path: str, data: Dict[str, Any]):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1)
+    os.replace(temp_path, path)
+
+
+def start_audit_job(
+    path_prefix: str = "/Game/",
+    root_paths: Optional[List[str]] = None,
+) -> jobs.Job:
+    asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    all_assets = asset_registry.get_all_assets()
+    audit = Audit(path_prefix, list(root_paths or []) + sorted(config_roots()))
+
+    state: Dict[str, Any] = {
+        "phase": "scan_assets",
+        "path_prefix": path_prefix,
+        "summary": None,
+        "results": None,
+        "report_path": None,
+    }
+
+    def work():
+        for asset in all_assets:
+            audit.scan(asset)
+            yield
+
+        # The job's total was a guess until the packages were known
+        job.total = len(all_assets) + len(audit.packages) + 1
+        state["phase"] = "read_dependencies"
+        graph = asset_graph.get_graph()
+        for package in sorted(audit.packages):
+            audit.add_dependencies(package, graph)
+            yield
+
+        state["phase"] = "analyze"
+        results = audit.results()
+        summary = {
+            "assets_scanned": sum(
+                1 for package, _ in audit.assets.values() if audit.in_scope(package)
+            ),
+            "packages_read": len(audit.packages),
+            "roots": len(audit.roots),
+            "unreferenced": len(results["unreferenced"]),
+            "unreachable": len(results["unreachable"]),
+            "duplicate_groups": len(results["duplicates"]),
+            "duplicate_assets": sum(
+                group["count"] for group in results["duplicates"]
+            ),
+        }
+        path = report_path(job.id)
+        write_report(
+            path,
+            {
+                "generated_at": time.time(),
+                # Started after the registry's initial scan, see main
+                "registry_complete": True,
+                "path_prefix": path_prefix,
+                "root_paths": audit.root_paths,
+                "summary": summary,
+                **results,
+            },
+        )
+        state["summary"] = summary
+        state["results"] = results
+        state["report_path"] = path
+        state["phase"] = "done"
+        yield
+
+    def report(state: Dict[str, Any], offset: int, limit: int) -> Dict[str, Any]:
+        payload = {
+            "phase": state["phase"],
+            "path_prefix": state["path_prefix"],
+            "summary": state["summary"],
+            "report_path": state["report_path"],
+        }
+        results = state["results"]
+        if results is not None and limit:
+            # The same page of every list, each says whether it has more
+            limit = min(limit, MAX_LISTED)
+            next_offset = offset + limit
+            more = {}
+            for name in PAGED_LISTS:
+                items = results[name]
+                payload[name] = items[offset:next_offset]
+                more[name] = next_offset < len(items)
+            payload["more"] = more
+            payload["next_offset"] = next_offset if any(more.values()) else None
+        return payload
+
+    # Every asset is scanned and most are their own package
+    job = jobs.Job("audit_assets", work(), len(all_assets) * 2 + 1, state, report)
+    return jobs.start(job)
+
+
+def main(path_prefix: str = "/Game/", root_paths: Optional[List[str]] = None):
+    asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    if asset_registry.is_loading_assets():
+        # Referencers not scanned yet would make their assets look unused
+        channel.send(
+            {
+                "error": "The asset registry is still scanning, "
+                "audit once it has finished",
+                "registry_complete": False,
+            }
+        )
+        return
+    job = start_audit_job(path_prefix, root_paths)
+    channel.send(job.describe(0, 0))
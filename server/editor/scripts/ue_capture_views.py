@@ -0,0 +1,199 @@
+from typing import Any, Dict, List, Optional
+import unreal
+import math
+import os
+import time
+
+from . import actor_lookup
+from . import capture
+from . import channel
+from . import jobs
+
+MAX_VIEWS = 64
+
+# A view is given up on when its capture hasn't been written by then
+VIEW_TIMEOUT_SECONDS = 10.0
+
+# Horizontal field of view assumed when fitting an orbit around its target
+ORBIT_FOV_DEGREES = 90.0
+
+
+def orbit_target(orbit: Dict[str, Any]):
+    """Center and extent of the orbit target as [x, y, z] lists."""
+    actor_name = orbit.get("actor_name")
+    if actor_name:
+        actor = actor_lookup.get_lookup().find(actor_name)
+        if actor is None:
+            raise ValueError(f"Actor not found: {actor_name}")
+        origin, box_extent = actor.get_actor_bounds(False)
+        return (
+            [origin.x, origin.y, origin.z],
+            [box_extent.x, box_extent.y, box_extent.z],
+        )
+    center = orbit.get("center")
+    if not center:
+        raise ValueError("orbit needs an actor_name or a center")
+    extent = orbit.get("extent") or {"x": 100.0, "y": 100.0, "z": 100.0}
+    return (
+        [center["x"], center["y"], center["z"]],
+        [extent["x"], extent["y"], extent["z"]],
+    )
+
+
+def orbit_views(orbit: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Views looking at the target, count yaw steps for each pitch."""
+    center, extent = orbit_target(orbit)
+    count = max(1, int(orbit.get("count", 8)))
+    pitches = orbit.get("pitches") or [-20.0]
+
+    radius = orbit.get("radius")
+    if not radius:
+        # Far enough for the bounding sphere to fit the field of view
+        sphere = math.sqrt(sum(axis * axis for axis in extent))
+        radius = max(sphere / math.sin(math.radians(ORBIT_FOV_DEGREES / 2)) * 1.1, 50.0)
+
+    views = []
+    for pitch in pitches:
+        for step in range(count):
+            yaw = 360.0 * step / count
+            # The camera sits behind the target along its forward vector
+            cos_pitch = math.cos(math.radians(pitch))
+            forward = [
+                cos_pitch * math.cos(math.radians(yaw)),
+                cos_pitch * math.sin(math.radians(yaw)),
+                math.sin(math.radians(pitch)),
+            ]
+            location = [c - f * radius for c, f in zip(center, forward)]
+            views.append(
+                {
+                    "location": dict(zip("xyz", location)),
+                    "rotation": {"pitch": pitch, "yaw": yaw, "roll": 0.0},
+                }
+            )
+    return views
+
+
+def start_capture_job(
+    views: List[Dict[str, Any]],
+    width: int,
+    height: int,
+    image_format: str,
+    quality: int,
+) -> jobs.Job:
+    """Capture each view in turn on the editor tick, then restore the camera.
+
+    Every view is requested only after the previous capture was written, so
+    the whole batch costs the render time of its frames and a single call.
+    """
+    for index, view in enumerate(views):
+        view["index"] = index
+        view["path"] = capture.temp_image_path(image_format)
+
+    original_camera = unreal.EditorLevelLibrary.get_level_viewport_camera_info()
+    state = {"format": image_format, "captured": [], "failed": []}
+
+    def work():
+        try:
+            for view in views:
+                location = view["location"]
+                rotation = view["rotation"]
+                unreal.EditorLevelLibrary.set_level_viewport_camera_info(
+                    unreal.Vector(location["x"], location["y"], location["z"]),
+                    unreal.Rotator(
+                        rotation.get("roll", 0.0), rotation["pitch"], rotation["yaw"]
+                    ),
+                )
+
+                source = (
+                    view["path"]
+                    if image_format == "png"
+                    else capture.temp_image_path("png")
+                )
+                unreal.AutomationLibrary.take_high_res_screenshot(
+                    width, height, source
+                )
+
+                deadline = time.time() + VIEW_TIMEOUT_SECONDS
+                complete = capture.capture_complete(source)
+                while not complete and time.time() < deadline:
+                    yield jobs.WAIT
+                    complete = capture.capture_complete(source)
+
+                if not complete:
+                    state["failed"].append(view["index"])
+                elif source != view["path"]:
+                    try:
+                        capture.convert_image(source, view["path"], quality)
+                    finally:
+                        os.remove(source)
+                    state["captured"].append(view["index"])
+                else:
+                    state["captured"].append(view["index"])
+                yield
+        finally:
+            # None without an active level viewport, nothing to restore then
+            if original_camera:
+                unreal.EditorLevelLibrary.set_level_viewport_camera_info(
+                    *original_camera
+                )
+
+    def report(state: Dict[str, Any], offset: int, limit: int) -> Dict[str, Any]:
+        return {
+            "format": state["format"],
+            "captured": state["captured"],
+            "failed": state["failed"],
+        }
+
+    return jobs.start(jobs.Job("capture_views", work(), len(views), state, report))
+
+
+def capture_views(
+    views: Optional[List[Dict[str, Any]]] = None,
+    orbit: Optional[Dict[str, Any]] = None,
+    width: int = 640,
+    height: int = 520,
+    image_format: str = "png",
+    quality: int = 85,
+) -> Dict[str, Any]:
+    if image_format not in ("png", "jpg"):
+        return {"error": f"Unknown format {image_format}, use png or jpg"}
+
+    try:
+        planned = list(views or [])
+        if orbit:
+            planned.extend(orbit_views(orbit))
+    except Exception as e:
+        return {"error": str(e)}
+
+    if not planned:
+        return {"error": "No views given, pass views or an orbit"}
+    if len(planned) > MAX_VIEWS:
+        return {"error": f"Too many views ({len(planned)}), at most {MAX_VIEWS} per call"}
+
+    job = start_capture_job(
+        planned,
+        capture.clamp_resolution(width),
+        capture.clamp_resolution(height),
+        image_format,
+        max(1, min(int(quality), 100)),
+    )
+    return {
+        "job_id": job.id,
+        "format": image_format,
+        "views": planned,
+    }
+
+
+def main(
+    views: Optional[List[Dict[str, Any]]] = None,
+    orbit: Optional[Dict[str, Any]] = None,
+    width: int = 640,
+    height: int = 520,
+    format: str = "png",
+    quality: int = 85,
+):
+    try:
+        result = capture_views(views, orbit, width, height, format, quality)
+    except Exception as e:
+        result = {"error": f"Failed to capture views: {str(e)}"}
+    channel.send(result)
@@ -0,0 +1,59 @@
+from typing import Dict, Any, List
+import unreal
+
+from . import channel
+from . import ue_create_object
+
+MAX_OBJECTS = 50000
+
+
+def create_objects(objects: List[Dict[str, Any]]) -> Dict[str, Any]:
+    try:
+        world = unreal.get_editor_subsystem(
+            unreal.UnrealEditorSubsystem
+        ).get_editor_world()
+        if not world:
+            return {"error": "No world loaded"}
+
+        if len(objects) > MAX_OBJECTS:
+            return {"error": f"Too many objects, at most {MAX_OBJECTS} per call"}
+
+        cache = ue_create_object.SpawnCache()
+        actor_names: List[Any] = []
+        errors = []
+
+        # One undo step for the whole batch
+        with unreal.ScopedEditorTransaction(f"MCP Create {len(objects)} Objects"):
+            for index, spec in enumerate(objects):
+                try:
+                    actor = ue_create_object.spawn_object(
+                        cache,
+                        spec["object_class"],
+                        spec.get("object_name") or "",
+                        spec.get("location"),
+                        spec.get("rotation"),
+                        spec.get("scale"),
+                        spec.get("properties"),
+                    )
+                    actor_names.append(actor.get_name())
+                except Exception as e:
+                    actor_names.append(None)
+                    errors.append({"index": index, "error": str(e)})
+
+        return {
+            "success": not errors,
+            "total_requested": len(objects),
+            "created": len(objects) - len(errors),
+            "actor_names": actor_names,
+            "errors": errors,
+            "classes_resolved": len(cache.classes),
+            "assets_loaded": len(cache.assets),
+        }
+
+    except Exception as e:
+        return {"error": f"Failed to create objects: {str(e)}"}
+
+
+def main(objects: List[Dict[str, Any]]):
+    result = create_objects(objects)
+    channel.send(result)
@@ -1,63 +1,78 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import unreal
-import json
+
+from . import actor_lookup
+from . import channel
+
+
+def describe_actor(actor) -> Dict[str, Any]:
+    location = actor.get_actor_location()
+    return {
+        "actor_name": actor.get_name(),
+        "actor_label": actor.get_actor_label(),
+        "class": actor.get_class().get_name(),
+        "location": {
+            "x": location.x,
+            "y": location.y,
+            "z": location.z,
+        },
+    }
+
+
+def delete_objects(actor_names: List[str]) -> List[Dict[str, Any]]:
+    world = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem).get_editor_world()
+    if not world:
+        return [{"error": "No world loaded"} for _ in actor_names]
+
+    lookup = actor_lookup.get_lookup()
+    found = lookup.find_many(actor_names)
+
+    # Resolve and describe every actor first, then destroy them in one call
+    results: List[Optional[Dict[str, Any]]] = []
+    targets = []
+    seen = set()
+    for actor_name in actor_names:
+        actor = found.get(actor_name)
+        if actor is None or id(actor) in seen:
+            results.append({"error": f"Actor not found: {actor_name}"})
+            continue
+        seen.add(id(actor))
+        try:
+            info = describe_actor(actor)
+        except Exception as e:
+            results.append({"error": f"Failed to delete object: {str(e)}"})
+            continue
+        targets.append((len(results), actor_name, actor, info))
+        results.append(None)
+
+    if targets:
+        actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+        success = actor_subsystem.destroy_actors([actor for _, _, actor, _ in targets])
+
+        for position, actor_name, actor, info in targets:
+            if success:
+                lookup.discard(actor, info["actor_name"], info["actor_label"])
+                results[position] = {
+                    "success": True,
+                    "message": f"Successfully deleted actor: {actor_name}",
+                    "deleted_actor": info,
+                }
+            else:
+                results[position] = {"error": f"Failed to delete actor: {actor_name}"}
+
+    return results
 
 
 def delete_object(actor_name: str) -> Dict[str, Any]:
     try:
-        world = unreal.get_editor_subsystem(
-            unreal.UnrealEditorSubsystem
-        ).get_editor_world()
-        if not world:
-            return {"error": "No world loaded"}
-
-        all_actors = unreal.get_editor_subsystem(
-            unreal.EditorActorSubsystem
-        ).get_all_level_actors()
-        target_actor = None
-
-        for actor in all_actors:
-            if actor.get_name() == actor_name or actor.get_actor_label() == actor_name:
-                target_actor = actor
-                break
-
-        if not target_actor:
-            return {"error": f"Actor not found: {actor_name}"}
-
-        actor_info = {
-            "actor_name": target_actor.get_name(),
-            "actor_label": target_actor.get_actor_label(),
-            "class": target_actor.get_class().get_name(),
-            "location": {
-                "x": target_actor.get_actor_location().x,
-                "y": target_actor.get_actor_location().y,
-                "z": target_actor.get_actor_location().z,
-            },
-        }
-
-        success = unreal.get_editor_subsystem(
-            unreal.EditorActorSubsystem
-        ).destroy_actor(target_actor)
-
-        if success:
-            return {
-                "success": True,
-                "message": f"Successfully deleted actor: {actor_name}",
-                "deleted_actor": actor_info,
-            }
-        else:
-            return {"error": f"Failed to delete actor: {actor_name}"}
-
+        return delete_objects([actor_name])[0]
     except Exception as e:
         return {"error": f"Failed to delete object: {str(e)}"}
 
 
 def delete_multiple_objects(actor_names: List[str]) -> Dict[str, Any]:
     try:
-        results = []
-        for actor_name in actor_names:
-            result = delete_object(actor_name)
-            results.append(result)
+        results = delete_objects([str(actor_name) for actor_name in actor_names])
 
         return {
             "success": True,
@@ -69,8 +84,8 @@ def delete_multiple_objects(actor_names: List[str]) -> Dict[str, Any]:
         return {"error": f"Failed to delete multiple objects: {str(e)}"}
 
 
-def main():
-    actor_names_input = "${actor_names}"
+def main(actor_names: str):
+    actor_names_input = actor_names
 
     try:
         import ast
@@ -83,8 +98,4 @@ def main():
     except Exception:
         result = delete_object(actor_names_input)
 
-    print(json.dumps(result, indent=2))
-
-
-if __name__ == "__main__":
-    main()
+    channel.send(result)
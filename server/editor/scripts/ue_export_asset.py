@@ -1,9 +1,68 @@
+from typing import Any, Dict, List, Optional, Set
 import unreal
-import sys
-import tempfile
+import base64
+import hashlib
+import json
+import os
+import secrets
 
+from . import channel
 
-def export_asset(asset_path: str) -> bytes:
+EXPORT_SUFFIX = ".uasset.copy"
+
+# Exports are kept under the project's Saved dir and named after the asset
+# path plus the save stamp of its package, so an unchanged asset is only
+# exported once
+CACHE_DIR = "rrmcp/exports"
+MAX_CACHE_BYTES = 1024 * 1024 * 1024
+
+DEFAULT_CHUNK_BYTES = 1024 * 1024
+# Total base64 payload of one call, across all the requested assets
+MAX_CHUNK_BYTES = 8 * 1024 * 1024
+
+MAX_ASSETS = 1000
+HASH_BLOCK_BYTES = 1024 * 1024
+
+
+def cache_dir() -> str:
+    return os.path.join(unreal.Paths.project_saved_dir(), CACHE_DIR)
+
+
+def package_file(package_name: str) -> Optional[str]:
+    """On-disk file of a /Game package, None for other mount points."""
+    if not package_name.startswith("/Game/"):
+        return None
+    base = os.path.join(
+        unreal.Paths.project_content_dir(), package_name[len("/Game/") :]
+    )
+    for extension in (".uasset", ".umap"):
+        if os.path.isfile(base + extension):
+            return base + extension
+    return None
+
+
+def dirty_package_names() -> Set[str]:
+    try:
+        return {
+            package.get_name()
+            for package in unreal.EditorLoadingAndSavingUtils.get_dirty_content_packages()
+        }
+    except Exception:
+        return set()
+
+
+def save_stamp(package_name: str, dirty_packages: Set[str]) -> Optional[str]:
+    """Changes on every save of the package, None when it can't be trusted."""
+    if package_name in dirty_packages:
+        return None
+    path = package_file(package_name)
+    if path is None:
+        return None
+    stat = os.stat(path)
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def run_export(asset_path: str, export_file_path: str):
     asset = unreal.EditorAssetLibrary.load_asset(asset_path)
 
     if not asset:
@@ -15,11 +74,6 @@ def export_asset(asset_path: str) -> bytes:
     export_task.replace_identical = True
     export_task.exporter = None
     export_task.object = asset
-
-    temp_file = tempfile.NamedTemporaryFile(delete=True, suffix=".uasset.copy")
-
-    export_file_path = temp_file.name
-
     export_task.filename = export_file_path
 
     result = unreal.Exporter.run_asset_export_task(export_task)
@@ -29,17 +83,155 @@ def export_asset(asset_path: str) -> bytes:
             f"Failed to export asset {asset.get_name()} to {export_file_path}"
         )
 
-    file = open(export_file_path, "rb")
-    data = file.read()
-    file.close()
-    temp_file.close()
-    return data
 
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_BYTES), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def export_cached(asset_path: str, dirty_packages: Set[str]) -> Dict[str, Any]:
+    """Export an asset into the cache, or reuse the export of the same save."""
+    asset_data = unreal.EditorAssetLibrary.find_asset_data(asset_path)
+    if not asset_data.is_valid():
+        raise ValueError(f"Asset not found at {asset_path}")
+
+    directory = cache_dir()
+    os.makedirs(directory, exist_ok=True)
+
+    stamp = save_stamp(str(asset_data.package_name), dirty_packages)
+    if stamp is not None:
+        key = hashlib.sha1(f"{asset_path}|{stamp}".encode("utf-8")).hexdigest()
+    else:
+        # Unsaved changes, the export is one-off and left to pruning
+        key = "unsaved-" + secrets.token_hex(8)
+    path = os.path.join(directory, key + EXPORT_SUFFIX)
+    meta_path = os.path.join(directory, key + ".json")
+
+    if stamp is not None:
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if os.path.getsize(path) == meta["size"]:
+                # Touch it so recently used exports are pruned last
+                os.utime(path)
+                return {"asset_path": asset_path, "path": path, **meta, "cached": True}
+        except (OSError, ValueError, KeyError):
+            pass
+
+    # Export under a unique name first so readers never see a partial file
+    temp_path = os.path.join(directory, f"{key}-{secrets.token_hex(4)}{EXPORT_SUFFIX}")
+    try:
+        run_export(asset_path, temp_path)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    meta = {"size": os.path.getsize(path), "sha256": file_sha256(path)}
+    if stamp is not None:
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+    return {"asset_path": asset_path, "path": path, **meta, "cached": False}
+
+
+def prune(directory: str, keep: Set[str]):
+    """Drop the least recently used exports once the cache outgrows its cap."""
+    entries = []
+    total = 0
+    for entry in os.scandir(directory):
+        if entry.name.endswith(EXPORT_SUFFIX):
+            stat = entry.stat()
+            total += stat.st_size
+            entries.append((stat.st_mtime, entry.path, stat.st_size))
+    if total <= MAX_CACHE_BYTES:
+        return
+    for _, path, size in sorted(entries):
+        if path in keep:
+            continue
+        for stale in (path, path[: -len(EXPORT_SUFFIX)] + ".json"):
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+        total -= size
+        if total <= MAX_CACHE_BYTES:
+            break
+
+
+def read_chunk(path: str, offset: int, length: int) -> bytes:
+    with open(path, "rb") as f:
+        f.seek(offset)
+        return f.read(length)
+
+
+def export_assets(
+    asset_paths: List[str],
+    encoding: str = "base64",
+    offset: int = 0,
+    length: int = DEFAULT_CHUNK_BYTES,
+    offsets: Optional[Dict[str, int]] = None,
+) -> Dict[str, Any]:
+    """Export the assets and read a chunk of each. Files differ in size, so
+    a batch takes each asset's offset from offsets, a single asset may use
+    offset. Assets left once the call's budget is spent get no chunk and
+    budget_exhausted, to be asked for again."""
+    if encoding not in ("base64", "path"):
+        return {"error": f"Unknown encoding {encoding}, use base64 or path"}
+    if not asset_paths:
+        return {"error": "No asset paths given"}
+    if len(asset_paths) > MAX_ASSETS:
+        return {"error": f"Too many assets, at most {MAX_ASSETS} per call"}
+    if offset and len(asset_paths) > 1:
+        return {"error": "offset only applies to one asset, use offsets for a batch"}
+
+    offsets = dict(offsets or {})
+    if offset:
+        offsets.setdefault(asset_paths[0], offset)
+    budget = MAX_CHUNK_BYTES
+    dirty_packages = dirty_package_names()
+
+    exports = []
+    errors = []
+    for asset_path in asset_paths:
+        try:
+            record = export_cached(asset_path, dirty_packages)
+        except Exception as e:
+            errors.append({"asset_path": asset_path, "error": str(e)})
+            continue
+
+        if encoding == "base64":
+            start = max(0, offsets.get(asset_path, 0))
+            record["offset"] = start
+            if budget <= 0 and start < record["size"]:
+                record["budget_exhausted"] = True
+                record["next_offset"] = start
+                exports.append(record)
+                continue
+            data = read_chunk(record["path"], start, max(0, min(length, budget)))
+            budget -= len(data)
+            next_offset = start + len(data)
+            record["length"] = len(data)
+            record["data"] = base64.b64encode(data).decode("ascii")
+            record["next_offset"] = (
+                next_offset if next_offset < record["size"] else None
+            )
+        exports.append(record)
+
+    if exports:
+        prune(cache_dir(), {record["path"] for record in exports})
 
-def main():
-    data = export_asset("${asset_path}")
-    sys.stdout.buffer.write(data)
+    return {"exports": exports, "errors": errors}
 
 
-if __name__ == "__main__":
-    main()
+def main(
+    asset_paths: List[str],
+    encoding: str = "base64",
+    offset: int = 0,
+    length: int = DEFAULT_CHUNK_BYTES,
+    offsets: Optional[Dict[str, int]] = None,
+):
+    result = export_assets(asset_paths, encoding, offset, length, offsets)
+    channel.send(result)
@@ -0,0 +1,92 @@
+from typing import Any, Dict, List, Optional
+
+from . import asset_feed
+from . import channel
+
+DEFAULT_LIMIT = 500
+MAX_LIMIT = 5000
+
+
+def parse_cursor(cursor: str):
+    """(feed id, sequence) of a cursor, None if it can't be read."""
+    feed_id, _, sequence = cursor.partition(":")
+    try:
+        return feed_id, int(sequence)
+    except ValueError:
+        return None
+
+
+def get_asset_changes(
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_LIMIT,
+    event_types: Optional[List[str]] = None,
+    path_prefix: Optional[str] = None,
+) -> Dict[str, Any]:
+    unknown = set(event_types or []) - set(asset_feed.EVENT_TYPES)
+    if unknown:
+        return {
+            "error": f"Unknown event types {sorted(unknown)}, "
+            f"use {', '.join(asset_feed.EVENT_TYPES)}"
+        }
+
+    feed = asset_feed.get_feed()
+    feed.poll()
+
+    after = None
+    reset = False
+    if cursor:
+        parsed = parse_cursor(cursor)
+        if parsed is None or parsed[0] != feed.id or parsed[1] > feed.sequence:
+            # From before the helpers were last installed, or not a cursor
+            reset = True
+        else:
+            after = parsed[1]
+
+    wanted = set(event_types) if event_types else None
+
+    def accept(event: str, path: str) -> bool:
+        if wanted is not None and event not in wanted:
+            return False
+        return not path_prefix or path.startswith(path_prefix)
+
+    limit = max(1, min(limit, MAX_LIMIT))
+    found, last = feed.read(after, limit, accept)
+
+    result = {
+        "feed_id": feed.id,
+        "latest_sequence": feed.sequence,
+        "oldest_sequence": feed.oldest(),
+        "reset": reset,
+        "gap": None,
+        "events": found,
+        "next_cursor": f"{feed.id}:{last}",
+        "has_more": last < feed.sequence,
+        "subscribed": feed.subscribed,
+        "saved_events": feed.saved_events,
+    }
+    if reset:
+        result["message"] = (
+            "Cursor is from another session, rescan what you track and "
+            "continue from next_cursor"
+        )
+    elif after is not None and after < feed.oldest() - 1:
+        result["gap"] = {
+            "first_missed": after + 1,
+            "last_missed": feed.oldest() - 1,
+            "missed": feed.oldest() - 1 - after,
+        }
+        result["message"] = (
+            "Events were dropped since this cursor, rescan what you track and "
+            "continue from next_cursor"
+        )
+    return result
+
+
+def main(
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_LIMIT,
+    event_types: Optional[List[str]] = None,
+    path_prefix: Optional[str] = None,
+):
+    result = get_asset_changes(cursor, limit, event_types, path_prefix)
+    channel.send(result)
@@ -0,0 +1,96 @@
+from typing import Any, Dict, List, Optional
+
+from . import asset_graph
+from . import channel
+from . import profiler
+
+MAX_DEPTH = 32
+MAX_NODES = 20000
+
+
+def get_asset_graph(
+    asset_path: str,
+    direction: str = "referencers",
+    max_depth: int = 3,
+    include_hard: bool = True,
+    include_soft: bool = True,
+    class_filter: Optional[List[str]] = None,
+    max_nodes: int = 5000,
+    include_classes: bool = True,
+) -> Dict[str, Any]:
+    if direction not in ("referencers", "dependencies"):
+        return {"error": "direction must be 'referencers' or 'dependencies'"}
+    if not include_hard and not include_soft:
+        return {"error": "At least one of include_hard/include_soft must be set"}
+
+    graph = asset_graph.get_graph()
+    hits, misses = graph.hits, graph.misses
+    root = asset_graph.package_of(asset_path)
+
+    with profiler.phase("walk_graph"):
+        nodes, truncated = graph.walk(
+            root,
+            direction,
+            max(1, min(max_depth, MAX_DEPTH)),
+            (include_hard, include_soft),
+            max(1, min(max_nodes, MAX_NODES)),
+        )
+
+    classes = {name.lower() for name in class_filter} if class_filter else None
+    results = []
+    for package, depth, parent in nodes:
+        package_classes = (
+            [asset_class for _, asset_class in graph.assets_in(package)]
+            if classes is not None or include_classes
+            else None
+        )
+        if classes is not None and not any(
+            asset_class.lower() in classes for asset_class in package_classes
+        ):
+            continue
+        results.append(
+            {
+                "package": package,
+                "depth": depth,
+                "via": parent,
+                "classes": package_classes,
+            }
+        )
+
+    return {
+        "root": root,
+        "direction": direction,
+        "max_depth": max_depth,
+        "total_visited": len(nodes),
+        "total_matches": len(results),
+        "truncated": truncated,
+        "nodes": results,
+        "cache": {
+            "hits": graph.hits - hits,
+            "misses": graph.misses - misses,
+            "event_driven": graph.subscribed,
+        },
+    }
+
+
+def main(
+    asset_path: str,
+    direction: str = "referencers",
+    max_depth: int = 3,
+    include_hard: bool = True,
+    include_soft: bool = True,
+    class_filter: Optional[List[str]] = None,
+    max_nodes: int = 5000,
+    include_classes: bool = True,
+):
+    result = get_asset_graph(
+        asset_path,
+        direction,
+        max_depth,
+        include_hard,
+        include_soft,
+        class_filter,
+        max_nodes,
+        include_classes,
+    )
+    channel.send(result)
@@ -1,6 +1,7 @@
 from typing import List, Dict, Any
 import unreal
-import json
+
+from . import channel
 
 
 def get_asset_info(asset_path: str) -> List[Dict[str, Any]]:
@@ -78,10 +79,6 @@ def get_lod_info(asset_data) -> List[Dict[str, Any]]:
     return lod_levels
 
 
-def main():
-    asset_info = get_asset_info("${asset_path}")
-    print(json.dumps(asset_info))
-
-
-if __name__ == "__main__":
-    main()
+def main(asset_path: str):
+    asset_info = get_asset_info(asset_path)
+    channel.send(asset_info)
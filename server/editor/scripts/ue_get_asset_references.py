@@ -1,6 +1,8 @@
 from typing import List, Dict
 import unreal
-import json
+
+from . import asset_graph
+from . import channel
 
 
 def get_asset_references(asset_path: str) -> List[Dict[str, str]]:
@@ -8,24 +10,19 @@ def get_asset_references(asset_path: str) -> List[Dict[str, str]]:
 
     asset_data = asset_registry.get_asset_by_object_path(asset_path)
 
-    referencing_assets = asset_registry.get_referencers(
-        asset_data.package_name, unreal.AssetRegistryDependencyOptions()
-    )
+    # Referencers and the assets in each package come from the shared graph
+    # cache, repeated queries on shared assets don't go back to the registry
+    graph = asset_graph.get_graph()
+    referencing_assets = graph.referencers_of(str(asset_data.package_name))
 
     asset_paths = []
     for referencer in referencing_assets:
-        assets = asset_registry.get_assets_by_package_name(referencer)
-        for asset in assets:
-            [asset_class, asset_name] = asset.get_full_name().split(" ", 1)
+        for asset_name, asset_class in graph.assets_in(referencer):
             asset_paths.append({"name": asset_name, "class": asset_class})
 
     return asset_paths
 
 
-def main():
-    references = get_asset_references("${asset_path}")
-    print(json.dumps(references))
-
-
-if __name__ == "__main__":
-    main()
+def main(asset_path: str):
+    references = get_asset_references(asset_path)
+    channel.send(references)
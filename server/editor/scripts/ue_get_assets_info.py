@@ -0,0 +1,180 @@
+from typing import Any, Dict, List, Optional
+import os
+import unreal
+
+from . import asset_index
+from . import channel
+from . import paging
+from . import ue_export_asset
+from . import ue_get_asset_info
+
+# Answered from the search index, no registry call
+INDEX_FIELDS = ("name", "path", "class", "package", "package_path")
+# Need the asset's registry entry or its file, still without loading it
+REGISTRY_FIELDS = ("size", "is_u_asset", "is_asset_loaded")
+# Only these load the asset, and only when asked for
+LOAD_FIELDS = ("lods",)
+FIELDS = INDEX_FIELDS + REGISTRY_FIELDS + LOAD_FIELDS
+DEFAULT_FIELDS = ["name", "path", "class", "package_path"]
+
+# Classes the lods field can describe, others are never loaded for it
+LOD_CLASSES = ("StaticMesh", "SkeletalMesh")
+
+MAX_LIMIT = 1000
+
+
+def object_path_of(asset_path: str) -> str:
+    """Accept an object path (/Game/A/B.B) or a package name (/Game/A/B)."""
+    leaf = asset_path.rpartition("/")[2]
+    return asset_path if "." in leaf else f"{asset_path}.{leaf}"
+
+
+def describe(
+    index: asset_index.AssetIndex,
+    slot: int,
+    fields: List[str],
+    tags: List[str],
+    registry,
+) -> Dict[str, Any]:
+    package = index.package_names[slot]
+    info: Dict[str, Any] = {}
+    for field in fields:
+        if field == "name":
+            info["name"] = index.names[slot]
+        elif field == "path":
+            info["path"] = f"{package}.{index.names[slot]}"
+        elif field == "class":
+            info["class"] = index.classes[slot]
+        elif field == "package":
+            info["package"] = package
+        elif field == "package_path":
+            info["package_path"] = index.paths[slot]
+        elif field == "size":
+            file_path = ue_export_asset.package_file(package)
+            info["size"] = os.path.getsize(file_path) if file_path else None
+
+    wants_registry = tags or any(
+        field in fields for field in ("is_u_asset", "is_asset_loaded", "lods")
+    )
+    if not wants_registry:
+        return info
+
+    asset_data = registry.get_asset_by_object_path(f"{package}.{index.names[slot]}")
+    if not asset_data or not asset_data.is_valid():
+        info["error"] = "Asset is no longer in the registry"
+        return info
+    if "is_u_asset" in fields:
+        info["is_u_asset"] = asset_data.is_u_asset()
+    if "is_asset_loaded" in fields:
+        info["is_asset_loaded"] = asset_data.is_asset_loaded()
+    if tags:
+        values = {tag: asset_data.get_tag_value(tag) for tag in tags}
+        info["tags"] = {
+            tag: value for tag, value in values.items() if value is not None
+        }
+    if "lods" in fields:
+        info["lods"] = None
+        if index.classes[slot] in LOD_CLASSES:
+            was_loaded = asset_data.is_asset_loaded()
+            asset = asset_data.get_asset()
+            info["lods"] = ue_get_asset_info.get_lod_info(asset) if asset else []
+            info["loaded"] = not was_loaded
+    return info
+
+
+def get_assets_info(
+    asset_paths: Optional[List[str]] = None,
+    path_prefix: Optional[str] = None,
+    asset_class: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    tags: Optional[List[str]] = None,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    fields = list(fields or DEFAULT_FIELDS)
+    unknown = [field for field in fields if field not in FIELDS]
+    if unknown:
+        return {"error": f"Unknown fields {unknown}, use {', '.join(FIELDS)}"}
+    if not cursor and bool(asset_paths) == bool(path_prefix):
+        return {"error": "Give either asset_paths or path_prefix"}
+    limit = max(1, min(limit, MAX_LIMIT))
+    if asset_paths and len(asset_paths) > MAX_LIMIT:
+        return {"error": f"At most {MAX_LIMIT} asset_paths per call, use path_prefix"}
+
+    index = asset_index.get_index()
+    missing: List[str] = []
+    if cursor:
+        try:
+            snapshot, offset = paging.resolve(cursor)
+        except ValueError as e:
+            return {"error": str(e)}
+    else:
+        if asset_paths:
+            paths = []
+            for asset_path in asset_paths:
+                object_path = object_path_of(asset_path)
+                if object_path in index.slots:
+                    paths.append(object_path)
+                else:
+                    missing.append(asset_path)
+        else:
+            class_lower = asset_class.lower() if asset_class else None
+            paths = [
+                f"{index.package_names[slot]}.{index.names[slot]}"
+                for slot in index.slots_under(path_prefix)
+                if class_lower is None or index.classes_lower[slot] == class_lower
+            ]
+        snapshot = paging.Snapshot(
+            [(path,) for path in paths],
+            {"path_prefix": path_prefix, "asset_class": asset_class},
+        )
+        offset = 0
+
+    page = snapshot.page(offset, limit)
+    next_cursor = snapshot.next_cursor(offset, limit)
+    if next_cursor and not cursor:
+        paging.keep(snapshot)
+
+    registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    assets = []
+    loaded = 0
+    for (object_path,) in page:
+        slot = index.slots.get(object_path)
+        if slot is None:
+            # Removed since the snapshot was taken
+            missing.append(object_path)
+            continue
+        try:
+            info = describe(index, slot, fields, tags or [], registry)
+        except Exception as e:
+            info = {"path": object_path, "error": f"Failed to read asset: {e}"}
+        # Only set for assets this call had to load
+        if info.pop("loaded", False):
+            loaded += 1
+        assets.append(info)
+
+    return {
+        **snapshot.meta,
+        "fields": fields,
+        "total": len(snapshot.items),
+        "offset": offset,
+        "assets": assets,
+        "missing": missing,
+        "packages_loaded": loaded,
+        "next_cursor": next_cursor,
+    }
+
+
+def main(
+    asset_paths: Optional[List[str]] = None,
+    path_prefix: Optional[str] = None,
+    asset_class: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    tags: Optional[List[str]] = None,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+):
+    result = get_assets_info(
+        asset_paths, path_prefix, asset_class, fields, tags, limit, cursor
+    )
+    channel.send(result)
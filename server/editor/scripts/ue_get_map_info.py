@@ -1,67 +1,80 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 import unreal
-import json
 
+from . import channel
+from . import map_stats
 
-def get_map_info() -> Dict[str, Any]:
-    world = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem).get_editor_world()
-    if not world:
-        return {"error": "No world loaded"}
-
-    map_info = {}
-    map_info["map_name"] = world.get_name()
-    map_info["map_path"] = world.get_path_name()
-
-    all_actors = unreal.get_editor_subsystem(
-        unreal.EditorActorSubsystem
-    ).get_all_level_actors()
-    map_info["total_actors"] = len(all_actors)
-
-    actor_types = {}
-    for actor in all_actors:
-        actor_class = actor.get_class().get_name()
-        actor_types[actor_class] = actor_types.get(actor_class, 0) + 1
+TOP_CLASSES = 15
 
-    map_info["actor_types"] = dict(
-        sorted(actor_types.items(), key=lambda x: x[1], reverse=True)[:15]
-    )
-
-    lighting_info = {}
-    lighting_info["has_lightmass_importance_volume"] = any(
-        actor.get_class().get_name() == "LightmassImportanceVolume"
-        for actor in all_actors
-    )
-    lighting_info["directional_lights"] = sum(
-        1 for actor in all_actors if actor.get_class().get_name() == "DirectionalLight"
-    )
-    lighting_info["point_lights"] = sum(
-        1 for actor in all_actors if actor.get_class().get_name() == "PointLight"
-    )
-    lighting_info["spot_lights"] = sum(
-        1 for actor in all_actors if actor.get_class().get_name() == "SpotLight"
-    )
-
-    map_info["lighting"] = lighting_info
 
+def streaming_level_info() -> Dict[str, Any]:
     try:
         streaming_levels = unreal.EditorLevelLibrary.get_all_level_actors_of_class(
             unreal.LevelStreamingDynamic
         )
-        map_info["streaming_levels"] = len(streaming_levels)
-        map_info["streaming_level_names"] = [
-            level.get_name() for level in streaming_levels
-        ]
+        return {
+            "streaming_levels": len(streaming_levels),
+            "streaming_level_names": [level.get_name() for level in streaming_levels],
+        }
     except Exception:
-        map_info["streaming_levels"] = 0
-        map_info["streaming_level_names"] = []
+        return {"streaming_levels": 0, "streaming_level_names": []}
 
-    return map_info
 
+def get_map_info(
+    statistics: Optional[List[str]] = None,
+    level: Optional[str] = None,
+    top_classes: int = TOP_CLASSES,
+) -> Dict[str, Any]:
+    world = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem).get_editor_world()
+    if not world:
+        return {"error": "No world loaded"}
 
-def main():
-    map_data = get_map_info()
-    print(json.dumps(map_data, indent=2))
+    requested = frozenset(statistics or map_stats.DEFAULT_STATISTICS)
+    unknown = requested - set(map_stats.STATISTICS)
+    if unknown:
+        return {
+            "error": f"Unknown statistics {sorted(unknown)}, "
+            f"use {', '.join(map_stats.STATISTICS)}"
+        }
+    if level is not None:
+        # Per level results come out of the same pass
+        requested |= {"levels"}
+
+    stats = map_stats.get_stats(world, requested)
+    top_classes = max(1, top_classes)
+
+    map_info = {}
+    map_info["map_name"] = world.get_name()
+    map_info["map_path"] = world.get_path_name()
+
+    if level is not None:
+        level_stats = stats.levels.get(level)
+        if level_stats is None:
+            return {
+                "error": f"No actors in level {level}",
+                "levels": sorted(stats.levels),
+            }
+        map_info["level"] = level
+        map_info.update(level_stats.to_dict(requested, top_classes))
+        return map_info
+
+    map_info.update(stats.map.to_dict(requested, top_classes))
+    map_info.update(streaming_level_info())
+    if "levels" in requested:
+        # Only totals here, a level's own breakdown is fetched by name
+        map_info["levels"] = {
+            name: level_stats.total
+            for name, level_stats in sorted(
+                stats.levels.items(), key=lambda item: -item[1].total
+            )
+        }
+    return map_info
 
 
-if __name__ == "__main__":
-    main()
+def main(
+    statistics: Optional[List[str]] = None,
+    level: Optional[str] = None,
+    top_classes: int = TOP_CLASSES,
+):
+    map_data = get_map_info(statistics, level, top_classes)
+    channel.send(map_data)
@@ -0,0 +1,157 @@
+from typing import Any, Dict, Optional
+import unreal
+
+from . import channel
+from . import map_stats
+from . import mesh_stats
+from . import profiler
+
+TOP_ENTRIES = 20
+MAX_TOP_ENTRIES = 500
+
+ROOT_FOLDER = "/"
+
+
+class Budget:
+    """Render cost totals of a group of mesh components."""
+
+    __slots__ = (
+        "actors",
+        "components",
+        "instances",
+        "triangles",
+        "vertices",
+        "material_slots",
+        "draw_calls",
+        "unknown_triangles",
+    )
+
+    def __init__(self):
+        for field in self.__slots__:
+            setattr(self, field, 0)
+
+    def to_dict(self) -> Dict[str, int]:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
+def component_mesh(component):
+    """Mesh and instance count of a mesh component, (None, 0) if not a mesh."""
+    if isinstance(component, unreal.InstancedStaticMeshComponent):
+        return component.static_mesh, component.get_instance_count()
+    if isinstance(component, unreal.StaticMeshComponent):
+        return component.static_mesh, 1
+    if isinstance(component, unreal.SkinnedMeshComponent):
+        mesh = getattr(component, "skeletal_mesh_asset", None) or getattr(
+            component, "skeletal_mesh", None
+        )
+        return mesh, 1
+    return None, 0
+
+
+def folder_of(actor) -> str:
+    folder = str(actor.get_folder_path())
+    return ROOT_FOLDER if folder in ("", "None") else folder
+
+
+def add_component(budget: Budget, stats: Dict[str, Any], instances: int):
+    budget.components += 1
+    budget.instances += instances
+    # Instances of a component share one draw per section
+    budget.draw_calls += stats["sections"]
+    budget.material_slots += stats["material_slots"]
+    if stats["vertices"] is not None:
+        budget.vertices += stats["vertices"] * instances
+    if stats["triangles"] is None:
+        budget.unknown_triangles += instances
+    else:
+        budget.triangles += stats["triangles"] * instances
+
+
+def top(groups: Dict[str, Budget], key: str, count: int):
+    ranked = sorted(
+        (item for item in groups.items() if item[1].components),
+        key=lambda item: -getattr(item[1], key),
+    )
+    return [{"name": name, **budget.to_dict()} for name, budget in ranked[:count]]
+
+
+def get_scene_budget(
+    folder_prefix: Optional[str] = None,
+    sort_by: str = "triangles",
+    top_entries: int = TOP_ENTRIES,
+) -> Dict[str, Any]:
+    if sort_by not in Budget.__slots__:
+        return {"error": f"Unknown sort_by {sort_by}, use {', '.join(Budget.__slots__)}"}
+
+    world = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem).get_editor_world()
+    if not world:
+        return {"error": "No world loaded"}
+
+    all_actors = unreal.get_editor_subsystem(
+        unreal.EditorActorSubsystem
+    ).get_all_level_actors()
+    cache = mesh_stats.get_cache()
+    hits, misses = cache.hits, cache.misses
+
+    total = Budget()
+    by_class: Dict[str, Budget] = {}
+    by_folder: Dict[str, Budget] = {}
+    by_mesh: Dict[str, Budget] = {}
+
+    with profiler.phase("measure_actors"):
+        for actor in all_actors:
+            try:
+                folder = folder_of(actor)
+                if folder_prefix and not folder.startswith(folder_prefix):
+                    continue
+                components = actor.get_components_by_class(unreal.MeshComponent)
+                if not components:
+                    continue
+
+                groups = (
+                    total,
+                    by_class.setdefault(map_stats.class_name_of(actor), Budget()),
+                    by_folder.setdefault(folder, Budget()),
+                )
+                meshes_seen = set()
+                for component in components:
+                    mesh, instances = component_mesh(component)
+                    if mesh is None:
+                        continue
+                    stats = cache.stats_of(mesh)
+                    if stats is None:
+                        continue
+                    mesh_budget = by_mesh.setdefault(stats["path"], Budget())
+                    for budget in (*groups, mesh_budget):
+                        add_component(budget, stats, instances)
+                    if stats["path"] not in meshes_seen:
+                        mesh_budget.actors += 1
+                        meshes_seen.add(stats["path"])
+                if meshes_seen:
+                    for budget in groups:
+                        budget.actors += 1
+            except Exception:
+                # The actor went away while the level was walked
+                continue
+
+    top_entries = max(1, min(top_entries, MAX_TOP_ENTRIES))
+    return {
+        "map_name": world.get_name(),
+        "folder_prefix": folder_prefix,
+        "sort_by": sort_by,
+        "total": total.to_dict(),
+        "unique_meshes": len(by_mesh),
+        "by_class": top(by_class, sort_by, top_entries),
+        "by_folder": top(by_folder, sort_by, top_entries),
+        "by_mesh": top(by_mesh, sort_by, top_entries),
+        "mesh_cache": {"hits": cache.hits - hits, "misses": cache.misses - misses},
+    }
+
+
+def main(
+    folder_prefix: Optional[str] = None,
+    sort_by: str = "triangles",
+    top_entries: int = TOP_ENTRIES,
+):
+    result = get_scene_budget(folder_prefix, sort_by, top_entries)
+    channel.send(result)
@@ -1,6 +1,39 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 import unreal
-import json
+
+from . import actor_table
+from . import channel
+from . import paging
+
+# Fields available in columnar mode. `transform` is packed as
+# x, y, z, pitch, yaw, roll, scale_x, scale_y, scale_z per actor.
+COLUMNAR_FIELDS = ("name", "label", "class", "folder", "transform", "hidden", "components")
+DEFAULT_COLUMNAR_FIELDS = ["name", "class", "transform"]
+TRANSFORM_STRIDE = 9
+MAX_LIMIT = 10000
+
+
+def read_transform(actor) -> List[float]:
+    # One engine call per actor instead of one per vector component
+    transform = actor.get_actor_transform()
+    location = transform.translation
+    rotation = transform.rotation.rotator()
+    scale = transform.scale3d
+    return [
+        location.x,
+        location.y,
+        location.z,
+        rotation.pitch,
+        rotation.yaw,
+        rotation.roll,
+        scale.x,
+        scale.y,
+        scale.z,
+    ]
+
+
+def read_folder(actor) -> Optional[str]:
+    return str(actor.get_folder_path()) if hasattr(actor, "get_folder_path") else None
 
 
 def get_world_outliner() -> Dict[str, Any]:
@@ -18,31 +51,22 @@ def get_world_outliner() -> Dict[str, Any]:
         "total_actors": len(all_actors),
         "actors": [],
     }
+    fingerprints = {}
 
     for actor in all_actors:
         try:
+            transform = read_transform(actor)
+            x, y, z, pitch, yaw, roll, sx, sy, sz = transform
+            name = actor.get_name()
+            fingerprints[name] = tuple(transform)
             actor_info = {
-                "name": actor.get_name(),
+                "name": name,
                 "class": actor.get_class().get_name(),
-                "location": {
-                    "x": actor.get_actor_location().x,
-                    "y": actor.get_actor_location().y,
-                    "z": actor.get_actor_location().z,
-                },
-                "rotation": {
-                    "pitch": actor.get_actor_rotation().pitch,
-                    "yaw": actor.get_actor_rotation().yaw,
-                    "roll": actor.get_actor_rotation().roll,
-                },
-                "scale": {
-                    "x": actor.get_actor_scale3d().x,
-                    "y": actor.get_actor_scale3d().y,
-                    "z": actor.get_actor_scale3d().z,
-                },
+                "location": {"x": x, "y": y, "z": z},
+                "rotation": {"pitch": pitch, "yaw": yaw, "roll": roll},
+                "scale": {"x": sx, "y": sy, "z": sz},
                 "is_hidden": actor.is_hidden_ed(),
-                "folder_path": str(actor.get_folder_path())
-                if hasattr(actor, "get_folder_path")
-                else None,
+                "folder_path": read_folder(actor),
             }
 
             components = actor.get_components_by_class(unreal.ActorComponent)
@@ -57,14 +81,213 @@ def get_world_outliner() -> Dict[str, Any]:
             continue
 
     outliner_data["actors"].sort(key=lambda x: x["name"])
+    outliner_data["version"] = actor_table.get_table().sync(
+        world, all_actors, fingerprints
+    )
 
     return outliner_data
 
 
-def main():
-    outliner_data = get_world_outliner()
-    print(json.dumps(outliner_data, indent=2))
+class StringTable:
+    """Interns repeated strings (classes, folders) into indices for a page."""
+
+    def __init__(self):
+        self.values: List[Optional[str]] = []
+        self.indices: Dict[Optional[str], int] = {}
+
+    def index(self, value: Optional[str]) -> int:
+        found = self.indices.get(value)
+        if found is None:
+            found = self.indices[value] = len(self.values)
+            self.values.append(value)
+        return found
+
+
+def get_outliner_snapshot(
+    fields: Optional[List[str]] = None,
+    class_filter: Optional[List[str]] = None,
+    folder_filter: Optional[str] = None,
+    limit: int = 1000,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    limit = max(1, min(limit, MAX_LIMIT))
+
+    if cursor:
+        try:
+            snapshot, offset = paging.resolve(cursor)
+        except ValueError as e:
+            return {"error": str(e)}
+    else:
+        fields = list(fields or DEFAULT_COLUMNAR_FIELDS)
+        unknown = [field for field in fields if field not in COLUMNAR_FIELDS]
+        if unknown:
+            return {"error": f"Unknown fields: {unknown}"}
+
+        world = unreal.get_editor_subsystem(
+            unreal.UnrealEditorSubsystem
+        ).get_editor_world()
+        if not world:
+            return {"error": "No world loaded"}
+
+        all_actors = unreal.get_editor_subsystem(
+            unreal.EditorActorSubsystem
+        ).get_all_level_actors()
+
+        classes = {name.lower() for name in class_filter} if class_filter else None
+        folder_prefix = folder_filter.strip("/").lower() if folder_filter else None
+
+        # Only what is needed to filter and order is read up front, the
+        # requested fields are read for the actors of each page
+        items = []
+        for i, actor in enumerate(all_actors):
+            try:
+                if classes is not None:
+                    if actor.get_class().get_name().lower() not in classes:
+                        continue
+                if folder_prefix is not None:
+                    folder = (read_folder(actor) or "").strip("/").lower()
+                    if not (
+                        folder == folder_prefix
+                        or folder.startswith(folder_prefix + "/")
+                    ):
+                        continue
+                items.append((actor.get_name(), i, actor))
+            except Exception:
+                continue
+
+        snapshot = paging.Snapshot(
+            items,
+            {
+                "world_name": world.get_name(),
+                "fields": fields,
+                "version": actor_table.get_table().sync(world, all_actors),
+            },
+        )
+        offset = 0
+
+    page = snapshot.page(offset, limit)
+    next_cursor = snapshot.next_cursor(offset, limit)
+    if next_cursor and not cursor:
+        paging.keep(snapshot)
+
+    fields = snapshot.meta["fields"]
+    columns = read_columns([(name, actor) for name, _, actor in page], fields)
+
+    result = {
+        **snapshot.meta,
+        "total_actors": len(snapshot.items),
+        "offset": offset,
+        "count": len(page),
+        **columns,
+        "next_cursor": next_cursor,
+    }
+    return result
+
+
+def read_columns(rows: List[Tuple[str, Any]], fields: List[str]) -> Dict[str, Any]:
+    """Read the requested fields of (name, actor) rows into column arrays."""
+    class_table = StringTable()
+    folder_table = StringTable()
+    columns: Dict[str, list] = {field: [] for field in fields}
+
+    for name, actor in rows:
+        try:
+            row = {}
+            for field in fields:
+                if field == "name":
+                    row[field] = name
+                elif field == "label":
+                    row[field] = actor.get_actor_label()
+                elif field == "class":
+                    row[field] = class_table.index(actor.get_class().get_name())
+                elif field == "folder":
+                    row[field] = folder_table.index(read_folder(actor))
+                elif field == "transform":
+                    row[field] = read_transform(actor)
+                elif field == "hidden":
+                    row[field] = actor.is_hidden_ed()
+                elif field == "components":
+                    row[field] = [
+                        comp.get_class().get_name()
+                        for comp in actor.get_components_by_class(
+                            unreal.ActorComponent
+                        )[:5]
+                    ]
+        except Exception:
+            # The actor was deleted after it was recorded
+            row = {
+                field: [None] * TRANSFORM_STRIDE if field == "transform" else None
+                for field in fields
+            }
+            row["name"] = name
+
+        for field in fields:
+            if field == "transform":
+                columns[field].extend(row[field])
+            else:
+                columns[field].append(row[field])
+
+    result: Dict[str, Any] = {"columns": columns}
+    if "class" in fields:
+        result["classes"] = class_table.values
+    if "folder" in fields:
+        result["folders"] = folder_table.values
+    return result
+
+
+def get_outliner_delta(
+    since_version: int, fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    fields = list(fields or DEFAULT_COLUMNAR_FIELDS)
+    unknown = [field for field in fields if field not in COLUMNAR_FIELDS]
+    if unknown:
+        return {"error": f"Unknown fields: {unknown}"}
+
+    world = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem).get_editor_world()
+    if not world:
+        return {"error": "No world loaded"}
+
+    table = actor_table.get_table()
+    version = table.sync(world)
+    changes = table.changes_since(since_version)
+    if changes is None:
+        return {
+            "world_name": world.get_name(),
+            "since_version": since_version,
+            "version": version,
+            "reset": True,
+            "message": "Version is too old or from another session, take a new snapshot",
+        }
+
+    return {
+        "world_name": world.get_name(),
+        "since_version": since_version,
+        "version": version,
+        "reset": False,
+        "fields": fields,
+        "added": read_columns(changes["added"], fields),
+        "modified": read_columns(changes["modified"], fields),
+        "removed": changes["removed"],
+    }
 
 
-if __name__ == "__main__":
-    main()
+def main(
+    columnar: bool = False,
+    fields: Optional[List[str]] = None,
+    class_filter: Optional[List[str]] = None,
+    folder_filter: Optional[str] = None,
+    limit: int = 1000,
+    cursor: Optional[str] = None,
+    since_version: Optional[int] = None,
+):
+    if since_version is not None:
+        outliner_data = get_outliner_delta(since_version, fields)
+        channel.send(outliner_data)
+    elif columnar or cursor:
+        outliner_data = get_outliner_snapshot(
+            fields, class_filter, folder_filter, limit, cursor
+        )
+        channel.send(outliner_data)
+    else:
+        outliner_data = get_world_outliner()
+        channel.send(outliner_data)
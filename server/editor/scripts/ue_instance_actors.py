@@ -0,0 +1,248 @@
+from typing import Any, Dict, List, Optional, Tuple
+import unreal
+
+from . import actor_lookup
+from . import channel
+from . import map_stats
+from . import mesh_stats
+from . import profiler
+
+MIN_GROUP_SIZE = 2
+MAX_GROUPS_LISTED = 200
+
+
+class Group:
+    """StaticMeshActors of one level drawing the same mesh with the same materials."""
+
+    def __init__(self, mesh, materials: tuple, level, folder: str):
+        self.mesh = mesh
+        self.materials = materials
+        self.level = level
+        self.folders = {folder}
+        self.actors: List[Any] = []
+        self.transforms: List[Any] = []
+
+
+def level_of(actor):
+    try:
+        return actor.get_level()
+    except Exception:
+        return None
+
+
+def current_level():
+    try:
+        return unreal.get_editor_subsystem(unreal.LevelEditorSubsystem).get_current_level()
+    except Exception:
+        return None
+
+
+def candidate_actors(
+    actor_names: Optional[List[str]], selected: bool
+) -> Tuple[List[Any], List[str]]:
+    """Actors to consider and the requested names that weren't found."""
+    actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+    if actor_names:
+        found = actor_lookup.get_lookup().find_many(actor_names)
+        return list(found.values()), [name for name in actor_names if name not in found]
+    if selected:
+        return list(actor_subsystem.get_selected_level_actors()), []
+    return list(actor_subsystem.get_all_level_actors()), []
+
+
+def group_actors(actors: List[Any], folder_prefix: Optional[str]) -> Dict[tuple, Group]:
+    """Group plain StaticMeshActors by level, mesh and materials.
+
+    Actors with more than their mesh component are left alone since their
+    other components would be lost.
+    """
+    groups: Dict[tuple, Group] = {}
+    for actor in actors:
+        try:
+            if map_stats.class_name_of(actor) != "StaticMeshActor":
+                continue
+            folder = str(actor.get_folder_path())
+            folder = "" if folder == "None" else folder
+            if folder_prefix and not folder.startswith(folder_prefix):
+                continue
+            components = actor.get_components_by_class(unreal.ActorComponent)
+            if len(components) != 1 or not isinstance(
+                components[0], unreal.StaticMeshComponent
+            ):
+                continue
+            component = components[0]
+            mesh = component.static_mesh
+            if mesh is None:
+                continue
+            materials = tuple(component.get_materials())
+            level = level_of(actor)
+            key = (level, mesh, materials)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = Group(mesh, materials, level, folder)
+            group.folders.add(folder)
+            group.actors.append(actor)
+            group.transforms.append(actor.get_actor_transform())
+        except Exception:
+            # The actor went away while the level was walked
+            continue
+    return groups
+
+
+def add_instanced_component(actor, component_class):
+    """Add a component to a spawned actor as its root, the way the details
+    panel does, so it's saved with the level."""
+    subobjects = unreal.get_engine_subsystem(unreal.SubobjectDataSubsystem)
+    handles = subobjects.k2_gather_subobject_data_for_instance(actor)
+    handle, fail_reason = subobjects.add_new_subobject(
+        unreal.AddNewSubobjectParams(parent_handle=handles[0], new_class=component_class)
+    )
+    if str(fail_reason).strip() not in ("", "None"):
+        raise RuntimeError(f"Could not add {component_class.__name__}: {fail_reason}")
+    data = unreal.SubobjectDataBlueprintFunctionLibrary.get_data(handle)
+    return unreal.SubobjectDataBlueprintFunctionLibrary.get_object(data)
+
+
+def merge_group(group: Group, component_class, label: str):
+    """Spawn one actor holding the group's instances and destroy the originals."""
+    location = group.transforms[0].translation
+    actor = unreal.EditorLevelLibrary.spawn_actor_from_class(
+        unreal.Actor, location, unreal.Rotator(0.0, 0.0, 0.0)
+    )
+    if not actor:
+        raise RuntimeError("Failed to spawn the instance actor")
+    try:
+        component = add_instanced_component(actor, component_class)
+        component.set_static_mesh(group.mesh)
+        for index, material in enumerate(group.materials):
+            if material is not None:
+                component.set_material(index, material)
+        component.add_instances(group.transforms, False, True)
+        actor.set_actor_label(label)
+        if len(group.folders) == 1 and "" not in group.folders:
+            actor.set_folder_path(next(iter(group.folders)))
+    except Exception:
+        unreal.get_editor_subsystem(unreal.EditorActorSubsystem).destroy_actors([actor])
+        raise
+
+    lookup = actor_lookup.get_lookup()
+    lookup.note_spawned(actor)
+    originals = [
+        (source, source.get_name(), source.get_actor_label()) for source in group.actors
+    ]
+    unreal.get_editor_subsystem(unreal.EditorActorSubsystem).destroy_actors(group.actors)
+    for source, name, source_label in originals:
+        lookup.discard(source, name, source_label)
+    return actor
+
+
+def instance_actors(
+    actor_names: Optional[List[str]] = None,
+    selected: bool = False,
+    folder_prefix: Optional[str] = None,
+    min_group_size: int = MIN_GROUP_SIZE,
+    hierarchical: bool = True,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    try:
+        world = unreal.get_editor_subsystem(
+            unreal.UnrealEditorSubsystem
+        ).get_editor_world()
+        if not world:
+            return {"error": "No world loaded"}
+
+        actors, missing = candidate_actors(actor_names, selected)
+        with profiler.phase("group_actors"):
+            groups = group_actors(actors, folder_prefix)
+
+        target_level = current_level()
+        cache = mesh_stats.get_cache()
+        component_class = (
+            unreal.HierarchicalInstancedStaticMeshComponent
+            if hierarchical
+            else unreal.InstancedStaticMeshComponent
+        )
+
+        actor_count = len(
+            unreal.get_editor_subsystem(unreal.EditorActorSubsystem).get_all_level_actors()
+        )
+        totals = {"actors_merged": 0, "draw_calls_before": 0, "draw_calls_after": 0}
+        reports = []
+        errors = []
+
+        eligible = [
+            group
+            for group in groups.values()
+            if len(group.actors) >= max(2, min_group_size)
+        ]
+        # Groups that can be converted first, biggest savings first
+        eligible.sort(
+            key=lambda group: (
+                target_level is not None and group.level != target_level,
+                -len(group.actors),
+            )
+        )
+
+        with unreal.ScopedEditorTransaction(f"MCP Instance {len(eligible)} Actor Groups"):
+            for group in eligible:
+                stats = cache.stats_of(group.mesh)
+                sections = stats["sections"] if stats else 1
+                mesh_path = stats["path"] if stats else group.mesh.get_path_name()
+                report = {
+                    "mesh": mesh_path,
+                    "actors": len(group.actors),
+                    "draw_calls_before": sections * len(group.actors),
+                    "draw_calls_after": sections,
+                }
+
+                if target_level is not None and group.level != target_level:
+                    # Spawning only works in the current level
+                    report["skipped"] = "Not in the current level"
+                elif not dry_run:
+                    label = f"ISM_{mesh_path.rsplit('.', 1)[-1]}"
+                    try:
+                        with profiler.phase("merge_group"):
+                            report["actor_name"] = merge_group(
+                                group, component_class, label
+                            ).get_name()
+                    except Exception as e:
+                        errors.append({"mesh": mesh_path, "error": str(e)})
+                        continue
+
+                if "skipped" not in report:
+                    totals["actors_merged"] += len(group.actors)
+                    totals["draw_calls_before"] += report["draw_calls_before"]
+                    totals["draw_calls_after"] += report["draw_calls_after"]
+                reports.append(report)
+
+        converted = [report for report in reports if "skipped" not in report]
+        return {
+            "success": not errors,
+            "dry_run": dry_run,
+            "component_class": component_class.__name__,
+            "groups_found": len(eligible),
+            "groups_converted": len(converted),
+            "actors_before": actor_count,
+            "actors_after": actor_count - totals["actors_merged"] + len(converted),
+            **totals,
+            "groups": reports[:MAX_GROUPS_LISTED],
+            "missing_actors": missing,
+            "errors": errors,
+        }
+
+    except Exception as e:
+        return {"error": f"Failed to instance actors: {str(e)}"}
+
+
+def main(
+    actor_names: Optional[List[str]] = None,
+    selected: bool = False,
+    folder_prefix: Optional[str] = None,
+    min_group_size: int = MIN_GROUP_SIZE,
+    hierarchical: bool = True,
+    dry_run: bool = False,
+):
+    result = instance_actors(
+        actor_names, selected, folder_prefix, min_group_size, hierarchical, dry_run
+    )
+    channel.send(result)
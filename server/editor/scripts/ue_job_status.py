@@ -0,0 +1,30 @@
+from typing import Any, Dict, Optional
+
+from . import channel
+from . import jobs
+
+
+def job_status(
+    job_id: Optional[str] = None,
+    cancel: bool = False,
+    offset: int = 0,
+    limit: int = 100,
+) -> Dict[str, Any]:
+    if not job_id:
+        return {"jobs": jobs.list_jobs()}
+
+    job = jobs.cancel(job_id) if cancel else jobs.get(job_id)
+    if job is None:
+        return {"error": f"Job not found: {job_id}"}
+
+    return job.describe(max(0, offset), max(0, limit))
+
+
+def main(
+    job_id: Optional[str] = None,
+    cancel: bool = False,
+    offset: int = 0,
+    limit: int = 100,
+):
+    result = job_status(job_id, cancel, offset, limit)
+    channel.send(result)
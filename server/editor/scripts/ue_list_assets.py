@@ -1,16 +1,49 @@
-from typing import List
-import unreal
+from typing import Any, Dict, Optional
 
+from . import asset_index
+from . import channel
+from . import paging
 
-def list_assets() -> List[str]:
-    assets = unreal.EditorAssetLibrary.list_assets("/Game", recursive=True)
-    return assets
+MAX_LIMIT = 10000
 
 
-def main():
-    assets = list_assets()
-    print(assets)
+def list_assets(
+    limit: int = 1000,
+    cursor: Optional[str] = None,
+    path_prefix: str = "/Game/",
+) -> Dict[str, Any]:
+    limit = max(1, min(limit, MAX_LIMIT))
 
+    if cursor:
+        try:
+            snapshot, offset = paging.resolve(cursor)
+        except ValueError as e:
+            return {"error": str(e)}
+    else:
+        index = asset_index.get_index()
+        snapshot = paging.Snapshot(
+            [
+                (f"{index.package_names[slot]}.{index.names[slot]}",)
+                for slot in index.slots_under(path_prefix)
+            ],
+            {"path_prefix": path_prefix},
+        )
+        offset = 0
 
-if __name__ == "__main__":
-    main()
+    page = snapshot.page(offset, limit)
+    next_cursor = snapshot.next_cursor(offset, limit)
+    if next_cursor and not cursor:
+        paging.keep(snapshot)
+
+    return {
+        **snapshot.meta,
+        "total": len(snapshot.items),
+        "offset": offset,
+        "assets": [asset_path for (asset_path,) in page],
+        "next_cursor": next_cursor,
+    }
+
+
+def main(limit: int = 1000, cursor: Optional[str] = None, path_prefix: str = "/Game/"):
+    result = list_assets(limit, cursor, path_prefix)
+    channel.send(result)
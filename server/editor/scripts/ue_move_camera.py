@@ -1,5 +1,6 @@
 import unreal
-import json
+
+from . import channel
 
 
 def move_viewport_camera(location, rotation):
@@ -33,16 +34,14 @@ def move_viewport_camera(location, rotation):
         return {"success": False, "error": str(e)}
 
 
-location_data = ${location}
-rotation_data = ${rotation}
-
-if location_data and rotation_data:
-    result = move_viewport_camera(location_data, rotation_data)
-    print(json.dumps(result))
-else:
-    print(
-        json.dumps(
-            {"success": False, "error": "Location and rotation parameters are required"}
+def main(location, rotation):
+    if location and rotation:
+        result = move_viewport_camera(location, rotation)
+        channel.send(result)
+    else:
+        channel.send(
+            {
+                "success": False,
+                "error": "Location and rotation parameters are required",
+            }
         )
-    )
-
@@ -0,0 +1,354 @@
+from typing import Any, Dict, List, Optional, Tuple
+import unreal
+import random
+
+from . import actor_lookup
+from . import channel
+from . import profiler
+from . import ue_instance_actors
+
+MAX_INSTANCES = 200000
+# Instances generated and handed to the component per engine call
+BATCH_SIZE = 5000
+# Points sampled along a spline to turn it into a polygon
+SPLINE_SAMPLES = 256
+# Random points tried per instance before a polygon is considered too thin
+MAX_ATTEMPTS_PER_INSTANCE = 20
+# Square engine units in a square meter
+UNITS_PER_SQUARE_METER = 100.0 * 100.0
+# Traces start this far above the area and end this far below it
+TRACE_MARGIN = 100000.0
+
+Polygon = List[Tuple[float, float]]
+
+
+def polygon_area(polygon: Polygon) -> float:
+    area = 0.0
+    for (x1, y1), (x2, y2) in zip(polygon, polygon[1:] + polygon[:1]):
+        area += x1 * y2 - x2 * y1
+    return abs(area) / 2.0
+
+
+def inside(polygon: Polygon, x: float, y: float) -> bool:
+    """Even-odd rule point in polygon test."""
+    result = False
+    x1, y1 = polygon[-1]
+    for x2, y2 in polygon:
+        if (y1 > y) != (y2 > y) and x < (x2 - x1) * (y - y1) / (y2 - y1) + x1:
+            result = not result
+        x1, y1 = x2, y2
+    return result
+
+
+def spline_area(actor_name: str) -> Tuple[Polygon, float, float]:
+    """Polygon of a closed spline in world space, with its lowest and highest z."""
+    actor = actor_lookup.get_lookup().find(actor_name)
+    if actor is None:
+        raise ValueError(f"Actor not found: {actor_name}")
+    spline = actor.get_component_by_class(unreal.SplineComponent)
+    if spline is None:
+        raise ValueError(f"Actor {actor_name} has no spline component")
+
+    length = spline.get_spline_length()
+    polygon = []
+    heights = []
+    for index in range(SPLINE_SAMPLES):
+        location = spline.get_location_at_distance_along_spline(
+            length * index / SPLINE_SAMPLES, unreal.SplineCoordinateSpace.WORLD
+        )
+        polygon.append((location.x, location.y))
+        heights.append(location.z)
+    return polygon, min(heights), max(heights)
+
+
+def read_range(
+    value: Optional[List[float]], default: Tuple[float, float]
+) -> Tuple[float, float]:
+    if not value:
+        return default
+    low, high = (float(value[0]), float(value[-1]))
+    return (low, high) if low <= high else (high, low)
+
+
+class Scatter:
+    """Seeded placement of instances over a rectangle or polygon."""
+
+    def __init__(
+        self,
+        seed: int,
+        polygon: Optional[Polygon],
+        low: Dict[str, float],
+        high: Dict[str, float],
+        yaw: Tuple[float, float],
+        pitch: Tuple[float, float],
+        roll: Tuple[float, float],
+        scale: Tuple[float, float],
+    ):
+        self.random = random.Random(seed)
+        self.polygon = polygon
+        self.low = low
+        self.high = high
+        self.yaw = yaw
+        self.pitch = pitch
+        self.roll = roll
+        self.scale = scale
+        self.attempts = 0
+
+    def points(self, count: int) -> List[Tuple[float, float, float]]:
+        """Up to count locations, fewer when a polygon rejects too many."""
+        uniform = self.random.uniform
+        low, high = self.low, self.high
+        found = []
+        budget = count * MAX_ATTEMPTS_PER_INSTANCE
+        while len(found) < count and budget > 0:
+            budget -= 1
+            self.attempts += 1
+            x = uniform(low["x"], high["x"])
+            y = uniform(low["y"], high["y"])
+            if self.polygon is not None and not inside(self.polygon, x, y):
+                continue
+            found.append((x, y, uniform(low["z"], high["z"])))
+        return found
+
+    def transform(self, x: float, y: float, z: float):
+        uniform = self.random.uniform
+        size = uniform(*self.scale)
+        return unreal.Transform(
+            unreal.Vector(x, y, z),
+            unreal.Rotator(
+                uniform(*self.roll), uniform(*self.pitch), uniform(*self.yaw)
+            ),
+            unreal.Vector(size, size, size),
+        )
+
+
+def snap(world, points, ignore: list, bottom: float, top: float, z_offset: float):
+    """Drop each point onto the first surface below it, None where none is hit."""
+    snapped = []
+    for x, y, _ in points:
+        hit = unreal.SystemLibrary.line_trace_single(
+            world,
+            unreal.Vector(x, y, top + TRACE_MARGIN),
+            unreal.Vector(x, y, bottom - TRACE_MARGIN),
+            unreal.TraceTypeQuery.TRACE_TYPE_QUERY1,
+            False,
+            ignore,
+            unreal.DrawDebugTrace.NONE,
+            True,
+        )
+        if hit is None:
+            snapped.append(None)
+            continue
+        impact_point = hit.to_tuple()[5]
+        snapped.append((x, y, impact_point.z + z_offset))
+    return snapped
+
+
+def target_component(
+    actor_name: Optional[str], mesh, component_class, label: str
+) -> Tuple[Any, Any, bool]:
+    """The instance component to fill: an existing one with the mesh on the
+    named actor, a new one on it, or one on a newly spawned actor."""
+    if actor_name:
+        actor = actor_lookup.get_lookup().find(actor_name)
+        if actor is None:
+            raise ValueError(f"Actor not found: {actor_name}")
+        for component in actor.get_components_by_class(
+            unreal.InstancedStaticMeshComponent
+        ):
+            if component.static_mesh == mesh:
+                return actor, component, False
+        component = ue_instance_actors.add_instanced_component(actor, component_class)
+        component.set_static_mesh(mesh)
+        return actor, component, False
+
+    actor = unreal.EditorLevelLibrary.spawn_actor_from_class(
+        unreal.Actor, unreal.Vector(0.0, 0.0, 0.0), unreal.Rotator(0.0, 0.0, 0.0)
+    )
+    if not actor:
+        raise RuntimeError("Failed to spawn the instance actor")
+    component = ue_instance_actors.add_instanced_component(actor, component_class)
+    component.set_static_mesh(mesh)
+    actor.set_actor_label(label)
+    actor_lookup.get_lookup().note_spawned(actor)
+    return actor, component, True
+
+
+def scatter_instances(
+    mesh_path: str,
+    bounds: Optional[Dict[str, Dict[str, float]]] = None,
+    spline_actor: Optional[str] = None,
+    count: Optional[int] = None,
+    density: Optional[float] = None,
+    seed: int = 0,
+    yaw: Optional[List[float]] = None,
+    pitch: Optional[List[float]] = None,
+    roll: Optional[List[float]] = None,
+    scale: Optional[List[float]] = None,
+    snap_to_surface: bool = False,
+    z_offset: float = 0.0,
+    materials: Optional[List[str]] = None,
+    actor_name: Optional[str] = None,
+    label: Optional[str] = None,
+    hierarchical: bool = True,
+) -> Dict[str, Any]:
+    try:
+        world = unreal.get_editor_subsystem(
+            unreal.UnrealEditorSubsystem
+        ).get_editor_world()
+        if not world:
+            return {"error": "No world loaded"}
+        if (bounds is None) == (spline_actor is None):
+            return {"error": "Give either bounds or spline_actor"}
+        if (count is None) == (density is None):
+            return {"error": "Give either count or density"}
+
+        mesh = unreal.EditorAssetLibrary.load_asset(mesh_path)
+        if not isinstance(mesh, unreal.StaticMesh):
+            return {"error": f"Not a static mesh: {mesh_path}"}
+
+        if bounds is not None:
+            polygon = None
+            corners = (bounds["min"], bounds["max"])
+            low = {axis: min(corner[axis] for corner in corners) for axis in "xyz"}
+            high = {axis: max(corner[axis] for corner in corners) for axis in "xyz"}
+            area = (high["x"] - low["x"]) * (high["y"] - low["y"])
+        else:
+            try:
+                polygon, bottom, top = spline_area(spline_actor)
+            except ValueError as e:
+                return {"error": str(e)}
+            xs = [x for x, _ in polygon]
+            ys = [y for _, y in polygon]
+            low = {"x": min(xs), "y": min(ys), "z": bottom}
+            high = {"x": max(xs), "y": max(ys), "z": top}
+            area = polygon_area(polygon)
+
+        area_m2 = area / UNITS_PER_SQUARE_METER
+        wanted = int(count) if count is not None else int(round(density * area_m2))
+        if wanted <= 0:
+            return {"error": "Nothing to place, the count or area is zero"}
+        if wanted > MAX_INSTANCES:
+            return {
+                "error": f"Too many instances ({wanted}), "
+                f"at most {MAX_INSTANCES} per call"
+            }
+
+        scatter = Scatter(
+            seed,
+            polygon,
+            low,
+            high,
+            read_range(yaw, (0.0, 360.0)),
+            read_range(pitch, (0.0, 0.0)),
+            read_range(roll, (0.0, 0.0)),
+            read_range(scale, (1.0, 1.0)),
+        )
+        component_class = (
+            unreal.HierarchicalInstancedStaticMeshComponent
+            if hierarchical
+            else unreal.InstancedStaticMeshComponent
+        )
+        default_label = f"Scatter_{mesh_path.rsplit('/', 1)[-1].split('.', 1)[0]}"
+
+        placed = 0
+        unsnapped = 0
+        batches = 0
+        with unreal.ScopedEditorTransaction(f"MCP Scatter {wanted} Instances"):
+            actor, component, spawned = target_component(
+                actor_name, mesh, component_class, label or default_label
+            )
+            try:
+                for index, material_path in enumerate(materials or []):
+                    if material_path:
+                        material = unreal.EditorAssetLibrary.load_asset(material_path)
+                        if material:
+                            component.set_material(index, material)
+
+                while placed + unsnapped < wanted:
+                    batch = min(BATCH_SIZE, wanted - placed - unsnapped)
+                    with profiler.phase("generate"):
+                        points = scatter.points(batch)
+                    # The polygon rejected too many points to fill the batch
+                    exhausted = len(points) < batch
+                    if snap_to_surface:
+                        with profiler.phase("snap"):
+                            snapped = snap(
+                                world, points, [actor], low["z"], high["z"], z_offset
+                            )
+                        unsnapped += sum(1 for point in snapped if point is None)
+                        points = [point for point in snapped if point is not None]
+                    elif z_offset:
+                        points = [(x, y, z + z_offset) for x, y, z in points]
+
+                    with profiler.phase("add_instances"):
+                        transforms = [scatter.transform(*point) for point in points]
+                        if transforms:
+                            component.add_instances(transforms, False, True)
+                    placed += len(transforms)
+                    batches += 1
+                    if exhausted:
+                        break
+            except Exception:
+                if spawned:
+                    unreal.get_editor_subsystem(
+                        unreal.EditorActorSubsystem
+                    ).destroy_actors([actor])
+                raise
+
+        return {
+            "success": True,
+            "actor_name": actor.get_name(),
+            "actor_label": actor.get_actor_label(),
+            "component_class": type(component).__name__,
+            "instances_requested": wanted,
+            "instances_added": placed,
+            "instances_total": component.get_instance_count(),
+            "unsnapped": unsnapped,
+            "short_of_area": wanted - placed - unsnapped,
+            "area_m2": round(area_m2, 2),
+            "seed": seed,
+            "batches": batches,
+        }
+
+    except Exception as e:
+        return {"error": f"Failed to scatter instances: {str(e)}"}
+
+
+def main(
+    mesh_path: str,
+    bounds: Optional[Dict[str, Dict[str, float]]] = None,
+    spline_actor: Optional[str] = None,
+    count: Optional[int] = None,
+    density: Optional[float] = None,
+    seed: int = 0,
+    yaw: Optional[List[float]] = None,
+    pitch: Optional[List[float]] = None,
+    roll: Optional[List[float]] = None,
+    scale: Optional[List[float]] = None,
+    snap_to_surface: bool = False,
+    z_offset: float = 0.0,
+    materials: Optional[List[str]] = None,
+    actor_name: Optional[str] = None,
+    label: Optional[str] = None,
+    hierarchical: bool = True,
+):
+    result = scatter_instances(
+        mesh_path,
+        bounds,
+        spline_actor,
+        count,
+        density,
+        seed,
+        yaw,
+        pitch,
+        roll,
+        scale,
+        snap_to_surface,
+        z_offset,
+        materials,
+        actor_name,
+        label,
+        hierarchical,
+    )
+    channel.send(result)
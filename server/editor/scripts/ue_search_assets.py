@@ -1,58 +1,80 @@
-from typing import Dict, List, Any, Optional
-import unreal
-import json
+from typing import Dict, Any, Optional
 
+from . import asset_index
+from . import channel
+from . import paging
 
-def search_assets(
-    search_term: str, asset_class: Optional[str] = None
-) -> Dict[str, Any]:
-    asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
-    all_assets = asset_registry.get_all_assets()
-
-    matching_assets = []
-    search_term_lower = search_term.lower()
-
-    for asset in all_assets:
-        asset_name = str(asset.asset_name).lower()
-        package_path = str(asset.package_path).lower()
-        asset_class_name = str(asset.asset_class_path.asset_name).lower()
+MAX_LIMIT = 1000
 
-        name_match = search_term_lower in asset_name
-        path_match = search_term_lower in package_path
 
-        class_match = True
-        if asset_class:
-            class_match = asset_class.lower() in asset_class_name
+def search_assets(
+    search_term: str,
+    asset_class: Optional[str] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    path_prefix: Optional[str] = None,
+) -> Dict[str, Any]:
+    limit = max(1, min(limit, MAX_LIMIT))
 
-        if (name_match or path_match) and class_match:
-            matching_assets.append(
-                {
-                    "name": str(asset.asset_name),
-                    "path": str(asset.package_path),
-                    "class": str(asset.asset_class_path.asset_name),
-                    "package_name": str(asset.package_name),
-                }
-            )
+    if cursor:
+        try:
+            snapshot, offset = paging.resolve(cursor)
+        except ValueError as e:
+            return {"error": str(e)}
+    else:
+        index = asset_index.get_index()
+        matches = index.search(search_term, asset_class, path_prefix)
 
-    def relevance_score(asset):
-        name_exact = search_term_lower == asset["name"].lower()
-        name_starts = asset["name"].lower().startswith(search_term_lower)
-        return (name_exact * 3) + (name_starts * 2) + 1
+        # Rank once and freeze the matches so later pages don't search again.
+        # Sorting by (-score, slot) keeps registry order between equal scores.
+        snapshot = paging.Snapshot(
+            [
+                (
+                    -index.relevance(search_term, slot),
+                    slot,
+                    index.names[slot],
+                    index.paths[slot],
+                    index.classes[slot],
+                    index.package_names[slot],
+                )
+                for slot in matches
+            ],
+            {
+                "search_term": search_term,
+                "asset_class_filter": asset_class,
+                "path_prefix": path_prefix,
+            },
+        )
+        offset = 0
 
-    matching_assets.sort(key=relevance_score, reverse=True)
+    page = snapshot.page(offset, limit)
+    next_cursor = snapshot.next_cursor(offset, limit)
+    if next_cursor and not cursor:
+        paging.keep(snapshot)
 
     return {
-        "search_term": search_term,
-        "asset_class_filter": asset_class,
-        "total_matches": len(matching_assets),
-        "assets": matching_assets[:50],  # Limit to 50 results
+        **snapshot.meta,
+        "total_matches": len(snapshot.items),
+        "offset": offset,
+        "assets": [
+            {
+                "name": name,
+                "path": path,
+                "class": class_name,
+                "package_name": package_name,
+            }
+            for _, _, name, path, class_name, package_name in page
+        ],
+        "next_cursor": next_cursor,
     }
 
 
-def main():
-    result = search_assets("${search_term}", "${asset_class}")
-    print(json.dumps(result, indent=2))
-
-
-if __name__ == "__main__":
-    main()
+def main(
+    search_term: str,
+    asset_class: str = "",
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    path_prefix: Optional[str] = None,
+):
+    result = search_assets(search_term, asset_class, limit, cursor, path_prefix)
+    channel.send(result)
@@ -0,0 +1,169 @@
+from typing import Any, Dict, List, Optional, Tuple
+import unreal
+
+from . import actor_lookup
+from . import channel
+from . import spatial_index
+
+QUERIES = ("radius", "box", "nearest", "overlap")
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+DEFAULT_NEAREST = 10
+
+
+def read_point(value: Dict[str, float]) -> spatial_index.Point:
+    return (float(value["x"]), float(value["y"]), float(value["z"]))
+
+
+def query_area(
+    query: str,
+    center: Optional[Dict[str, float]],
+    box: Optional[Dict[str, Dict[str, float]]],
+    reference: Optional[spatial_index.Entry],
+) -> Tuple[Optional[spatial_index.Point], Optional[tuple]]:
+    """Center and box of the query, taken from the reference actor when the
+    caller gave neither."""
+    point = read_point(center) if center else None
+    bounds = None
+    if box:
+        corners = (read_point(box["min"]), read_point(box["max"]))
+        bounds = (
+            tuple(min(corner[axis] for corner in corners) for axis in range(3)),
+            tuple(max(corner[axis] for corner in corners) for axis in range(3)),
+        )
+    if reference is not None:
+        if point is None:
+            point = reference.location
+        if bounds is None:
+            bounds = (reference.low, reference.high)
+    if point is None and bounds is not None:
+        point = tuple((bounds[0][axis] + bounds[1][axis]) / 2.0 for axis in range(3))
+    return point, bounds
+
+
+def describe(entry: spatial_index.Entry, gap: float, include_bounds: bool):
+    x, y, z = entry.location
+    row = {
+        "name": entry.name,
+        "label": entry.actor.get_actor_label(),
+        "class": entry.get_class_name(),
+        "location": {"x": x, "y": y, "z": z},
+        "distance": round(gap, 2),
+    }
+    if include_bounds:
+        row["bounds"] = {
+            "min": dict(zip("xyz", entry.low)),
+            "max": dict(zip("xyz", entry.high)),
+        }
+    return row
+
+
+def spatial_query(
+    query: str,
+    center: Optional[Dict[str, float]] = None,
+    radius: Optional[float] = None,
+    box: Optional[Dict[str, Dict[str, float]]] = None,
+    actor_name: Optional[str] = None,
+    count: int = DEFAULT_NEAREST,
+    class_names: Optional[List[str]] = None,
+    include_bounds: bool = False,
+    limit: int = DEFAULT_LIMIT,
+) -> Dict[str, Any]:
+    if query not in QUERIES:
+        return {"error": f"Unknown query {query}, use {', '.join(QUERIES)}"}
+
+    world = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem).get_editor_world()
+    if not world:
+        return {"error": "No world loaded"}
+
+    index, update = spatial_index.get_index(world)
+
+    reference = None
+    if actor_name:
+        reference = index.entries.get(actor_name)
+        if reference is None:
+            # Labels go through the shared lookup
+            actor = actor_lookup.get_lookup().find(actor_name)
+            if actor is None:
+                return {"error": f"Actor not found: {actor_name}"}
+            reference = index.entries.get(actor.get_name())
+            if reference is None:
+                return {"error": f"Actor {actor_name} is not indexed yet, try again"}
+
+    point, bounds = query_area(query, center, box, reference)
+    if query in ("radius", "nearest") and point is None:
+        return {"error": f"The {query} query needs center or actor_name"}
+    if query in ("box", "overlap") and bounds is None:
+        return {"error": f"The {query} query needs box or actor_name"}
+    if query == "radius" and radius is None:
+        return {"error": "The radius query needs radius"}
+
+    wanted = set(class_names) if class_names else None
+
+    def accept(entry: spatial_index.Entry) -> bool:
+        if reference is not None and entry is reference:
+            return False
+        try:
+            return wanted is None or entry.get_class_name() in wanted
+        except Exception:
+            # Deleted since the index last heard of it
+            return False
+
+    if query == "radius":
+        found = index.within_radius(point, radius)
+    elif query == "nearest":
+        found = index.nearest(point, max(1, count), radius, accept)
+    else:
+        entries = (
+            index.within_box(*bounds) if query == "box" else index.overlapping(*bounds)
+        )
+        found = sorted(
+            (
+                (spatial_index.distance(point, entry.location), entry)
+                for entry in entries
+            ),
+            key=lambda item: (item[0], item[1].name),
+        )
+
+    matches = [(gap, entry) for gap, entry in found if accept(entry)]
+    limit = max(1, min(limit, MAX_LIMIT))
+    actors = []
+    for gap, entry in matches[:limit]:
+        try:
+            actors.append(describe(entry, gap, include_bounds))
+        except Exception:
+            continue
+
+    return {
+        "query": query,
+        "center": dict(zip("xyz", point)) if point else None,
+        "total_matches": len(matches),
+        "truncated": len(matches) > limit,
+        "actors": actors,
+        "index": {**index.stats(), **update},
+    }
+
+
+def main(
+    query: str,
+    center: Optional[Dict[str, float]] = None,
+    radius: Optional[float] = None,
+    box: Optional[Dict[str, Dict[str, float]]] = None,
+    actor_name: Optional[str] = None,
+    count: int = DEFAULT_NEAREST,
+    class_names: Optional[List[str]] = None,
+    include_bounds: bool = False,
+    limit: int = DEFAULT_LIMIT,
+):
+    result = spatial_query(
+        query,
+        center,
+        radius,
+        box,
+        actor_name,
+        count,
+        class_names,
+        include_bounds,
+        limit,
+    )
+    channel.send(result)
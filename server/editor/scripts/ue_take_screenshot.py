@@ -1,32 +1,88 @@
+from typing import Any, Dict, Optional
 import unreal
 import os
-from pathlib import Path
-import tempfile
+import time
 
+from . import capture
+from . import channel
 
-def take_screenshot() -> str:
-    try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as temp_file:
-            screenshot_path = temp_file.name
+# A conversion is dropped when the capture hasn't been written by then
+CONVERT_TIMEOUT_SECONDS = 15.0
+
+# Tick callbacks of conversions still waiting for their capture
+_pending: Dict[str, Any] = {}
 
-            unreal.AutomationLibrary.take_high_res_screenshot(640, 520, screenshot_path)
 
-            return screenshot_path
+def convert_when_ready(source: str, target: str, quality: int) -> bool:
+    """Convert the capture on the first editor tick after it was written."""
+    deadline = time.time() + CONVERT_TIMEOUT_SECONDS
 
-        return ""
+    def on_tick(delta_seconds: float):
+        complete = capture.capture_complete(source)
+        if not complete and time.time() < deadline:
+            return
+        handle = _pending.pop(target, None)
+        if handle is not None:
+            unreal.unregister_slate_post_tick_callback(handle)
+        if complete:
+            try:
+                capture.convert_image(source, target, quality)
+            finally:
+                os.remove(source)
 
+    try:
+        _pending[target] = unreal.register_slate_post_tick_callback(on_tick)
     except Exception:
-        return ""
+        return False
+    return True
+
+
+def take_screenshot(
+    width: int = 640,
+    height: int = 520,
+    image_format: str = "png",
+    quality: int = 85,
+    camera: Optional["unreal.CameraActor"] = None,
+) -> Dict[str, Any]:
+    """Request a capture, the editor writes it on a later frame.
 
+    JPEG results appear at the returned path in one step, PNG captures are
+    written in place by the editor so readers should wait for their trailer.
+    """
+    if image_format not in ("png", "jpg"):
+        return {"error": f"Unknown format {image_format}, use png or jpg"}
+    width = capture.clamp_resolution(width)
+    height = capture.clamp_resolution(height)
+    quality = max(1, min(int(quality), 100))
 
-def main():
-    path = take_screenshot()
-    if path:
-        print(path)
-    else:
-        print("Failed to take screenshot")
+    capture_path = capture.temp_image_path("png")
+    unreal.AutomationLibrary.take_high_res_screenshot(
+        width, height, capture_path, camera
+    )
 
+    path = capture_path
+    if image_format == "jpg":
+        path = capture.temp_image_path("jpg")
+        if not convert_when_ready(capture_path, path, quality):
+            # No tick callback to convert with, hand out the PNG instead
+            path = capture_path
+            image_format = "png"
+
+    return {"path": path, "format": image_format, "width": width, "height": height}
+
+
+def main(width: int = 640, height: int = 520, format: str = "png", quality: int = 85):
+    try:
+        result = take_screenshot(width, height, format, quality)
+    except Exception as e:
+        result = {"error": f"Failed to take screenshot: {str(e)}"}
+    channel.send(result)
 
-if __name__ == "__main__":
-    main()
 
+def unregister():
+    for handle in _pending.values():
+        try:
+            unreal.unregister_slate_post_tick_callback(handle)
+        except Exception:
+            pass
+    _pending.clear()
@@ -1,6 +1,8 @@
 from typing import Dict, Any, Optional
 import unreal
-import json
+
+from . import actor_lookup
+from . import channel
 
 
 def update_object(
@@ -18,45 +20,56 @@ def update_object(
         if not world:
             return {"error": "No world loaded"}
 
-        all_actors = unreal.get_editor_subsystem(
-            unreal.EditorActorSubsystem
-        ).get_all_level_actors()
-        target_actor = None
-
-        for actor in all_actors:
-            if actor.get_name() == actor_name or actor.get_actor_label() == actor_name:
-                target_actor = actor
-                break
+        lookup = actor_lookup.get_lookup()
+        target_actor = lookup.find(actor_name)
 
         if not target_actor:
             return {"error": f"Actor not found: {actor_name}"}
 
+        # The current value is only read when an axis is missing, and once
         if location:
+            current = (
+                None
+                if all(axis in location for axis in ("x", "y", "z"))
+                else target_actor.get_actor_location()
+            )
             new_location = unreal.Vector(
-                x=location.get("x", target_actor.get_actor_location().x),
-                y=location.get("y", target_actor.get_actor_location().y),
-                z=location.get("z", target_actor.get_actor_location().z),
+                x=location.get("x", current.x if current else 0.0),
+                y=location.get("y", current.y if current else 0.0),
+                z=location.get("z", current.z if current else 0.0),
             )
             target_actor.set_actor_location(new_location, False, False)
 
         if rotation:
+            current = (
+                None
+                if all(axis in rotation for axis in ("pitch", "yaw", "roll"))
+                else target_actor.get_actor_rotation()
+            )
             new_rotation = unreal.Rotator(
-                pitch=rotation.get("pitch", target_actor.get_actor_rotation().pitch),
-                yaw=rotation.get("yaw", target_actor.get_actor_rotation().yaw),
-                roll=rotation.get("roll", target_actor.get_actor_rotation().roll),
+                pitch=rotation.get("pitch", current.pitch if current else 0.0),
+                yaw=rotation.get("yaw", current.yaw if current else 0.0),
+                roll=rotation.get("roll", current.roll if current else 0.0),
             )
             target_actor.set_actor_rotation(new_rotation, False)
 
         if scale:
+            current = (
+                None
+                if all(axis in scale for axis in ("x", "y", "z"))
+                else target_actor.get_actor_scale3d()
+            )
             new_scale = unreal.Vector(
-                x=scale.get("x", target_actor.get_actor_scale3d().x),
-                y=scale.get("y", target_actor.get_actor_scale3d().y),
-                z=scale.get("z", target_actor.get_actor_scale3d().z),
+                x=scale.get("x", current.x if current else 1.0),
+                y=scale.get("y", current.y if current else 1.0),
+                z=scale.get("z", current.z if current else 1.0),
             )
             target_actor.set_actor_scale3d(new_scale)
 
         if new_name:
+            old_label = target_actor.get_actor_label()
             target_actor.set_actor_label(new_name)
+            lookup.relabel(target_actor, old_label)
 
         if properties:
             for prop_name, prop_value in properties.items():
@@ -66,25 +79,29 @@ def update_object(
                 except Exception as e:
                     continue
 
+        actor_location = target_actor.get_actor_location()
+        actor_rotation = target_actor.get_actor_rotation()
+        actor_scale = target_actor.get_actor_scale3d()
+
         return {
             "success": True,
             "actor_name": target_actor.get_name(),
             "actor_label": target_actor.get_actor_label(),
             "class": target_actor.get_class().get_name(),
             "location": {
-                "x": target_actor.get_actor_location().x,
-                "y": target_actor.get_actor_location().y,
-                "z": target_actor.get_actor_location().z,
+                "x": actor_location.x,
+                "y": actor_location.y,
+                "z": actor_location.z,
             },
             "rotation": {
-                "pitch": target_actor.get_actor_rotation().pitch,
-                "yaw": target_actor.get_actor_rotation().yaw,
-                "roll": target_actor.get_actor_rotation().roll,
+                "pitch": actor_rotation.pitch,
+                "yaw": actor_rotation.yaw,
+                "roll": actor_rotation.roll,
             },
             "scale": {
-                "x": target_actor.get_actor_scale3d().x,
-                "y": target_actor.get_actor_scale3d().y,
-                "z": target_actor.get_actor_scale3d().z,
+                "x": actor_scale.x,
+                "y": actor_scale.y,
+                "z": actor_scale.z,
             },
         }
 
@@ -92,37 +109,14 @@ def update_object(
         return {"error": f"Failed to update object: {str(e)}"}
 
 
-def parse_value(value_str):
-    import json as parse_json
-
-    if value_str and value_str != "null" and value_str.strip():
-        try:
-            return parse_json.loads(value_str)
-        except Exception:
-            return None
-    return None
-
-
-def parse_string(value_str):
-    if value_str and value_str != "null" and value_str.strip():
-        return value_str
-    return None
-
-
-def main():
-    actor_name = "${actor_name}"
-    location_str = """${location}"""
-    rotation_str = """${rotation}"""
-    scale_str = """${scale}"""
-    properties_str = """${properties}"""
-    new_name_str = """${new_name}"""
-
-    location = parse_value(location_str)
-    rotation = parse_value(rotation_str)
-    scale = parse_value(scale_str)
-    properties = parse_value(properties_str)
-    new_name = parse_string(new_name_str)
-
+def main(
+    actor_name: str,
+    location: Optional[Dict[str, float]] = None,
+    rotation: Optional[Dict[str, float]] = None,
+    scale: Optional[Dict[str, float]] = None,
+    properties: Optional[Dict[str, Any]] = None,
+    new_name: Optional[str] = None,
+):
     result = update_object(
         actor_name=actor_name,
         location=location,
@@ -131,8 +125,4 @@ def main():
         properties=properties,
         new_name=new_name,
     )
-    print(json.dumps(result, indent=2))
-
-
-if __name__ == "__main__":
-    main()
+    channel.send(result)
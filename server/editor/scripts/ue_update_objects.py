@@ -0,0 +1,141 @@
+from typing import Dict, Any, List, Optional
+import unreal
+
+from . import actor_lookup
+from . import channel
+
+MAX_OBJECTS = 50000
+
+
+def unpack(values: Optional[List[Optional[float]]], index: int):
+    """Return the 3 values of item index from a packed array, None if absent."""
+    if not values:
+        return None
+    triple = values[index * 3 : index * 3 + 3]
+    if len(triple) != 3 or all(value is None for value in triple):
+        return None
+    return triple
+
+
+def read_parts(actor) -> List[List[float]]:
+    transform = actor.get_actor_transform()
+    location = transform.translation
+    rotation = transform.rotation.rotator()
+    scale = transform.scale3d
+    return [
+        [location.x, location.y, location.z],
+        [rotation.pitch, rotation.yaw, rotation.roll],
+        [scale.x, scale.y, scale.z],
+    ]
+
+
+def merge(triple: List[Optional[float]], current) -> List[float]:
+    return [
+        value if value is not None else current[axis]
+        for axis, value in enumerate(triple)
+    ]
+
+
+def update_objects(
+    actor_names: List[str],
+    locations: Optional[List[Optional[float]]] = None,
+    rotations: Optional[List[Optional[float]]] = None,
+    scales: Optional[List[Optional[float]]] = None,
+    properties: Optional[List[Optional[Dict[str, Any]]]] = None,
+) -> Dict[str, Any]:
+    try:
+        world = unreal.get_editor_subsystem(
+            unreal.UnrealEditorSubsystem
+        ).get_editor_world()
+        if not world:
+            return {"error": "No world loaded"}
+
+        if len(actor_names) > MAX_OBJECTS:
+            return {"error": f"Too many objects, at most {MAX_OBJECTS} per call"}
+
+        for label, values in (
+            ("locations", locations),
+            ("rotations", rotations),
+            ("scales", scales),
+        ):
+            if values and len(values) != len(actor_names) * 3:
+                return {
+                    "error": f"{label} must hold 3 values per actor ({len(actor_names) * 3}), got {len(values)}"
+                }
+        if properties and len(properties) != len(actor_names):
+            return {"error": "properties must hold one entry (or null) per actor"}
+
+        found = actor_lookup.get_lookup().find_many(actor_names)
+
+        not_found = []
+        errors = []
+        updated = 0
+
+        # One undo step for the whole batch
+        with unreal.ScopedEditorTransaction(
+            f"MCP Update {len(actor_names)} Objects"
+        ):
+            for index, actor_name in enumerate(actor_names):
+                actor = found.get(actor_name)
+                if actor is None:
+                    not_found.append(actor_name)
+                    continue
+
+                try:
+                    location = unpack(locations, index)
+                    rotation = unpack(rotations, index)
+                    scale = unpack(scales, index)
+
+                    if location or rotation or scale:
+                        # A single transform read covers every missing axis
+                        # and a single write sets all three parts
+                        parts = [location, rotation, scale]
+                        if any(part is None or None in part for part in parts):
+                            parts = [
+                                merge(part or [None, None, None], current)
+                                for part, current in zip(parts, read_parts(actor))
+                            ]
+                        location, (pitch, yaw, roll), scale = parts
+
+                        actor.set_actor_transform(
+                            unreal.Transform(
+                                unreal.Vector(*location),
+                                unreal.Rotator(pitch=pitch, yaw=yaw, roll=roll),
+                                unreal.Vector(*scale),
+                            ),
+                            False,
+                            False,
+                        )
+
+                    actor_properties = properties[index] if properties else None
+                    if actor_properties:
+                        for prop_name, prop_value in actor_properties.items():
+                            if hasattr(actor, prop_name):
+                                setattr(actor, prop_name, prop_value)
+
+                    updated += 1
+
+                except Exception as e:
+                    errors.append({"index": index, "error": str(e)})
+
+        return {
+            "success": not not_found and not errors,
+            "total_requested": len(actor_names),
+            "updated": updated,
+            "not_found": not_found,
+            "errors": errors,
+        }
+
+    except Exception as e:
+        return {"error": f"Failed to update objects: {str(e)}"}
+
+
+def main(
+    actor_names: List[str],
+    locations: Optional[List[Optional[float]]] = None,
+    rotations: Optional[List[Optional[float]]] = None,
+    scales: Optional[List[Optional[float]]] = None,
+    properties: Optional[List[Optional[Dict[str, Any]]]] = None,
+):
+    result = update_objects(actor_names, locations, rotations, scales, properties)
+    channel.send(result)
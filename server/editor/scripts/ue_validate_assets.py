@@ -1,10 +1,60 @@
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 import unreal
-import json
+
+from . import channel
+from . import jobs
+
+
+def validate_asset(
+    asset_path: str, asset_data=None, fast: bool = False
+) -> Tuple[bool, Dict[str, Any]]:
+    """Validate one asset, returns (is_valid, record).
+
+    When asset_data comes from the registry the asset is known to exist and
+    its data needn't be looked up again. Fast mode only checks the registry
+    metadata and never loads the package.
+    """
+    try:
+        if asset_data is None:
+            if not unreal.EditorAssetLibrary.does_asset_exist(asset_path):
+                return False, {"path": asset_path, "error": "Asset does not exist"}
+            asset_data = unreal.EditorAssetLibrary.find_asset_data(asset_path)
+
+        if not asset_data.is_valid():
+            return False, {"path": asset_path, "error": "Asset data is invalid"}
+
+        if fast:
+            asset_class = str(asset_data.asset_class_path.asset_name)
+            if not asset_class or asset_class == "None":
+                return False, {"path": asset_path, "error": "Asset class is unknown"}
+        else:
+            asset = unreal.EditorAssetLibrary.load_asset(asset_path)
+            if not asset:
+                return False, {"path": asset_path, "error": "Failed to load asset"}
+            asset_class = asset.get_class().get_name()
+
+        return True, {
+            "path": asset_path,
+            "class": asset_class,
+            "size": asset_data.get_tag_value("AssetFileSize") or "Unknown",
+        }
+
+    except Exception as e:
+        return False, {"path": asset_path, "error": str(e)}
+
+
+def validation_summary(valid_count: int, invalid_count: int) -> Dict[str, Any]:
+    total = valid_count + invalid_count
+    return {
+        "valid_count": valid_count,
+        "invalid_count": invalid_count,
+        "success_rate": round(valid_count / total * 100, 2) if total > 0 else 0,
+    }
 
 
 def validate_assets(
     asset_paths: Optional[Union[str, List[str]]] = None,
+    fast: bool = False,
 ) -> Dict[str, Any]:
     validation_results = {
         "total_validated": 0,
@@ -14,75 +64,80 @@ def validate_assets(
     }
 
     if asset_paths:
-        assets_to_validate = (
-            asset_paths if isinstance(asset_paths, list) else [asset_paths]
-        )
+        assets_to_validate = [
+            (asset_path, None)
+            for asset_path in (
+                asset_paths if isinstance(asset_paths, list) else [asset_paths]
+            )
+        ]
     else:
         asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
         all_assets = asset_registry.get_all_assets()
         assets_to_validate = [
-            str(asset.package_path) + "/" + str(asset.asset_name)
+            (str(asset.package_path) + "/" + str(asset.asset_name), asset)
             for asset in all_assets[:100]
-        ]  # Limit to 100 for performance
+        ]  # Limit to 100 for performance, use background=True for the whole project
 
     validation_results["total_validated"] = len(assets_to_validate)
 
-    for asset_path in assets_to_validate:
-        try:
-            if not unreal.EditorAssetLibrary.does_asset_exist(asset_path):
-                validation_results["invalid_assets"].append(
-                    {"path": asset_path, "error": "Asset does not exist"}
-                )
-                continue
+    for asset_path, asset_data in assets_to_validate:
+        is_valid, record = validate_asset(asset_path, asset_data, fast)
+        if is_valid:
+            validation_results["valid_assets"].append(record)
+        else:
+            validation_results["invalid_assets"].append(record)
 
-            asset = unreal.EditorAssetLibrary.load_asset(asset_path)
-            if not asset:
-                validation_results["invalid_assets"].append(
-                    {"path": asset_path, "error": "Failed to load asset"}
-                )
-                continue
+    # Generate summary
+    validation_results["validation_summary"] = validation_summary(
+        len(validation_results["valid_assets"]),
+        len(validation_results["invalid_assets"]),
+    )
 
-            asset_data = unreal.EditorAssetLibrary.find_asset_data(asset_path)
-            if not asset_data.is_valid():
-                validation_results["invalid_assets"].append(
-                    {"path": asset_path, "error": "Asset data is invalid"}
-                )
-                continue
-
-            validation_results["valid_assets"].append(
-                {
-                    "path": asset_path,
-                    "class": asset.get_class().get_name(),
-                    "size": asset_data.get_tag_value("AssetFileSize") or "Unknown",
-                }
-            )
+    return validation_results
 
-        except Exception as e:
-            validation_results["invalid_assets"].append(
-                {"path": asset_path, "error": str(e)}
-            )
 
-    # Generate summary
-    validation_results["validation_summary"] = {
-        "valid_count": len(validation_results["valid_assets"]),
-        "invalid_count": len(validation_results["invalid_assets"]),
-        "success_rate": round(
-            len(validation_results["valid_assets"])
-            / validation_results["total_validated"]
-            * 100,
-            2,
-        )
-        if validation_results["total_validated"] > 0
-        else 0,
-    }
+def start_validation_job(
+    asset_paths: Optional[List[str]] = None, fast: bool = False
+) -> jobs.Job:
+    if asset_paths:
+        targets = [(asset_path, None) for asset_path in asset_paths]
+    else:
+        # Paths are built lazily in the job so starting it stays cheap
+        asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+        targets = [(None, asset) for asset in asset_registry.get_all_assets()]
 
-    return validation_results
+    state = {"fast": fast, "valid_count": 0, "invalid_assets": []}
 
+    def work():
+        for asset_path, asset_data in targets:
+            if asset_path is None:
+                asset_path = str(asset_data.package_path) + "/" + str(asset_data.asset_name)
+            is_valid, record = validate_asset(asset_path, asset_data, fast)
+            if is_valid:
+                state["valid_count"] += 1
+            else:
+                state["invalid_assets"].append(record)
+            yield
 
-def main():
-    result = validate_assets("${asset_paths}")
-    print(json.dumps(result, indent=2))
+    def report(state: Dict[str, Any], offset: int, limit: int) -> Dict[str, Any]:
+        invalid_assets = state["invalid_assets"]
+        next_offset = offset + limit
+        return {
+            "fast": state["fast"],
+            "validation_summary": validation_summary(
+                state["valid_count"], len(invalid_assets)
+            ),
+            "invalid_assets": invalid_assets[offset:next_offset],
+            "next_offset": next_offset if next_offset < len(invalid_assets) else None,
+        }
 
+    return jobs.start(jobs.Job("validate_assets", work(), len(targets), state, report))
 
-if __name__ == "__main__":
-    main()
+
+def main(asset_paths: str = "", fast: bool = False, background: bool = False):
+    if background:
+        job = start_validation_job([asset_paths] if asset_paths else None, fast)
+        channel.send(job.describe(0, 0))
+    else:
+        result = validate_assets(asset_paths, fast)
+        channel.send(result)
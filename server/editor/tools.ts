@@ -1,3 +1,4 @@
+import crypto from "node:crypto"
 import fs from "node:fs"
 import path from "node:path"
 import { Template } from "../utils.js"
@@ -6,32 +7,231 @@ export function read(filePath: string): string {
 	return fs.readFileSync(path.join(__dirname, filePath), "utf8")
 }
 
-export const UEGetAssetInfo = (asset_path: string) => Template(read("./scripts/ue_get_asset_info.py"), { asset_path })
+// Marker printed by the editor when the installed helper is missing or out of date
+export const HELPER_STALE = "rrmcp:stale"
 
-export const UEListAssets = () => Template(read("./scripts/ue_list_assets.py"))
+// Prefixes of the line a script sends its result on, either the JSON itself or the path of a file holding it
+// (see scripts/channel.py)
+export const RESULT_PREFIX = "rrmcp:result:"
+export const RESULT_FILE_PREFIX = "rrmcp:file:"
 
-export const UEExportAsset = (asset_path: string) => Template(read("./scripts/ue_export_asset.py"), { asset_path })
+// Prefix of the line a profiled call prints its timings on (see scripts/profiler.py)
+export const PROFILE_PREFIX = "rrmcp:profile:"
 
-export const UEGetAssetReferences = (asset_path: string) =>
-	Template(read("./scripts/ue_get_asset_references.py"), { asset_path })
+// When set, helper calls are run under the editor side profiler
+let profileCalls = false
 
-export const UEConsoleCommand = (command: string) => Template(read("./scripts/ue_console_command.py"), { command })
+export const setProfiling = (enabled: boolean) => {
+	profileCalls = enabled
+}
+
+export const isProfiling = () => profileCalls
+
+const loadHelperSources = () => {
+	const dir = path.join(__dirname, "scripts")
+	return Object.fromEntries(
+		fs
+			.readdirSync(dir)
+			.filter((file) => file.endsWith(".py"))
+			.sort()
+			.map((file) => [path.basename(file, ".py"), fs.readFileSync(path.join(dir, file), "utf8")]),
+	)
+}
+
+const helperSources = loadHelperSources()
+
+export const helperHash = crypto
+	.createHash("sha256")
+	.update(JSON.stringify(helperSources))
+	.digest("hex")
+	.slice(0, 16)
 
-export const UEGetProjectInfo = () => Template(read("./scripts/ue_get_project_info.py"))
+export const UEInstallHelper = () =>
+	Template(read("./install.py"), {
+		hash: helperHash,
+		sources: JSON.stringify(JSON.stringify(helperSources)),
+	})
+
+// Build a small command that calls `main(**args)` of an installed helper module.
+// JSON.stringify of a JSON string yields a valid Python string literal.
+export const UECall = (module: string, args: Record<string, any> = {}) =>
+	[
+		"import sys",
+		'_rrmcp = sys.modules.get("rrmcp")',
+		`if _rrmcp is None or getattr(_rrmcp, "HASH", None) != "${helperHash}":`,
+		`    print("${HELPER_STALE}")`,
+		"else:",
+		`    _rrmcp.run("${module}", ${JSON.stringify(JSON.stringify(args))}${profileCalls ? ", True" : ""})`,
+	].join("\n")
+
+export const UEGetAssetInfo = (asset_path: string) => UECall("ue_get_asset_info", { asset_path })
+
+export const UEGetAssetsInfo = (options: {
+	asset_paths?: string[]
+	path_prefix?: string
+	asset_class?: string
+	fields?: string[]
+	tags?: string[]
+	limit?: number
+	cursor?: string
+}) =>
+	UECall("ue_get_assets_info", {
+		asset_paths: options.asset_paths ?? null,
+		path_prefix: options.path_prefix ?? null,
+		asset_class: options.asset_class ?? null,
+		fields: options.fields ?? null,
+		tags: options.tags ?? null,
+		limit: options.limit ?? 100,
+		cursor: options.cursor ?? null,
+	})
+
+export const UEListAssets = (limit?: number, cursor?: string, path_prefix?: string) =>
+	UECall("ue_list_assets", {
+		limit: limit ?? 1000,
+		cursor: cursor ?? null,
+		path_prefix: path_prefix || "/Game/",
+	})
+
+export const UEExportAsset = (
+	asset_paths: string[],
+	encoding?: "base64" | "path",
+	offset?: number,
+	length?: number,
+	offsets?: Record<string, number>,
+) => UECall("ue_export_asset", { asset_paths, encoding, offset, length, offsets })
+
+export const UEGetAssetReferences = (asset_path: string) => UECall("ue_get_asset_references", { asset_path })
+
+export const UEGetAssetGraph = (
+	asset_path: string,
+	options?: {
+		direction?: "referencers" | "dependencies"
+		max_depth?: number
+		include_hard?: boolean
+		include_soft?: boolean
+		class_filter?: string[]
+		max_nodes?: number
+		include_classes?: boolean
+	},
+) =>
+	UECall("ue_get_asset_graph", {
+		asset_path,
+		direction: options?.direction ?? "referencers",
+		max_depth: options?.max_depth ?? 3,
+		include_hard: options?.include_hard ?? true,
+		include_soft: options?.include_soft ?? true,
+		class_filter: options?.class_filter ?? null,
+		max_nodes: options?.max_nodes ?? 5000,
+		include_classes: options?.include_classes ?? true,
+	})
+
+export const UEConsoleCommand = (command: string) => UECall("ue_console_command", { command })
+
+export const UEGetProjectInfo = () => UECall("ue_get_project_info")
+
+export const UEGetMapInfo = (options?: { statistics?: string[]; level?: string; top_classes?: number }) =>
+	UECall("ue_get_map_info", {
+		statistics: options?.statistics ?? null,
+		level: options?.level ?? null,
+		top_classes: options?.top_classes ?? 15,
+	})
 
-export const UEGetMapInfo = () => Template(read("./scripts/ue_get_map_info.py"))
+export const UEGetSceneBudget = (options?: { folder_prefix?: string; sort_by?: string; top_entries?: number }) =>
+	UECall("ue_get_scene_budget", {
+		folder_prefix: options?.folder_prefix ?? null,
+		sort_by: options?.sort_by ?? "triangles",
+		top_entries: options?.top_entries ?? 20,
+	})
 
-export const UESearchAssets = (search_term: string, asset_class?: string) =>
-	Template(read("./scripts/ue_search_assets.py"), {
+export const UESearchAssets = (
+	search_term: string,
+	asset_class?: string,
+	limit?: number,
+	cursor?: string,
+	path_prefix?: string,
+) =>
+	UECall("ue_search_assets", {
 		search_term,
 		asset_class: asset_class || "",
+		limit: limit ?? 50,
+		cursor: cursor ?? null,
+		path_prefix: path_prefix ?? null,
+	})
+
+export const UEGetAssetChanges = (options?: {
+	cursor?: string
+	limit?: number
+	event_types?: string[]
+	path_prefix?: string
+}) =>
+	UECall("ue_get_asset_changes", {
+		cursor: options?.cursor ?? null,
+		limit: options?.limit ?? 500,
+		event_types: options?.event_types ?? null,
+		path_prefix: options?.path_prefix ?? null,
 	})
 
-export const UEGetWorldOutliner = () => Template(read("./scripts/ue_get_world_outliner.py"))
+export const UEGetWorldOutliner = (options?: {
+	columnar?: boolean
+	fields?: string[]
+	class_filter?: string[]
+	folder_filter?: string
+	limit?: number
+	cursor?: string
+	since_version?: number
+}) =>
+	UECall("ue_get_world_outliner", {
+		columnar: options?.columnar ?? false,
+		fields: options?.fields ?? null,
+		class_filter: options?.class_filter ?? null,
+		folder_filter: options?.folder_filter ?? null,
+		limit: options?.limit ?? 1000,
+		cursor: options?.cursor ?? null,
+		since_version: options?.since_version ?? null,
+	})
+
+export const UESpatialQuery = (options: {
+	query: "radius" | "box" | "nearest" | "overlap"
+	center?: { x: number; y: number; z: number }
+	radius?: number
+	box?: { min: { x: number; y: number; z: number }; max: { x: number; y: number; z: number } }
+	actor_name?: string
+	count?: number
+	class_names?: string[]
+	include_bounds?: boolean
+	limit?: number
+}) =>
+	UECall("ue_spatial_query", {
+		query: options.query,
+		center: options.center ?? null,
+		radius: options.radius ?? null,
+		box: options.box ?? null,
+		actor_name: options.actor_name ?? null,
+		count: options.count ?? 10,
+		class_names: options.class_names ?? null,
+		include_bounds: options.include_bounds ?? false,
+		limit: options.limit ?? 100,
+	})
 
-export const UEValidateAssets = (asset_paths?: string) =>
-	Template(read("./scripts/ue_validate_assets.py"), {
+export const UEValidateAssets = (asset_paths?: string, fast?: boolean, background?: boolean) =>
+	UECall("ue_validate_assets", {
 		asset_paths: asset_paths || "",
+		fast: fast ?? false,
+		background: background ?? false,
+	})
+
+export const UEAuditAssets = (path_prefix?: string, root_paths?: string[]) =>
+	UECall("ue_audit_assets", {
+		path_prefix: path_prefix || "/Game/",
+		root_paths: root_paths ?? null,
+	})
+
+export const UEJobStatus = (job_id?: string, cancel?: boolean, offset?: number, limit?: number) =>
+	UECall("ue_job_status", {
+		job_id: job_id ?? null,
+		cancel: cancel ?? false,
+		offset: offset ?? 0,
+		limit: limit ?? 100,
 	})
 
 export const UECreateObject = (
@@ -42,16 +242,27 @@ export const UECreateObject = (
 	scale?: { x: number; y: number; z: number },
 	properties?: Record<string, any>,
 ) => {
-	return Template(read("./scripts/ue_create_object.py"), {
+	return UECall("ue_create_object", {
 		object_class,
 		object_name,
-		location: location ? JSON.stringify(location) : "null",
-		rotation: rotation ? JSON.stringify(rotation) : "null",
-		scale: scale ? JSON.stringify(scale) : "null",
-		properties: properties ? JSON.stringify(properties) : "null",
+		location: location ?? null,
+		rotation: rotation ?? null,
+		scale: scale ?? null,
+		properties: properties ?? null,
 	})
 }
 
+export const UECreateObjects = (
+	objects: {
+		object_class: string
+		object_name?: string
+		location?: { x: number; y: number; z: number }
+		rotation?: { pitch: number; yaw: number; roll: number }
+		scale?: { x: number; y: number; z: number }
+		properties?: Record<string, any>
+	}[],
+) => UECall("ue_create_objects", { objects })
+
 export const UEUpdateObject = (
 	actor_name: string,
 	location?: { x: number; y: number; z: number },
@@ -60,29 +271,124 @@ export const UEUpdateObject = (
 	properties?: Record<string, any>,
 	new_name?: string,
 ) => {
-	return Template(read("./scripts/ue_update_object.py"), {
+	return UECall("ue_update_object", {
 		actor_name,
-		location: location ? JSON.stringify(location) : "null",
-		rotation: rotation ? JSON.stringify(rotation) : "null",
-		scale: scale ? JSON.stringify(scale) : "null",
-		properties: properties ? JSON.stringify(properties) : "null",
-		new_name: new_name || "null",
+		location: location ?? null,
+		rotation: rotation ?? null,
+		scale: scale ?? null,
+		properties: properties ?? null,
+		new_name: new_name || null,
 	})
 }
 
+export const UEUpdateObjects = (
+	actor_names: string[],
+	locations?: (number | null)[],
+	rotations?: (number | null)[],
+	scales?: (number | null)[],
+	properties?: (Record<string, any> | null)[],
+) =>
+	UECall("ue_update_objects", {
+		actor_names,
+		locations: locations ?? null,
+		rotations: rotations ?? null,
+		scales: scales ?? null,
+		properties: properties ?? null,
+	})
+
 export const UEDeleteObject = (actor_names: string) =>
-	Template(read("./scripts/ue_delete_object.py"), {
+	UECall("ue_delete_object", {
 		actor_names,
 	})
 
-export const UETakeScreenshot = () => Template(read("./scripts/ue_take_screenshot.py"))
+export const UEInstanceActors = (options: {
+	actor_names?: string[]
+	selected?: boolean
+	folder_prefix?: string
+	min_group_size?: number
+	hierarchical?: boolean
+	dry_run?: boolean
+}) =>
+	UECall("ue_instance_actors", {
+		actor_names: options.actor_names ?? null,
+		selected: options.selected ?? false,
+		folder_prefix: options.folder_prefix ?? null,
+		min_group_size: options.min_group_size ?? 2,
+		hierarchical: options.hierarchical ?? true,
+		dry_run: options.dry_run ?? false,
+	})
+
+export const UEScatterInstances = (options: {
+	mesh_path: string
+	bounds?: { min: { x: number; y: number; z: number }; max: { x: number; y: number; z: number } }
+	spline_actor?: string
+	count?: number
+	density?: number
+	seed?: number
+	yaw?: number[]
+	pitch?: number[]
+	roll?: number[]
+	scale?: number[]
+	snap_to_surface?: boolean
+	z_offset?: number
+	materials?: string[]
+	actor_name?: string
+	label?: string
+	hierarchical?: boolean
+}) =>
+	UECall("ue_scatter_instances", {
+		mesh_path: options.mesh_path,
+		bounds: options.bounds ?? null,
+		spline_actor: options.spline_actor ?? null,
+		count: options.count ?? null,
+		density: options.density ?? null,
+		seed: options.seed ?? 0,
+		yaw: options.yaw ?? null,
+		pitch: options.pitch ?? null,
+		roll: options.roll ?? null,
+		scale: options.scale ?? null,
+		snap_to_surface: options.snap_to_surface ?? false,
+		z_offset: options.z_offset ?? 0,
+		materials: options.materials ?? null,
+		actor_name: options.actor_name ?? null,
+		label: options.label ?? null,
+		hierarchical: options.hierarchical ?? true,
+	})
+
+export const UETakeScreenshot = (options: {
+	width?: number
+	height?: number
+	format?: "png" | "jpg"
+	quality?: number
+}) => UECall("ue_take_screenshot", options)
+
+type CameraPose = {
+	location: { x: number; y: number; z: number }
+	rotation: { pitch: number; yaw: number; roll: number }
+}
+
+export const UECaptureViews = (options: {
+	views?: CameraPose[]
+	orbit?: {
+		actor_name?: string
+		center?: { x: number; y: number; z: number }
+		extent?: { x: number; y: number; z: number }
+		radius?: number
+		count?: number
+		pitches?: number[]
+	}
+	width?: number
+	height?: number
+	format?: "png" | "jpg"
+	quality?: number
+}) => UECall("ue_capture_views", options)
 
 export const UEMoveCamera = (
 	location: { x: number; y: number; z: number },
 	rotation: { pitch: number; yaw: number; roll: number },
 ) => {
-	return Template(read("./scripts/ue_move_camera.py"), {
-		location: JSON.stringify(location),
-		rotation: JSON.stringify(rotation),
+	return UECall("ue_move_camera", {
+		location,
+		rotation,
 	})
 }
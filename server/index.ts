@@ -1,11 +1,13 @@
 import fs from "node:fs"
 import path from "node:path"
+import { performance } from "node:perf_hooks"
 import process from "node:process"
 import { z } from "zod"
 
 import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js"
 import { RemoteExecution, RemoteExecutionConfig } from "unreal-remote-execution"
 import * as editorTools from "./editor/tools.js"
+import * as metrics from "./metrics.js"
 
 export const server = new McpServer({
 	name: "UnrealMCP",
@@ -38,6 +40,9 @@ const connectWithRetry = async (maxRetries: number = 3, retryDelay: number = 200
 				throw new Error(`Failed to run command: ${JSON.stringify(result.result)}`)
 			}
 
+			// Install the helper package once per connection so tool calls only send a function call
+			await installHelper()
+
 			return
 		} catch (error) {
 			console.log(`Connection attempt ${attempt} failed:`, error)
@@ -56,19 +61,93 @@ const connectWithRetry = async (maxRetries: number = 3, retryDelay: number = 200
 	}
 }
 
+const installHelper = async () => {
+	const result = await remoteExecution.runCommand(editorTools.UEInstallHelper())
+	if (!result.success) {
+		throw new Error(`Failed to install editor helper: ${result.result}`)
+	}
+}
+
 connectWithRetry()
 
-const tryRunCommand = async (command: string): Promise<string> => {
+const runCommand = async (command: string): Promise<{ text: string; profile?: metrics.EditorProfile }> => {
 	if (!remoteNode) {
 		throw new Error("Remote node is not available")
 	}
 
-	const result = await remoteNode.runCommand(command)
+	let result = await remoteNode.runCommand(command)
+	if (result.success && result.output[0]?.output.trim() === editorTools.HELPER_STALE) {
+		// The editor lost or has an outdated helper (e.g. python was restarted), reinstall and retry once
+		await installHelper()
+		result = await remoteNode.runCommand(command)
+	}
+
 	if (!result.success) {
 		throw new Error(`Command failed with: ${result.result}`)
 	}
 
-	return result.output.map((line) => line.output).join("\n")
+	let lines = result.output.map((line) => line.output)
+
+	let profile: metrics.EditorProfile | undefined
+	const profileLine = lines.find((line) => line.startsWith(editorTools.PROFILE_PREFIX))
+	if (profileLine) {
+		lines = lines.filter((line) => line !== profileLine)
+		try {
+			profile = JSON.parse(profileLine.slice(editorTools.PROFILE_PREFIX.length))
+		} catch {
+			profile = undefined
+		}
+	}
+
+	// Scripts send their result as one framed line, anything else printed meanwhile is left out
+	const framed = lines.find(
+		(line) => line.startsWith(editorTools.RESULT_PREFIX) || line.startsWith(editorTools.RESULT_FILE_PREFIX),
+	)
+	if (framed?.startsWith(editorTools.RESULT_FILE_PREFIX)) {
+		// Large results are spilled to a file by the editor
+		const filePath = framed.slice(editorTools.RESULT_FILE_PREFIX.length).trim()
+		try {
+			return { text: await fs.promises.readFile(filePath, { encoding: "utf8" }), profile }
+		} finally {
+			await fs.promises.unlink(filePath).catch(() => undefined)
+		}
+	}
+	if (framed) {
+		return { text: framed.slice(editorTools.RESULT_PREFIX.length).trimEnd(), profile }
+	}
+
+	return { text: lines.join("\n"), profile }
+}
+
+// Add a profile to a result, as a _profile field of JSON objects and on its own line otherwise
+const attachProfile = (text: string, profile: Record<string, unknown>) => {
+	const trimmed = text.trimEnd()
+	if (trimmed.startsWith("{") && trimmed.endsWith("}")) {
+		const separator = trimmed.slice(1, -1).trim() ? "," : ""
+		return `${trimmed.slice(0, -1)}${separator}"_profile":${JSON.stringify(profile)}}`
+	}
+	return `${text}\n${editorTools.PROFILE_PREFIX}${JSON.stringify(profile)}`
+}
+
+const tryRunCommand = async (command: string): Promise<string> => {
+	const tool = metrics.toolOf(command)
+	const started = performance.now()
+	let ok = false
+	try {
+		const { text, profile } = await runCommand(command)
+		ok = true
+		if (!profile) {
+			return text
+		}
+		const roundTripMs = performance.now() - started
+		metrics.recordProfile(tool, profile, roundTripMs)
+		return attachProfile(text, {
+			...profile,
+			round_trip_ms: Math.round(roundTripMs * 100) / 100,
+		})
+	} finally {
+		metrics.recordCall(tool, performance.now() - started, ok)
+	}
 }
 
 server.tool(
@@ -157,9 +236,14 @@ server.tool(
 
 server.tool(
 	"editor_list_assets",
-	"List all Unreal assets\n\nExample output: [''/Game/Characters/Hero/BP_Hero'', ''/Game/Maps/TestMap'', ''/Game/Materials/M_Basic'']\n\nReturns a Python list of asset paths.",
-	async () => {
-		const result = await tryRunCommand(editorTools.UEListAssets())
+	"List Unreal assets under a path, one page at a time\n\nExample output: {'path_prefix': '/Game/', 'total': 3120, 'offset': 0, 'assets': ['/Game/Characters/Hero/BP_Hero.BP_Hero', '/Game/Maps/TestMap.TestMap'], 'next_cursor': '3f9a1c0b52de:1000'}\n\nReturns a page of asset paths. Pass next_cursor back to get the next page from the same snapshot.",
+	{
+		limit: z.number().int().positive().optional().describe("Page size (default 1000, max 10000)"),
+		cursor: z.string().optional().describe("next_cursor from a previous call"),
+		path_prefix: z.string().optional().describe("Only list assets whose package starts with this path (default '/Game/')"),
+	},
+	async ({ limit, cursor, path_prefix }) => {
+		const result = await tryRunCommand(editorTools.UEListAssets(limit, cursor, path_prefix))
 		return {
 			content: [
 				{
@@ -173,12 +257,24 @@ server.tool(
 
 server.tool(
 	"editor_export_asset",
-	"Export an Unreal asset to text\n\nExample output: Binary data of the exported asset file\n\nReturns the raw binary content of the exported asset.",
+	"Export Unreal assets to files\n\nExample output: {'exports': [{'asset_path': '/Game/Meshes/SM_Cube', 'path': '/Users/dev/MyGame/Saved/rrmcp/exports/3f2a...uasset.copy', 'size': 52311, 'sha256': '9c1e...', 'cached': true, 'offset': 0, 'length': 52311, 'data': 'wYOeyA...', 'next_offset': null}], 'errors': []}\n\nReturns each export's local file path, size and sha256, with a base64 chunk of its content. Read large exports until next_offset is null, passing it back as offset for one asset or in offsets for a batch, or use encoding=path to only get the file paths. A call returns at most 8 MiB: assets past that come back with budget_exhausted and no data, ask for them again. Exports are cached until the asset is saved again.",
 	{
-		asset_path: z.string(),
+		asset_path: z.string().optional(),
+		asset_paths: z.array(z.string()).optional().describe("Export several assets in one call"),
+		encoding: z
+			.enum(["base64", "path"])
+			.optional()
+			.describe("base64 returns a chunk of the content (default), path only the local file"),
+		offset: z.number().int().nonnegative().optional().describe("Byte offset of the chunk, for a single asset"),
+		offsets: z
+			.record(z.string(), z.number().int().nonnegative())
+			.optional()
+			.describe("Byte offset of each asset's chunk in a batch, by asset path (default 0)"),
+		length: z.number().int().positive().optional().describe("Chunk size in bytes (default 1 MiB, 8 MiB per call)"),
 	},
-	async ({ asset_path }) => {
-		const result = await tryRunCommand(editorTools.UEExportAsset(asset_path))
+	async ({ asset_path, asset_paths, encoding, offset, length, offsets }) => {
+		const paths = [...(asset_path ? [asset_path] : []), ...(asset_paths ?? [])]
+		const result = await tryRunCommand(editorTools.UEExportAsset(paths, encoding, offset, length, offsets))
 		return {
 			content: [
 				{
@@ -207,6 +303,49 @@ server.tool(
 	},
 )
 
+server.tool(
+	"editor_get_assets_info",
+	"Get metadata for many assets at once from the asset registry, without loading them\n\nExample output: {'path_prefix': '/Game/Props/', 'asset_class': 'StaticMesh', 'fields': ['path', 'class', 'is_asset_loaded'], 'total': 412, 'offset': 0, 'assets': [{'path': '/Game/Props/SM_Rock.SM_Rock', 'class': 'StaticMesh', 'is_asset_loaded': false, 'tags': {'Triangles': '2304'}}], 'missing': [], 'packages_loaded': 0, 'next_cursor': '3f9a1c0b52de:100'}\n\nReturns the requested fields for each asset, read from the registry and the asset's registry tags. Only the lods field loads assets, and only StaticMesh and SkeletalMesh ones; packages_loaded counts the assets it had to load. Use editor_get_asset_info for everything about a single asset.",
+	{
+		asset_paths: z.array(z.string()).optional().describe("Object paths or package names, at most 1000"),
+		path_prefix: z.string().optional().describe("Describe every asset whose package starts with this path instead"),
+		asset_class: z.string().optional().describe("With path_prefix, only assets of this class"),
+		fields: z
+			.array(
+				z.enum([
+					"name",
+					"path",
+					"class",
+					"package",
+					"package_path",
+					"size",
+					"is_u_asset",
+					"is_asset_loaded",
+					"lods",
+				]),
+			)
+			.optional()
+			.describe("Fields to return (default name, path, class, package_path). lods loads mesh assets"),
+		tags: z
+			.array(z.string())
+			.optional()
+			.describe("Asset registry tags to return, e.g. Triangles, Vertices, Dimensions"),
+		limit: z.number().int().positive().optional().describe("Page size (default 100, max 1000)"),
+		cursor: z.string().optional().describe("next_cursor from a previous call"),
+	},
+	async (options) => {
+		const result = await tryRunCommand(editorTools.UEGetAssetsInfo(options))
+		return {
+			content: [
+				{
+					type: "text",
+					text: result,
+				},
+			],
+		}
+	},
+)
+
 server.tool(
 	"editor_get_asset_references",
 	"Get references for an asset\n\nExample output: [{'name': '/Game/Materials/M_Character.M_Character', 'class': 'Material'}, {'name': '/Game/Blueprints/BP_Player.BP_Player', 'class': 'Blueprint'}]\n\nReturns list of assets that reference the specified asset.",
@@ -225,6 +364,32 @@ server.tool(
 	},
 )
 
+server.tool(
+	"editor_get_asset_graph",
+	"Get the transitive referencers or dependencies of an asset for impact analysis\n\nExample output: {'root': '/Game/Materials/M_Master', 'direction': 'referencers', 'max_depth': 2, 'total_visited': 3, 'total_matches': 3, 'truncated': false, 'nodes': [{'package': '/Game/Materials/MI_Rock', 'depth': 1, 'via': '/Game/Materials/M_Master', 'classes': ['MaterialInstanceConstant']}, {'package': '/Game/Props/SM_Rock', 'depth': 2, 'via': '/Game/Materials/MI_Rock', 'classes': ['StaticMesh']}], 'cache': {'hits': 1, 'misses': 3, 'event_driven': true}}\n\nReturns every package reached within max_depth with the package it was reached through. Results are served from an in-editor graph cache.",
+	{
+		asset_path: z.string().describe("Object path or package name of the asset"),
+		direction: z.enum(["referencers", "dependencies"]).optional().describe("Walk referencers (default) or dependencies"),
+		max_depth: z.number().int().positive().optional().describe("Maximum number of hops (default 3, max 32)"),
+		include_hard: z.boolean().optional().describe("Follow hard package references (default true)"),
+		include_soft: z.boolean().optional().describe("Follow soft package references (default true)"),
+		class_filter: z.array(z.string()).optional().describe("Only report packages containing assets of these classes"),
+		max_nodes: z.number().int().positive().optional().describe("Stop after this many packages (default 5000)"),
+		include_classes: z.boolean().optional().describe("Report the asset classes of each package (default true)"),
+	},
+	async ({ asset_path, ...options }) => {
+		const result = await tryRunCommand(editorTools.UEGetAssetGraph(asset_path, options))
+		return {
+			content: [
+				{
+					type: "text",
+					text: result,
+				},
+			],
+		}
+	},
+)
+
 server.tool(
 	"editor_console_command",
 	"Run a console command in Unreal\n\nExample output: (No output for most commands, executed silently)\n\nExecutes the console command without returning output.",
@@ -261,10 +426,41 @@ server.tool(
 
 server.tool(
 	"editor_get_map_info",
-	"Get detailed information about the current map/level\n\nExample output: {'map_name': 'TestMap', 'map_path': '/Game/Maps/TestMap', 'total_actors': 45, 'actor_types': {'StaticMeshActor': 20, 'DirectionalLight': 1, 'PlayerStart': 1}, 'lighting': {'has_lightmass_importance_volume': false, 'directional_lights': 1, 'point_lights': 3, 'spot_lights': 0}, 'streaming_levels': 0, 'streaming_level_names': []}\n\nReturns current level information with actor counts and lighting details.",
-	{},
-	async () => {
-		const result = await tryRunCommand(editorTools.UEGetMapInfo())
+	"Get detailed information about the current map/level\n\nExample output: {'map_name': 'TestMap', 'map_path': '/Game/Maps/TestMap', 'total_actors': 45, 'actor_types': {'StaticMeshActor': 20, 'DirectionalLight': 1, 'PlayerStart': 1}, 'lighting': {'has_lightmass_importance_volume': false, 'directional_lights': 1, 'point_lights': 3, 'spot_lights': 0}, 'streaming_levels': 0, 'streaming_level_names': [], 'levels': {'TestMap': 30, 'TestMap_Lighting': 15}}\n\nReturns current level information with actor counts and lighting details, from a single pass over the actors. levels lists the actor count of each sub-level; pass level to get the breakdown of one of them. data_layers and bounds cost an extra engine call per actor and are only computed when requested.",
+	{
+		statistics: z
+			.array(z.enum(["classes", "lights", "levels", "data_layers", "bounds"]))
+			.optional()
+			.describe("Statistics to compute (default classes, lights and levels)"),
+		level: z.string().optional().describe("Name of a sub-level from levels, to get its own statistics"),
+		top_classes: z.number().int().positive().optional().describe("Actor classes listed in actor_types (default 15)"),
+	},
+	async ({ statistics, level, top_classes }) => {
+		const result = await tryRunCommand(editorTools.UEGetMapInfo({ statistics, level, top_classes }))
+		return {
+			content: [
+				{
+					type: "text",
+					text: result,
+				},
+			],
+		}
+	},
+)
+
+server.tool(
+	"editor_get_scene_budget",
+	"Get the render budget of the current level: triangles, vertices, material slots and estimated draw calls of its mesh actors\n\nExample output: {'map_name': 'TestMap', 'folder_prefix': null, 'sort_by': 'triangles', 'total': {'actors': 1200, 'components': 1350, 'instances': 4350, 'triangles': 18250000, 'vertices': 9800000, 'material_slots': 2900, 'draw_calls': 2900, 'unknown_triangles': 12}, 'unique_meshes': 140, 'by_class': [{'name': 'StaticMeshActor', 'actors': 1150, ...}], 'by_folder': [{'name': 'Props/Rocks', 'actors': 300, ...}], 'by_mesh': [{'name': '/Game/Props/SM_Rock.SM_Rock', 'actors': 300, 'triangles': 6000000, ...}], 'mesh_cache': {'hits': 1210, 'misses': 140}}\n\nReturns LOD 0 totals for the level and the worst classes, outliner folders and meshes by sort_by. Each mesh's render data is read once and reused for every actor using it. Draw calls are estimated as one per mesh section per component, instanced components count their sections once. unknown_triangles counts skeletal mesh instances whose triangle count isn't available.",
+	{
+		folder_prefix: z.string().optional().describe("Only count actors in outliner folders starting with this"),
+		sort_by: z
+			.enum(["actors", "components", "instances", "triangles", "vertices", "material_slots", "draw_calls"])
+			.optional()
+			.describe("Ranking of the by_* lists (default triangles)"),
+		top_entries: z.number().int().positive().optional().describe("Entries per by_* list (default 20, max 500)"),
+	},
+	async ({ folder_prefix, sort_by, top_entries }) => {
+		const result = await tryRunCommand(editorTools.UEGetSceneBudget({ folder_prefix, sort_by, top_entries }))
 		return {
 			content: [
 				{
@@ -278,13 +474,43 @@ server.tool(
 
 server.tool(
 	"editor_search_assets",
-	"Search for assets by name or path with optional class filter\n\nExample output: {'search_term': 'character', 'asset_class_filter': 'Blueprint', 'total_matches': 3, 'assets': [{'name': 'BP_Character', 'path': '/Game/Characters', 'class': 'Blueprint', 'package_name': 'BP_Character'}, {'name': 'BP_EnemyCharacter', 'path': '/Game/Enemies', 'class': 'Blueprint', 'package_name': 'BP_EnemyCharacter'}]}\n\nReturns search results with asset details, limited to 50 results.",
+	"Search for assets by name or path with optional class filter\n\nExample output: {'search_term': 'character', 'asset_class_filter': 'Blueprint', 'total_matches': 3, 'assets': [{'name': 'BP_Character', 'path': '/Game/Characters', 'class': 'Blueprint', 'package_name': 'BP_Character'}, {'name': 'BP_EnemyCharacter', 'path': '/Game/Enemies', 'class': 'Blueprint', 'package_name': 'BP_EnemyCharacter'}], 'next_cursor': null}\n\nReturns a page of search results with asset details (50 by default). Pass next_cursor back to get the next page.",
 	{
 		search_term: z.string(),
 		asset_class: z.string().optional(),
+		limit: z.number().int().positive().optional().describe("Page size (default 50, max 1000)"),
+		cursor: z.string().optional().describe("next_cursor from a previous call"),
+		path_prefix: z.string().optional().describe("Only match assets whose package starts with this path"),
+	},
+	async ({ search_term, asset_class, limit, cursor, path_prefix }) => {
+		const result = await tryRunCommand(
+			editorTools.UESearchAssets(search_term, asset_class, limit, cursor, path_prefix),
+		)
+		return {
+			content: [
+				{
+					type: "text",
+					text: result,
+				},
+			],
+		}
+	},
+)
+
+server.tool(
+	"editor_get_asset_changes",
+	"Get asset registry changes since a cursor: added, removed, renamed, updated and saved assets\n\nExample output: {'feed_id': '3f9a1c2b7d4e', 'latest_sequence': 42, 'oldest_sequence': 1, 'reset': false, 'gap': null, 'events': [{'sequence': 41, 'time': 1718000000.123, 'event': 'renamed', 'path': '/Game/Props/SM_Rock.SM_Rock', 'class': 'StaticMesh', 'old_path': '/Game/SM_Rock.SM_Rock'}, {'sequence': 42, 'time': 1718000003.5, 'event': 'saved', 'path': '/Game/Props/SM_Rock.SM_Rock', 'class': 'StaticMesh'}], 'next_cursor': '3f9a1c2b7d4e:42', 'has_more': false, 'subscribed': true, 'saved_events': true}\n\nReturns the changes recorded since the helpers were installed, oldest first. Pass next_cursor back to get only newer changes; has_more means another page is waiting. The editor keeps the last 10000 changes: if some were dropped since your cursor, gap says which, and reset is true when the cursor is from an earlier session. In both cases rescan what you track. Without registry events (subscribed false) only added and removed assets are found.",
+	{
+		cursor: z.string().optional().describe("next_cursor from a previous call, omit to read from the oldest change held"),
+		limit: z.number().int().positive().optional().describe("Most changes to return (default 500, max 5000)"),
+		event_types: z
+			.array(z.enum(["added", "removed", "renamed", "updated", "saved"]))
+			.optional()
+			.describe("Only return these kinds of change"),
+		path_prefix: z.string().optional().describe("Only return assets whose path starts with this"),
 	},
-	async ({ search_term, asset_class }) => {
-		const result = await tryRunCommand(editorTools.UESearchAssets(search_term, asset_class))
+	async (options) => {
+		const result = await tryRunCommand(editorTools.UEGetAssetChanges(options))
 		return {
 			content: [
 				{
@@ -298,10 +524,58 @@ server.tool(
 
 server.tool(
 	"editor_get_world_outliner",
-	"Get all actors in the current world with their properties\n\nExample output: {'world_name': 'TestMap', 'total_actors': 45, 'actors': [{'name': 'StaticMeshActor_0', 'class': 'StaticMeshActor', 'location': {'x': 0.0, 'y': 0.0, 'z': 0.0}, 'rotation': {'pitch': 0.0, 'yaw': 0.0, 'roll': 0.0}, 'scale': {'x': 1.0, 'y': 1.0, 'z': 1.0}, 'is_hidden': false, 'folder_path': '/Meshes', 'components': ['StaticMeshComponent', 'SceneComponent']}]}\n\nReturns complete world outliner with all actors and their transform data.",
-	{},
-	async () => {
-		const result = await tryRunCommand(editorTools.UEGetWorldOutliner())
+	"Get all actors in the current world with their properties\n\nExample output: {'world_name': 'TestMap', 'total_actors': 45, 'actors': [{'name': 'StaticMeshActor_0', 'class': 'StaticMeshActor', 'location': {'x': 0.0, 'y': 0.0, 'z': 0.0}, 'rotation': {'pitch': 0.0, 'yaw': 0.0, 'roll': 0.0}, 'scale': {'x': 1.0, 'y': 1.0, 'z': 1.0}, 'is_hidden': false, 'folder_path': '/Meshes', 'components': ['StaticMeshComponent', 'SceneComponent']}]}\n\nReturns complete world outliner with all actors and their transform data.\n\nFor large levels set columnar=true to get a compact, paged snapshot: {'world_name': 'TestMap', 'fields': ['name', 'class', 'transform'], 'total_actors': 60000, 'offset': 0, 'count': 1000, 'columns': {'name': ['Cube_0'], 'class': [0], 'transform': [0, 0, 0, 0, 45, 0, 1, 1, 1]}, 'classes': ['StaticMeshActor'], 'next_cursor': '9c1d2e3f4a5b:1000'}. class/folder columns index into the classes/folders tables and transform packs x, y, z, pitch, yaw, roll, scale x, y, z per actor.\n\nEvery response includes a version. Pass it back as since_version to get only what changed: {'version': 42, 'since_version': 40, 'reset': false, 'added': {'columns': {...}}, 'modified': {'columns': {...}}, 'removed': ['Cube_3']}. If reset is true, take a new snapshot.",
+	{
+		columnar: z.boolean().optional().describe("Return a paged columnar snapshot instead of the full actor list"),
+		fields: z
+			.array(z.enum(["name", "label", "class", "folder", "transform", "hidden", "components"]))
+			.optional()
+			.describe("Columns to return in columnar mode (default name, class, transform)"),
+		class_filter: z.array(z.string()).optional().describe("Only include actors of these classes (columnar mode)"),
+		folder_filter: z.string().optional().describe("Only include actors in this outliner folder or below (columnar mode)"),
+		limit: z.number().int().positive().optional().describe("Page size in columnar mode (default 1000, max 10000)"),
+		cursor: z.string().optional().describe("next_cursor from a previous columnar call"),
+		since_version: z
+			.number()
+			.int()
+			.nonnegative()
+			.optional()
+			.describe("Return only actors added, modified or removed since this version"),
+	},
+	async (options) => {
+		const result = await tryRunCommand(editorTools.UEGetWorldOutliner(options))
+		return {
+			content: [
+				{
+					type: "text",
+					text: result,
+				},
+			],
+		}
+	},
+)
+
+const vectorSchema = z.object({ x: z.number(), y: z.number(), z: z.number() })
+
+server.tool(
+	"editor_spatial_query",
+	"Find actors by position: within a radius, inside a box, nearest to a point or overlapping a box\n\nExample output: {'query': 'nearest', 'center': {'x': 0.0, 'y': 0.0, 'z': 0.0}, 'total_matches': 2, 'truncated': false, 'actors': [{'name': 'StaticMeshActor_12', 'label': 'Crate', 'class': 'StaticMeshActor', 'location': {'x': 120.0, 'y': -40.0, 'z': 0.0}, 'distance': 126.49}], 'index': {'actors': 2400, 'cells': 610, 'cell_size': 1413.9, 'oversized': 1, 'version': 57, 'mode': 'updated', 'actors_read': 3}}\n\nReturns matching actors closest first. radius, box and nearest use actor pivots; overlap uses actor bounds. The center or box can come from actor_name (its pivot and bounds), which is left out of the results. Answers from an in-editor grid index that follows actor moves, spawns and deletes, so repeated queries don't walk the level.",
+	{
+		query: z.enum(["radius", "box", "nearest", "overlap"]).describe("Kind of query"),
+		center: vectorSchema.optional().describe("Query point for radius and nearest"),
+		radius: z.number().positive().optional().describe("Search radius, or the farthest distance for nearest"),
+		box: z
+			.object({ min: vectorSchema, max: vectorSchema })
+			.optional()
+			.describe("Box for box and overlap queries"),
+		actor_name: z.string().optional().describe("Take the center or box from this actor (name or label)"),
+		count: z.number().int().positive().optional().describe("How many actors nearest returns (default 10)"),
+		class_names: z.array(z.string()).optional().describe("Only return actors of these classes"),
+		include_bounds: z.boolean().optional().describe("Include each actor's bounding box"),
+		limit: z.number().int().positive().optional().describe("Most actors to return (default 100, max 1000)"),
+	},
+	async (options) => {
+		const result = await tryRunCommand(editorTools.UESpatialQuery(options))
 		return {
 			content: [
 				{
@@ -315,12 +589,62 @@ server.tool(
 
 server.tool(
 	"editor_validate_assets",
-	"Validate assets in the project to check for errors\n\nExample output: {'total_validated': 100, 'valid_assets': [{'path': '/Game/Meshes/SM_Cube', 'class': 'StaticMesh', 'size': '1024'}], 'invalid_assets': [{'path': '/Game/Missing/Asset', 'error': 'Asset does not exist'}], 'validation_summary': {'valid_count': 95, 'invalid_count': 5, 'success_rate': 95.0}}\n\nReturns validation results with asset status and error details.",
+	"Validate assets in the project to check for errors\n\nExample output: {'total_validated': 100, 'valid_assets': [{'path': '/Game/Meshes/SM_Cube', 'class': 'StaticMesh', 'size': '1024'}], 'invalid_assets': [{'path': '/Game/Missing/Asset', 'error': 'Asset does not exist'}], 'validation_summary': {'valid_count': 95, 'invalid_count': 5, 'success_rate': 95.0}}\n\nReturns validation results with asset status and error details. Without asset_paths only the first 100 assets are checked, set background=true to validate the whole project without blocking the editor and follow it with editor_job_status.",
 	{
 		asset_paths: z.string().optional(),
+		fast: z.boolean().optional().describe("Only check registry metadata, never load the assets"),
+		background: z
+			.boolean()
+			.optional()
+			.describe("Run as a background job in the editor and return its job_id right away"),
 	},
-	async ({ asset_paths }) => {
-		const result = await tryRunCommand(editorTools.UEValidateAssets(asset_paths))
+	async ({ asset_paths, fast, background }) => {
+		const result = await tryRunCommand(editorTools.UEValidateAssets(asset_paths, fast, background))
+		return {
+			content: [
+				{
+					type: "text",
+					text: result,
+				},
+			],
+		}
+	},
+)
+
+server.tool(
+	"editor_audit_assets",
+	"Find unreferenced and likely duplicate assets in one background pass over the asset registry\n\nExample output: {'job_id': '5e6f7a8b', 'kind': 'audit_assets', 'status': 'running', 'processed': 0, 'total': 40001, 'progress': 0.0, 'elapsed_seconds': 0.0, 'error': null, 'phase': 'scan_assets', 'path_prefix': '/Game/', 'summary': null, 'report_path': null}\n\nStarts a background job and returns its job_id; follow it with editor_job_status. When done the status has a summary ({'assets_scanned': 20000, 'roots': 120, 'unreferenced': 850, 'unreachable': 40, 'duplicate_groups': 12, ...}), pages of the unreferenced assets, unreachable assets and duplicate groups, and report_path, a JSON file with the full results. editor_job_status's offset pages all three lists at once; more says which still have items past the page. The audit refuses to start while the asset registry is still scanning, since assets whose referencers aren't scanned yet would look unused. Maps, primary assets, packages named in the project's ini files or in Config/rrmcp_asset_roots.json, and root_paths count as used. unreferenced assets have no referencers at all; unreachable ones are only referenced by other unused assets. Duplicates share a class, registry tags such as vertex counts or texture dimensions, and about the same file size.",
+	{
+		path_prefix: z.string().optional().describe("Only audit assets under this path (default /Game/)"),
+		root_paths: z
+			.array(z.string())
+			.optional()
+			.describe("Extra packages or folders to treat as used, e.g. assets loaded by name from code"),
+	},
+	async ({ path_prefix, root_paths }) => {
+		const result = await tryRunCommand(editorTools.UEAuditAssets(path_prefix, root_paths))
+		return {
+			content: [
+				{
+					type: "text",
+					text: result,
+				},
+			],
+		}
+	},
+)
+
+server.tool(
+	"editor_job_status",
+	"Get the progress and partial results of a background editor job, or cancel it\n\nExample output: {'job_id': '1a2b3c4d', 'kind': 'validate_assets', 'status': 'running', 'processed': 52000, 'total': 200000, 'progress': 26.0, 'elapsed_seconds': 41.2, 'error': null, 'validation_summary': {'valid_count': 51990, 'invalid_count': 10, 'success_rate': 99.98}, 'invalid_assets': [{'path': '/Game/Broken/Asset', 'error': 'Failed to load asset'}], 'next_offset': null}\n\nReturns the job state with a page of its results. Without job_id lists the known jobs.",
+	{
+		job_id: z.string().optional().describe("Job id returned when the job was started"),
+		cancel: z.boolean().optional().describe("Cancel the job"),
+		offset: z.number().int().nonnegative().optional().describe("Offset into the job's result items"),
+		limit: z.number().int().nonnegative().optional().describe("Number of result items to return (default 100)"),
+	},
+	async ({ job_id, cancel, offset, limit }) => {
+		const result = await tryRunCommand(editorTools.UEJobStatus(job_id, cancel, offset, limit))
 		return {
 			content: [
 				{
@@ -384,6 +708,55 @@ server.tool(
 	},
 )
 
+server.tool(
+	"editor_create_objects",
+	"Create many objects/actors in the world in one call and one undo step\n\nExample output: {'success': true, 'total_requested': 3, 'created': 3, 'actor_names': ['StaticMeshActor_1', 'StaticMeshActor_2', 'PointLight_0'], 'errors': [], 'classes_resolved': 2, 'assets_loaded': 2}\n\nReturns the created actor names in input order (null for failed items) and the errors by index. Prefer this over repeated editor_create_object calls when building a scene.",
+	{
+		objects: z
+			.array(
+				z.object({
+					object_class: z.string().describe("Unreal class name (e.g., 'StaticMeshActor', 'DirectionalLight')"),
+					object_name: z.string().optional().describe("Name/label for the created object"),
+					location: z
+						.object({
+							x: z.number().default(0),
+							y: z.number().default(0),
+							z: z.number().default(0),
+						})
+						.optional(),
+					rotation: z
+						.object({
+							pitch: z.number().default(0),
+							yaw: z.number().default(0),
+							roll: z.number().default(0),
+						})
+						.optional(),
+					scale: z
+						.object({
+							x: z.number().default(1),
+							y: z.number().default(1),
+							z: z.number().default(1),
+						})
+						.optional(),
+					properties: z.record(z.any()).optional().describe("Same as editor_create_object properties"),
+				}),
+			)
+			.min(1)
+			.describe("Spawn specs, same fields as editor_create_object"),
+	},
+	async ({ objects }) => {
+		const result = await tryRunCommand(editorTools.UECreateObjects(objects))
+		return {
+			content: [
+				{
+					type: "text",
+					text: result,
+				},
+			],
+		}
+	},
+)
+
 server.tool(
 	"editor_update_object",
 	"Update an existing object/actor in the world\n\nExample output: {'success': true, 'actor_name': 'StaticMeshActor_1', 'actor_label': 'UpdatedCube', 'class': 'StaticMeshActor', 'location': {'x': 150.0, 'y': 200.0, 'z': 50.0}, 'rotation': {'pitch': 0.0, 'yaw': 90.0, 'roll': 0.0}, 'scale': {'x': 2.0, 'y': 2.0, 'z': 2.0}}\n\nReturns updated actor details with new transform values.",
@@ -436,6 +809,34 @@ server.tool(
 	},
 )
 
+server.tool(
+	"editor_update_objects",
+	"Update the transforms/properties of many actors in one call and one undo step\n\nExample output: {'success': true, 'total_requested': 2, 'updated': 2, 'not_found': [], 'errors': []}\n\nTransforms are packed arrays with 3 values per actor in actor_names order: locations [x, y, z, ...], rotations [pitch, yaw, roll, ...], scales [x, y, z, ...]. Use null for a value to keep the current one. Prefer this over repeated editor_update_object calls for layout tasks.",
+	{
+		actor_names: z.array(z.string()).min(1).describe("Names or labels of the actors to update"),
+		locations: z.array(z.number().nullable()).optional().describe("Packed x, y, z per actor"),
+		rotations: z.array(z.number().nullable()).optional().describe("Packed pitch, yaw, roll in degrees per actor"),
+		scales: z.array(z.number().nullable()).optional().describe("Packed x, y, z scale per actor"),
+		properties: z
+			.array(z.record(z.any()).nullable())
+			.optional()
+			.describe("Actor properties to set, one object (or null) per actor"),
+	},
+	async ({ actor_names, locations, rotations, scales, properties }) => {
+		const result = await tryRunCommand(
+			editorTools.UEUpdateObjects(actor_names, locations, rotations, scales, properties),
+		)
+		return {
+			content: [
+				{
+					type: "text",
+					text: result,
+				},
+			],
+		}
+	},
+)
+
 server.tool(
 	"editor_delete_object",
 	"Delete an object/actor from the world\n\nExample output: {'success': true, 'message': 'Successfully deleted actor: MyCube', 'deleted_actor': {'actor_name': 'StaticMeshActor_1', 'actor_label': 'MyCube', 'class': 'StaticMeshActor', 'location': {'x': 100.0, 'y': 200.0, 'z': 0.0}}}\n\nReturns deletion confirmation with details of the deleted actor.",
@@ -455,30 +856,167 @@ server.tool(
 	},
 )
 
+server.tool(
+	"editor_instance_actors",
+	"Merge StaticMeshActors that share a mesh and materials into one actor with an instanced static mesh component\n\nExample output: {'success': true, 'dry_run': false, 'component_class': 'HierarchicalInstancedStaticMeshComponent', 'groups_found': 12, 'groups_converted': 12, 'actors_before': 2400, 'actors_after': 612, 'actors_merged': 1800, 'draw_calls_before': 2650, 'draw_calls_after': 18, 'groups': [{'mesh': '/Game/Props/SM_Rock.SM_Rock', 'actors': 600, 'draw_calls_before': 600, 'draw_calls_after': 1, 'actor_name': 'Actor_12'}], 'missing_actors': [], 'errors': []}\n\nReturns the groups found with before/after actor and estimated draw call counts. Only actors whose single component is their static mesh are merged, and only in the current level. Transforms are kept as world space instances and the whole conversion is one undo step. Use dry_run to preview.",
+	{
+		actor_names: z.array(z.string()).optional().describe("Only consider these actors (names or labels)"),
+		selected: z.boolean().optional().describe("Only consider the actors selected in the editor"),
+		folder_prefix: z.string().optional().describe("Only consider actors in outliner folders starting with this"),
+		min_group_size: z.number().int().min(2).optional().describe("Smallest group worth merging (default 2)"),
+		hierarchical: z
+			.boolean()
+			.optional()
+			.describe("Use HierarchicalInstancedStaticMeshComponent (default) or InstancedStaticMeshComponent"),
+		dry_run: z.boolean().optional().describe("Only report what would be merged"),
+	},
+	async (options) => {
+		const result = await tryRunCommand(editorTools.UEInstanceActors(options))
+		return {
+			content: [
+				{
+					type: "text",
+					text: result,
+				},
+			],
+		}
+	},
+)
+
+const rangeSchema = z.array(z.number()).length(2)
+
+server.tool(
+	"editor_scatter_instances",
+	"Scatter instances of a static mesh over an area into one instanced static mesh component\n\nExample output: {'success': true, 'actor_name': 'Actor_3', 'actor_label': 'Scatter_SM_Rock', 'component_class': 'HierarchicalInstancedStaticMeshComponent', 'instances_requested': 20000, 'instances_added': 19874, 'instances_total': 19874, 'unsnapped': 126, 'short_of_area': 0, 'area_m2': 10000.0, 'seed': 7, 'batches': 4}\n\nReturns how many instances were placed. The area is a box or the closed spline of an actor, filled with a count or a density per square meter. The same seed gives the same layout. Yaw, pitch, roll and scale are picked uniformly from [min, max] ranges. With snap_to_surface each instance is dropped onto the surface below it and points with nothing below are left out. Instances go into a new actor, or are added to actor_name, and the whole call is one undo step.",
+	{
+		mesh_path: z.string().describe("Static mesh to place (e.g., '/Game/Props/SM_Rock.SM_Rock')"),
+		bounds: z
+			.object({ min: vectorSchema, max: vectorSchema })
+			.optional()
+			.describe("Box to fill, z is the height range unless snapping"),
+		spline_actor: z.string().optional().describe("Actor whose closed spline outlines the area to fill"),
+		count: z.number().int().positive().optional().describe("Number of instances"),
+		density: z.number().positive().optional().describe("Instances per square meter, instead of count"),
+		seed: z.number().int().optional().describe("Random seed (default 0)"),
+		yaw: rangeSchema.optional().describe("Yaw range in degrees (default [0, 360])"),
+		pitch: rangeSchema.optional().describe("Pitch range in degrees (default [0, 0])"),
+		roll: rangeSchema.optional().describe("Roll range in degrees (default [0, 0])"),
+		scale: rangeSchema.optional().describe("Uniform scale range (default [1, 1])"),
+		snap_to_surface: z.boolean().optional().describe("Trace down onto the surface below each instance"),
+		z_offset: z.number().optional().describe("Added to each instance height"),
+		materials: z.array(z.string()).optional().describe("Material paths by slot"),
+		actor_name: z.string().optional().describe("Add to this actor instead of spawning a new one"),
+		label: z.string().optional().describe("Label of the spawned actor"),
+		hierarchical: z
+			.boolean()
+			.optional()
+			.describe("Use HierarchicalInstancedStaticMeshComponent (default) or InstancedStaticMeshComponent"),
+	},
+	async (options) => {
+		const result = await tryRunCommand(editorTools.UEScatterInstances(options))
+		return {
+			content: [
+				{
+					type: "text",
+					text: result,
+				},
+			],
+		}
+	},
+)
+
+const IMAGE_TYPES = [
+	{ mimeType: "image/png", magic: [0x89, 0x50, 0x4e, 0x47], trailer: [0xae, 0x42, 0x60, 0x82] },
+	{ mimeType: "image/jpeg", magic: [0xff, 0xd8], trailer: [0xff, 0xd9] },
+]
+
+const readCompleteImage = async (filePath: string) => {
+	const handle = await fs.promises.open(filePath, "r").catch(() => undefined)
+	if (!handle) {
+		return undefined
+	}
+	try {
+		const { size } = await handle.stat()
+		if (size < 8) {
+			return undefined
+		}
+		const head = Buffer.alloc(4)
+		const tail = Buffer.alloc(4)
+		await handle.read(head, 0, 4, 0)
+		await handle.read(tail, 0, 4, size - 4)
+		const type = IMAGE_TYPES.find(
+			({ magic, trailer }) =>
+				magic.every((byte, i) => head[i] === byte) &&
+				trailer.every((byte, i) => tail[4 - trailer.length + i] === byte),
+		)
+		if (!type) {
+			return undefined
+		}
+		return { mimeType: type.mimeType, data: await fs.promises.readFile(filePath, { encoding: "base64" }) }
+	} finally {
+		await handle.close()
+	}
+}
+
+// The editor writes captures on a later frame, poll until the file is complete instead of sleeping a fixed time
+const waitForImage = async (filePath: string, timeoutMs: number, intervalMs: number = 25) => {
+	const deadline = Date.now() + timeoutMs
+	while (true) {
+		const image = await readCompleteImage(filePath)
+		if (image || Date.now() >= deadline) {
+			return image
+		}
+		await new Promise((resolve) => setTimeout(resolve, intervalMs))
+	}
+}
+
 server.tool(
 	"editor_take_screenshot",
-	"Take a screenshot of the Unreal Editor\n\nExample output: data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAA...\n\nReturns a base64-encoded PNG image of the current editor view. IF THIS ERRORS OUT MAKE SURE THE UNREAL ENGINE WINDOW IS FOCUSED",
-	{},
-	async () => {
-		const result = await tryRunCommand(editorTools.UETakeScreenshot())
-
-		const filePath = result.trim()
-		const fullPath = path.resolve(filePath)
-		await new Promise((resolve) => setTimeout(resolve, 3000))
-		if (fs.existsSync(fullPath)) {
-			const base64Data = fs.readFileSync(fullPath, { encoding: "base64" })
-			fs.unlinkSync(fullPath)
-			if (base64Data) {
+	"Take a screenshot of the Unreal Editor\n\nExample output: data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAA...\n\nReturns a base64-encoded PNG or JPEG image of the current editor view as soon as the editor has written it. Lower the resolution or use jpg to shrink the payload. IF THIS ERRORS OUT MAKE SURE THE UNREAL ENGINE WINDOW IS FOCUSED",
+	{
+		width: z.number().int().min(16).max(7680).optional().describe("Capture width in pixels (default 640)"),
+		height: z.number().int().min(16).max(7680).optional().describe("Capture height in pixels (default 520)"),
+		format: z.enum(["png", "jpg"]).optional().describe("Image format (default png)"),
+		quality: z.number().int().min(1).max(100).optional().describe("JPEG quality (default 85)"),
+		timeout_ms: z
+			.number()
+			.int()
+			.positive()
+			.optional()
+			.describe("How long to wait for the capture (default 10000)"),
+	},
+	async ({ width, height, format, quality, timeout_ms }) => {
+		const result = await tryRunCommand(editorTools.UETakeScreenshot({ width, height, format, quality }))
+
+		let filePath: string | undefined
+		try {
+			filePath = JSON.parse(result).path
+		} catch {
+			filePath = undefined
+		}
+		if (filePath) {
+			const fullPath = path.resolve(filePath)
+			const image = await waitForImage(fullPath, timeout_ms ?? 10000)
+			if (image) {
+				await fs.promises.unlink(fullPath).catch(() => undefined)
 				return {
 					content: [
 						{
 							type: "image",
-							data: base64Data,
-							mimeType: "image/png",
+							data: image.data,
+							mimeType: image.mimeType,
 						},
 					],
 				}
 			}
+			return {
+				content: [
+					{
+						type: "text",
+						text: `Timed out waiting for the screenshot at ${fullPath}. Is the Unreal Engine window focused?`,
+					},
+				],
+			}
 		}
 
 		return {
@@ -492,6 +1030,86 @@ server.tool(
 	},
 )
 
+server.tool(
+	"editor_capture_views",
+	"Capture screenshots from several camera poses in one call\n\nExample output: {'job_id': '1a2b3c4d', 'format': 'jpg', 'views': [{'index': 0, 'location': {'x': 512.0, 'y': 0.0, 'z': 186.3}, 'rotation': {'pitch': -20.0, 'yaw': 180.0, 'roll': 0.0}, 'captured': true}]} followed by one image per captured view\n\nReturns the views in order with an image for each. Pass explicit camera poses, or an orbit around an actor or a point: count yaw steps at each of the given pitches, at a distance that fits the target's bounds unless radius is set. The viewport camera is restored afterwards.",
+	{
+		views: z
+			.array(
+				z.object({
+					location: vectorSchema,
+					rotation: z.object({ pitch: z.number(), yaw: z.number(), roll: z.number() }),
+				}),
+			)
+			.optional()
+			.describe("Explicit camera poses"),
+		orbit: z
+			.object({
+				actor_name: z.string().optional().describe("Actor to orbit, its bounds set the center and distance"),
+				center: vectorSchema.optional().describe("Point to orbit when no actor is given"),
+				extent: vectorSchema.optional().describe("Half size of the box around center"),
+				radius: z.number().positive().optional().describe("Camera distance from the center"),
+				count: z.number().int().positive().optional().describe("Views around each ring (default 8)"),
+				pitches: z.array(z.number()).optional().describe("Camera pitch of each ring (default [-20])"),
+			})
+			.optional(),
+		width: z.number().int().min(16).max(7680).optional().describe("Capture width in pixels (default 640)"),
+		height: z.number().int().min(16).max(7680).optional().describe("Capture height in pixels (default 520)"),
+		format: z.enum(["png", "jpg"]).optional().describe("Image format (default png)"),
+		quality: z.number().int().min(1).max(100).optional().describe("JPEG quality (default 85)"),
+		timeout_ms: z
+			.number()
+			.int()
+			.positive()
+			.optional()
+			.describe("How long to wait for all captures (default 5000 plus 3000 per view)"),
+	},
+	async ({ views, orbit, width, height, format, quality, timeout_ms }) => {
+		const result = await tryRunCommand(editorTools.UECaptureViews({ views, orbit, width, height, format, quality }))
+
+		let batch: { job_id: string; format: string; views: { index: number; path: string }[] } | undefined
+		try {
+			batch = JSON.parse(result)
+		} catch {
+			batch = undefined
+		}
+		if (!batch?.views) {
+			return {
+				content: [
+					{
+						type: "text",
+						text: result,
+					},
+				],
+			}
+		}
+
+		// Views are captured one after the other, wait for each file in order against one deadline
+		const deadline = Date.now() + (timeout_ms ?? 5000 + 3000 * batch.views.length)
+		const images: { type: "image"; data: string; mimeType: string }[] = []
+		const views: Record<string, unknown>[] = []
+		for (const { path: filePath, ...view } of batch.views) {
+			const fullPath = path.resolve(filePath)
+			const image = await waitForImage(fullPath, Math.max(0, deadline - Date.now()))
+			if (image) {
+				await fs.promises.unlink(fullPath).catch(() => undefined)
+				images.push({ type: "image", data: image.data, mimeType: image.mimeType })
+			}
+			views.push({ ...view, captured: Boolean(image) })
+		}
+
+		return {
+			content: [
+				{
+					type: "text",
+					text: JSON.stringify({ job_id: batch.job_id, format: batch.format, views }),
+				},
+				...images,
+			],
+		}
+	},
+)
+
 server.tool(
 	"editor_move_camera",
 	"Move the viewport camera to a specific location and rotation for positioning screenshots",
@@ -524,6 +1142,42 @@ server.tool(
 	},
 )
 
+server.tool(
+	"editor_metrics",
+	"Show round-trip latency percentiles of each editor tool, with editor side timings while profiling\n\nExample output: {'profiling': true, 'window': 200, 'tools': {'ue_search_assets': {'calls': 14, 'errors': 0, 'round_trip_ms': {'p50': 12.4, 'p90': 35.1, 'p99': 1470.2, 'max': 1470.2}, 'profiled_calls': 6, 'editor_ms': {'p50': 8.1, 'p90': 20.3, 'p99': 1457.0, 'max': 1457.0}, 'transport_ms': {'p50': 4.2, 'p90': 13.0, 'p99': 14.8, 'max': 14.8}, 'engine_ms_mean': 84.1, 'python_ms_mean': 160.2, 'engine_calls_mean': 11668, 'phases_ms_mean': {'decode_args': 0.05, 'index_assets': 1452.8, 'encode': 0.3, 'output': 0.02}, 'top_engine_calls': [{'name': 'AssetData.package_name', 'calls': 20000, 'ms': 168.7}]}}}\n\nReturns stats over the last 200 calls of each editor tool, keyed by its editor script. Set profile to true to have the editor time each phase of a call and count its engine calls; while on, every tool result also carries a _profile field. Profiling slows calls down, turn it off when done.",
+	{
+		profile: z.boolean().optional().describe("Turn editor side profiling on or off"),
+		reset: z.boolean().optional().describe("Clear the collected stats first"),
+	},
+	async ({ profile, reset }) => {
+		if (profile !== undefined) {
+			editorTools.setProfiling(profile)
+		}
+		if (reset) {
+			metrics.reset()
+		}
+		return {
+			content: [
+				{
+					type: "text",
+					text: JSON.stringify({ profiling: editorTools.isProfiling(), ...metrics.snapshot() }),
+				},
+			],
+		}
+	},
+)
+
+server.resource("metrics", "metrics://editor_tools", async (uri) => {
+	return {
+		contents: [
+			{
+				uri: uri.href,
+				text: JSON.stringify({ profiling: editorTools.isProfiling(), ...metrics.snapshot() }),
+			},
+		],
+	}
+})
+
 server.resource("docs", "docs://unreal_python", async () => {
 	return {
 		contents: [
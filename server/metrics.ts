@@ -0,0 +1,132 @@
+// Rolling round-trip latency per editor tool, plus the editor side timings of profiled calls
+// (see editor/scripts/profiler.py)
+
+// Calls kept per tool, percentiles are over this window
+export const WINDOW = 200
+
+// Engine calls listed per tool, by total time across the window
+const TOP_ENGINE_CALLS = 10
+
+export type EditorProfile = {
+	tool: string
+	total_ms: number
+	engine_ms: number
+	python_ms: number
+	engine_calls: number
+	phases: Record<string, number>
+	top_engine_calls: { name: string; calls: number; ms: number }[]
+}
+
+type ProfileSample = {
+	profile: EditorProfile
+	roundTripMs: number
+}
+
+class ToolStats {
+	calls = 0
+	errors = 0
+	latencies: number[] = []
+	profiles: ProfileSample[] = []
+
+	record(ms: number, ok: boolean) {
+		this.calls += 1
+		if (!ok) {
+			this.errors += 1
+		}
+		pushBounded(this.latencies, ms)
+	}
+}
+
+const stats = new Map<string, ToolStats>()
+
+const pushBounded = <T>(values: T[], value: T) => {
+	values.push(value)
+	if (values.length > WINDOW) {
+		values.shift()
+	}
+}
+
+const statsOf = (tool: string) => {
+	let toolStats = stats.get(tool)
+	if (!toolStats) {
+		toolStats = new ToolStats()
+		stats.set(tool, toolStats)
+	}
+	return toolStats
+}
+
+const round = (ms: number) => Math.round(ms * 100) / 100
+
+const percentile = (sorted: number[], p: number) => sorted[Math.max(0, Math.ceil((p / 100) * sorted.length) - 1)]
+
+const summarize = (values: number[]) => {
+	const sorted = [...values].sort((a, b) => a - b)
+	return {
+		p50: round(percentile(sorted, 50)),
+		p90: round(percentile(sorted, 90)),
+		p99: round(percentile(sorted, 99)),
+		max: round(sorted[sorted.length - 1]),
+	}
+}
+
+const mean = (values: number[]) => round(values.reduce((sum, value) => sum + value, 0) / values.length)
+
+// Helper module a command calls, or "python" for raw code
+export const toolOf = (command: string) => /_rrmcp\.run\("(\w+)"/.exec(command)?.[1] ?? "python"
+
+export const recordCall = (tool: string, ms: number, ok: boolean) => {
+	statsOf(tool).record(ms, ok)
+}
+
+export const recordProfile = (tool: string, profile: EditorProfile, roundTripMs: number) => {
+	pushBounded(statsOf(tool).profiles, { profile, roundTripMs })
+}
+
+export const reset = () => {
+	stats.clear()
+}
+
+const summarizeProfiles = (samples: ProfileSample[]) => {
+	const phases = new Map<string, number[]>()
+	const engineCalls = new Map<string, { calls: number; ms: number }>()
+	for (const { profile } of samples) {
+		for (const [name, ms] of Object.entries(profile.phases)) {
+			const values = phases.get(name) ?? []
+			values.push(ms)
+			phases.set(name, values)
+		}
+		for (const call of profile.top_engine_calls) {
+			const total = engineCalls.get(call.name) ?? { calls: 0, ms: 0 }
+			total.calls += call.calls
+			total.ms += call.ms
+			engineCalls.set(call.name, total)
+		}
+	}
+
+	return {
+		profiled_calls: samples.length,
+		editor_ms: summarize(samples.map(({ profile }) => profile.total_ms)),
+		transport_ms: summarize(samples.map(({ profile, roundTripMs }) => Math.max(0, roundTripMs - profile.total_ms))),
+		engine_ms_mean: mean(samples.map(({ profile }) => profile.engine_ms)),
+		python_ms_mean: mean(samples.map(({ profile }) => profile.python_ms)),
+		engine_calls_mean: mean(samples.map(({ profile }) => profile.engine_calls)),
+		phases_ms_mean: Object.fromEntries([...phases].map(([name, values]) => [name, mean(values)])),
+		top_engine_calls: [...engineCalls]
+			.sort((a, b) => b[1].ms - a[1].ms)
+			.slice(0, TOP_ENGINE_CALLS)
+			.map(([name, total]) => ({ name, calls: total.calls, ms: round(total.ms) })),
+	}
+}
+
+export const snapshot = () => {
+	const tools: Record<string, unknown> = {}
+	for (const [tool, toolStats] of [...stats].sort((a, b) => a[0].localeCompare(b[0]))) {
+		tools[tool] = {
+			calls: toolStats.calls,
+			errors: toolStats.errors,
+			round_trip_ms: summarize(toolStats.latencies),
+			...(toolStats.profiles.length ? summarizeProfiles(toolStats.profiles) : {}),
+		}
+	}
+	return { window: WINDOW, tools }
+}